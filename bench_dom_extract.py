@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import inspect
+import time
+from playwright.async_api import async_playwright
+from dom_extract import extract_all, extract_body, SARAMIN_LISTING_FIELDS
+
+# --- 설정 ---
+FIXTURE_PATH = "saramin_result.html"  # 실제 검색 결과 페이지 (공고 20개)
+LISTING_URL = "https://www.saramin.co.kr/zf_user/search?searchword=IT&recruitPage=1"
+DETAIL_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=1"
+DETAIL_HTML = ("<html><body><div class='wrap'><h3>담당업무</h3><ul>"
+               + "".join(f"<li>업무 {i}</li>" for i in range(200))
+               + "</ul><h3>자격요건</h3><p>Python</p></div></body></html>")
+REPEAT = 5
+
+
+# --- 왕복 횟수 측정 ---
+class RoundTripCounter:
+    """Playwright 객체를 감싸 브라우저와 왕복하는 await 호출 수를 셉니다 (locator 생성처럼 동기인 호출은 제외)."""
+
+    def __init__(self, target, stats):
+        self._target = target
+        self._stats = stats
+
+    def _wrap(self, value):
+        if type(value).__module__.startswith("playwright"):
+            return RoundTripCounter(value, self._stats)
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        return value
+
+    async def _count(self, awaitable):
+        self._stats["round_trips"] += 1
+        return self._wrap(await awaitable)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            return self._wrap(value)
+
+        def call(*args, **kwargs):
+            result = value(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._count(result)
+            return self._wrap(result)
+        return call
+
+
+# --- 기존 구현 (비교 기준, 수정하지 말 것) ---
+async def legacy_read_listing(page):
+    listings = []
+    job_listings = await page.locator(".item_recruit").all()
+    for job_listing in job_listings:
+        try:
+            link_element = job_listing.locator('.job_tit a')
+            link = await link_element.get_attribute('href')
+            full_link = "https://www.saramin.co.kr" + link if link and not link.startswith('http') else link
+            title = await job_listing.locator('.job_tit a').inner_text()
+            company = await job_listing.locator('.corp_name a').inner_text()
+            listings.append({'link': full_link, 'title': title.strip(), 'company': company.strip()})
+        except Exception:
+            pass
+    return listings
+
+
+async def legacy_read_body(page):
+    body_locator = page.locator('body')
+    html_content = await body_locator.inner_html()
+    inner_text = await body_locator.inner_text()
+    return html_content, inner_text
+
+
+async def new_read_listing(page):
+    return await extract_all(page, ".item_recruit", SARAMIN_LISTING_FIELDS)
+
+
+# --- 측정 ---
+async def measure(page, func):
+    stats = {"round_trips": 0}
+    counted = RoundTripCounter(page, stats)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = await func(counted)
+    elapsed = (time.perf_counter() - start) / REPEAT
+    return elapsed, stats["round_trips"] // REPEAT, result
+
+
+async def serve_fixtures(page, listing_html):
+    """네트워크 없이 고정 HTML만 응답하도록 페이지 요청을 가로챕니다."""
+    async def handle(route):
+        if route.request.url == LISTING_URL:
+            await route.fulfill(body=listing_html, content_type="text/html; charset=utf-8")
+        elif route.request.url == DETAIL_URL:
+            await route.fulfill(body=DETAIL_HTML, content_type="text/html; charset=utf-8")
+        else:
+            await route.abort()
+    await page.route("**/*", handle)
+
+
+def report(name, legacy, new):
+    (legacy_time, legacy_trips, _), (new_time, new_trips, _) = legacy, new
+    print(f"- {name}: 왕복 {legacy_trips}회 → {new_trips}회 (절감 {legacy_trips - new_trips}회), "
+          f"{legacy_time * 1000:,.1f}ms → {new_time * 1000:,.1f}ms ({legacy_time / new_time:,.1f}배)")
+
+
+async def main(executable_path=None):
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        listing_html = f.read()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, executable_path=executable_path)
+        page = await browser.new_page()
+        await serve_fixtures(page, listing_html)
+
+        await page.goto(LISTING_URL, wait_until="domcontentloaded")
+        legacy = await measure(page, legacy_read_listing)
+        new = await measure(page, new_read_listing)
+        report(f"검색 결과 ({len(new[2])}개 공고)", legacy, new)
+        if legacy[2] != new[2]:
+            print("[WARN] 기존 구현과 추출 결과가 다릅니다.")
+            for old_row, new_row in zip(legacy[2], new[2]):
+                if old_row != new_row:
+                    print(f"  기존 {old_row}\n  신규 {new_row}")
+                    break
+
+        await page.goto(DETAIL_URL, wait_until="domcontentloaded")
+        legacy = await measure(page, legacy_read_body)
+        new = await measure(page, extract_body)
+        report("상세 본문 (HTML + 텍스트)", legacy, new)
+        if legacy[2] != new[2]:
+            print("[WARN] 상세 본문 추출 결과가 다릅니다.")
+
+        await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="목록/상세 DOM 추출의 브라우저 왕복 횟수 비교")
+    parser.add_argument("--executable-path", default=None, help="Playwright 기본 Chromium 대신 사용할 브라우저 실행 파일")
+    args = parser.parse_args()
+    asyncio.run(main(args.executable_path))
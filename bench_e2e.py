@@ -0,0 +1,325 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from playwright.async_api import async_playwright
+import scraper_perpocessed
+import saramin_test
+import saramin_scraper
+import jobkorea_scraper
+import unified_crawler
+from site_adapters import SaraminAdapter, JobKoreaAdapter, NORMALIZED_COLUMNS
+from mock_server import MockServer, DEFAULT_LATENCY, DEFAULT_PAGES, DEFAULT_IMAGE_RATE, DEFAULT_INLINE_RATE
+from output_sinks import JSONLSink
+from crawl_frontier import CrawlFrontier
+from search_index import read_records
+from resource_blocker import ResourceBlocker
+from detail_pool import create_detail_semaphore
+from ocr_stage import OCRStage
+from image_postings import ImageOCRPipeline
+from rate_limiter import RateLimiter
+from metrics import metrics, Histogram
+
+try:
+    import resource  # 최대 메모리(RSS) 측정 (Windows에는 없음)
+except ImportError:
+    resource = None
+
+# --- 설정 ---
+SCENARIOS = ["saramin", "saramin_browser", "saramin_resume", "saramin_test", "saramin_ocr", "jobkorea", "unified"]
+KEYWORDS = ['IT', '자율주행']
+POSTINGS_PER_KEYWORD = 40
+RESULT_DIR = "bench_results"  # 시나리오별 수집 결과/측정값/추적 파일과 요약(bench_e2e.json) 저장 폴더
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+CRASH_AFTER = 0.4  # saramin_resume: 목표 공고의 이 비율만큼 기록한 뒤 프로세스를 강제 종료
+
+
+def fake_ocr(image_bytes):
+    """벤치마크용 OCR (Tesseract 없이 고정 문장을 돌려줌, 작업 프로세스로 넘길 수 있도록 모듈 최상위 함수)."""
+    return "담당업무\n- 이미지 공고 본문"
+
+
+# --- 시나리오 (실제 스크레이퍼 경로를 목 서버 주소로 실행) ---
+async def bench_saramin(base_urls, postings, keywords, workdir, http_fast_path=True):
+    """scraper_perpocessed.crawl() 전체 (목록/상세, 키워드 간 중복 제거, 속도 제한). 증분 저장소/캐시는 끔."""
+    scraper = scraper_perpocessed
+    scraper.SARAMIN_BASE_URL = base_urls["saramin"]
+    scraper.TARGET_JOB_COUNT = postings
+    scraper.USE_HTTP_FAST_PATH = http_fast_path
+    scraper.USE_INCREMENTAL_STORE = False
+    scraper.USE_RESPONSE_CACHE = False
+    name = "saramin" if http_fast_path else "saramin_browser"
+    sink = JSONLSink(os.path.join(workdir, f"{name}.jsonl"), scraper.OUTPUT_COLUMNS)
+    await scraper.crawl(keywords, sink)
+    return sink.count
+
+
+async def bench_saramin_browser(base_urls, postings, keywords, workdir):
+    """HTTP 고속 경로 없이 모든 페이지를 Playwright로 처리."""
+    return await bench_saramin(base_urls, postings, keywords, workdir, http_fast_path=False)
+
+
+class CrashingSink(JSONLSink):
+    """기록한 공고가 crash_after개가 되면 정리 없이 프로세스를 즉시 종료하는 싱크 (비정상 종료 재현용)."""
+
+    def __init__(self, path, columns, crash_after):
+        super().__init__(path, columns)
+        self.crash_after = crash_after
+
+    def write(self, record):
+        super().write(record)
+        if self.count >= self.crash_after:
+            os._exit(17)
+
+
+def crash_saramin(base_urls, postings, keywords, workdir, crash_after):
+    """작업 프로세스에서 수집을 시작했다가 crash_after개를 기록한 시점에 강제 종료됩니다."""
+    scraper = scraper_perpocessed
+    scraper.SARAMIN_BASE_URL = base_urls["saramin"]
+    scraper.TARGET_JOB_COUNT = postings
+    scraper.USE_INCREMENTAL_STORE = False
+    scraper.USE_RESPONSE_CACHE = False
+    frontier = CrawlFrontier(os.path.join(workdir, "saramin_resume_frontier.sqlite3"))
+    frontier.reset()
+    sink = CrashingSink(os.path.join(workdir, "saramin_resume.jsonl"), scraper.OUTPUT_COLUMNS, crash_after)
+    asyncio.run(scraper.crawl(keywords, sink, frontier=frontier))
+
+
+def check_resumed_output(output_path, frontier):
+    """이어서 수집한 결과 파일에서 (두 번 기록된 공고 키, 대기열에 있었지만 빠진 공고 키)를 정렬해 반환합니다."""
+    with open(output_path, encoding="utf-8") as f:
+        counts = Counter(CrawlFrontier.key(json.loads(line)["link"]) for line in f)
+    duplicates = sorted(key for key, count in counts.items() if count > 1)
+    missing = sorted(frontier.keys() - frontier.keys("failed") - set(counts))
+    return duplicates, missing
+
+
+async def bench_saramin_resume(base_urls, postings, keywords, workdir):
+    """
+    수집 도중 프로세스가 죽은 뒤 --resume과 같은 방식으로 이어서 수집합니다.
+    이어서 수집한 결과 파일에 공고가 빠지거나 두 번 기록되었으면 AssertionError를 냅니다.
+    """
+    crash_after = max(1, int(postings * len(keywords) * CRASH_AFTER))
+    process = multiprocessing.get_context("spawn").Process(
+        target=crash_saramin, args=(base_urls, postings, keywords, workdir, crash_after))
+    process.start()
+    await asyncio.to_thread(process.join)
+    output_path = os.path.join(workdir, "saramin_resume.jsonl")
+    with open(output_path, encoding="utf-8") as f:
+        before_resume = sum(1 for _ in f)
+    print(f"[INFO] 강제 종료 (종료 코드 {process.exitcode}), 종료 전 기록된 공고 {before_resume}개")
+
+    scraper = scraper_perpocessed
+    scraper.SARAMIN_BASE_URL = base_urls["saramin"]
+    scraper.TARGET_JOB_COUNT = postings
+    scraper.USE_INCREMENTAL_STORE = False
+    scraper.USE_RESPONSE_CACHE = False
+    frontier = CrawlFrontier(os.path.join(workdir, "saramin_resume_frontier.sqlite3"))
+    frontier.recover(read_records(output_path))
+    sink = JSONLSink(output_path, scraper.OUTPUT_COLUMNS, append=True)
+    try:
+        await scraper.crawl(keywords, sink, frontier=frontier)
+        duplicates, missing = check_resumed_output(output_path, frontier)
+    finally:
+        frontier.close()
+
+    print(f"[INFO] 이어서 수집: {sink.count}개 추가 (중복 {len(duplicates)}개, 누락 {len(missing)}개)")
+    assert not duplicates, f"두 번 기록된 공고: {duplicates}"
+    assert not missing, f"이어서 수집한 뒤에도 빠진 공고: {missing}"
+    return sink.count
+
+
+async def bench_saramin_test(base_urls, postings, keywords, workdir):
+    """saramin_test.scrape_saramin() (이미지 공고는 본문 이미지를 받아 OCR 단계로)."""
+    saramin_test.SARAMIN_BASE_URL = base_urls["saramin"]
+    saramin_test.TARGET_JOB_COUNT = postings
+    sink = JSONLSink(os.path.join(workdir, "saramin_test.jsonl"), saramin_test.OUTPUT_COLUMNS)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(user_agent=USER_AGENT)
+        blocker = ResourceBlocker(saramin_test.CRAWL_MODE)
+        await blocker.attach(context)
+        semaphore = create_detail_semaphore(saramin_test.MAX_CONCURRENT_DETAILS)
+        ocr_stage = OCRStage(workers=1, ocr_func=fake_ocr)
+        image_pipeline = ImageOCRPipeline(ocr_stage)
+        limiter = RateLimiter()
+        tasks = []
+        for keyword in keywords:
+            page = await context.new_page()
+            tasks.append(saramin_test.scrape_saramin(page, keyword, semaphore, sink, image_pipeline, limiter))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            sink.close()
+            await image_pipeline.aclose()
+            ocr_stage.shutdown()
+        await browser.close()
+        limiter.print_summary()
+    return sink.count
+
+
+async def bench_saramin_ocr(base_urls, postings, keywords, workdir):
+    """saramin_scraper.scrape_saramin() (상세 본문 스크린샷 OCR, 키워드별 공고 수는 스크레이퍼의 상한을 따름)."""
+    saramin_scraper.SARAMIN_BASE_URL = base_urls["saramin"]
+    saramin_scraper.SCREENSHOT_DIR = os.path.join(workdir, "saramin_ocr_screenshots")
+    os.makedirs(saramin_scraper.SCREENSHOT_DIR, exist_ok=True)
+    sink = JSONLSink(os.path.join(workdir, "saramin_ocr.jsonl"), saramin_scraper.OUTPUT_COLUMNS)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(user_agent=USER_AGENT)
+        blocker = ResourceBlocker(saramin_scraper.CRAWL_MODE)
+        await blocker.attach(context)
+        page = await context.new_page()
+        ocr_stage = OCRStage(workers=1, ocr_func=fake_ocr)
+        limiter = RateLimiter()
+        try:
+            for keyword in keywords:
+                await saramin_scraper.scrape_saramin(page, keyword, sink, ocr_stage, limiter)
+        finally:
+            sink.close()
+            ocr_stage.shutdown()
+        await browser.close()
+        limiter.print_summary()
+    return sink.count
+
+
+async def bench_jobkorea(base_urls, postings, keywords, workdir):
+    """jobkorea_scraper.scrape_jobkorea() (키워드별 공고 수는 스크레이퍼의 상한을 따름)."""
+    jobkorea_scraper.JOBKOREA_BASE_URL = base_urls["jobkorea"]
+    sink = JSONLSink(os.path.join(workdir, "jobkorea.jsonl"), jobkorea_scraper.OUTPUT_COLUMNS)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        blocker = ResourceBlocker(jobkorea_scraper.CRAWL_MODE)
+        await blocker.attach(page)
+        limiter = RateLimiter()
+        try:
+            for keyword in keywords:
+                await jobkorea_scraper.scrape_jobkorea(page, keyword, sink, limiter)
+        finally:
+            sink.close()
+        await browser.close()
+        limiter.print_summary()
+    return sink.count
+
+
+async def bench_unified(base_urls, postings, keywords, workdir):
+    """unified_crawler.crawl(): 사람인과 잡코리아를 하나의 스케줄러/브라우저로 동시에 수집."""
+    unified_crawler.TARGET_JOB_COUNT = postings
+    adapters = [SaraminAdapter(base_urls["saramin"]), JobKoreaAdapter(base_urls["jobkorea"])]
+    sink = JSONLSink(os.path.join(workdir, "unified.jsonl"), NORMALIZED_COLUMNS)
+    await unified_crawler.crawl(adapters, keywords, sink)
+    return sink.count
+
+
+SCENARIO_FUNCS = {
+    "saramin": bench_saramin,
+    "saramin_browser": bench_saramin_browser,
+    "saramin_resume": bench_saramin_resume,
+    "saramin_test": bench_saramin_test,
+    "saramin_ocr": bench_saramin_ocr,
+    "jobkorea": bench_jobkorea,
+    "unified": bench_unified,
+}
+
+
+# --- 측정 ---
+def peak_rss_mb(who):
+    """getrusage의 최대 RSS(MB). 자식 프로세스 값은 종료된 자식 중 가장 큰 것(브라우저)입니다."""
+    if resource is None:
+        return None
+    kilobytes = resource.getrusage(who).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return kilobytes / (1024 * 1024) if sys.platform == "darwin" else kilobytes / 1024
+
+
+def run_scenario(name, base_urls, postings, keywords, workdir):
+    """작업 프로세스에서 시나리오 하나를 실행하고 처리량/지연 시간/최대 메모리를 돌려줍니다."""
+    trace_path = os.path.join(workdir, f"{name}_trace.jsonl")
+    if os.path.exists(trace_path):
+        os.remove(trace_path)
+    metrics.enable_trace(trace_path)
+    start = time.perf_counter()
+    written = asyncio.run(SCENARIO_FUNCS[name](base_urls, postings, keywords, workdir))
+    elapsed = time.perf_counter() - start
+    metrics.count("postings.written", written)
+    metrics.export(os.path.join(workdir, f"{name}_metrics"))
+
+    # 공고별 처리 시간 (추적 파일의 total: 상세 페이지 이동부터 레코드 완성까지)
+    latencies = Histogram()
+    failed = 0
+    with open(trace_path, encoding="utf-8") as f:
+        for line in f:
+            trace = json.loads(line)
+            latencies.observe(trace["total"])
+            failed += trace.get("status") != "ok"
+    return {
+        "scenario": name,
+        "postings": written,
+        "failed": failed,
+        "elapsed": elapsed,
+        "postings_per_sec": written / elapsed if elapsed else 0.0,
+        "p50": latencies.percentile(0.5),
+        "p99": latencies.percentile(0.99),
+        "python_rss_mb": peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        "browser_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+    }
+
+
+def print_results(results):
+    def mb(value):
+        return f"{value:,.0f}MB" if value is not None else "N/A"
+
+    print("\n=== 종단 간 벤치마크 결과 ===")
+    for r in results:
+        print(f"- {r['scenario']}: {r['postings']}개 공고 (실패 {r['failed']}), {r['elapsed']:.1f}s, "
+              f"{r['postings_per_sec']:.2f} postings/sec, 공고별 p50 {r['p50']:.2f}s / p99 {r['p99']:.2f}s, "
+              f"최대 RSS Python {mb(r['python_rss_mb'])} / 브라우저 {mb(r['browser_rss_mb'])}")
+
+
+def main(args):
+    os.makedirs(RESULT_DIR, exist_ok=True)
+    server_options = dict(latency=args.latency, failure_rate=args.failure_rate, timeout_rate=args.timeout_rate,
+                          pages=args.pages, image_rate=args.image_rate, inline_rate=args.inline_rate, seed=args.seed)
+    results = []
+    # 사람인/잡코리아는 서로 다른 포트(=다른 호스트)로 띄워 속도 제한이 따로 적용되게 함
+    with MockServer(**server_options) as saramin_server, MockServer(**server_options) as jobkorea_server:
+        base_urls = {"saramin": saramin_server.base_url, "jobkorea": jobkorea_server.base_url}
+        for name in args.scenarios:
+            print(f"\n[INFO] 시나리오 '{name}' 시작 ({base_urls})")
+            # 시나리오마다 새 프로세스에서 실행해 측정값과 최대 메모리가 섞이지 않게 함
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                try:
+                    results.append(executor.submit(run_scenario, name, base_urls, args.postings, args.keywords,
+                                                   RESULT_DIR).result())
+                except Exception as e:
+                    print(f"[ERROR] 시나리오 '{name}' 실패: {e}")
+        saramin_server.print_summary()
+        jobkorea_server.print_summary()
+
+    print_results(results)
+    summary_path = os.path.join(RESULT_DIR, "bench_e2e.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump({"server": server_options, "keywords": args.keywords, "results": results}, f,
+                  ensure_ascii=False, indent=2)
+    print(f"[INFO] 결과를 '{summary_path}'에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 목 서버를 상대로 실제 스크레이퍼 경로를 실행하는 종단 간 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--keywords", nargs="+", default=KEYWORDS)
+    parser.add_argument("--postings", type=int, default=POSTINGS_PER_KEYWORD, help="키워드별 목표 공고 수 (사람인)")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="목 서버 평균 응답 지연(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="429/503 응답 비율")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="응답 지연(타임아웃) 주입 비율")
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="키워드별 검색 결과 페이지 수")
+    parser.add_argument("--image-rate", type=float, default=DEFAULT_IMAGE_RATE, help="이미지 공고 비율")
+    parser.add_argument("--inline-rate", type=float, default=DEFAULT_INLINE_RATE, help="iframe 없는 상세 페이지 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
@@ -0,0 +1,91 @@
+import re
+import time
+from bs4 import BeautifulSoup
+from section_extractor import extract_sections
+
+# --- 설정 ---
+SIZES = [50, 200, 800]  # 합성 공고의 반복 블록 수 (DOM 크기)
+FIXTURE_PATH = "saramin_result.html"  # 실제 대형 DOM (섹션 없음 → 폴백 경로)
+
+
+# --- 기존 구현 (비교 기준, 수정하지 말 것) ---
+def legacy_parse_responsibilities_robust(html_content, fallback_text):
+    soup = BeautifulSoup(html_content, 'lxml')
+    start_keywords = re.compile(r'담당\s*업무|주요\s*업무|업무\s*내용')
+    end_keywords = re.compile(r'자격\s*요건|지원\s*자격|필수\s*역량|우대\s*사항')
+
+    start_tag = soup.find(lambda tag: tag.get_text(strip=True) and start_keywords.search(tag.get_text()))
+    if start_tag:
+        content_parts = []
+        for sibling in start_tag.find_next_siblings():
+            if sibling.get_text(strip=True) and end_keywords.search(sibling.get_text()):
+                break
+            if sibling.get_text(strip=True):
+                content_parts.append(sibling.get_text(separator='\n', strip=True))
+        if content_parts:
+            return '\n'.join(content_parts)
+
+    all_text = soup.get_text()
+    start_match = start_keywords.search(all_text)
+    if start_match:
+        text_after_start = all_text[start_match.end():]
+        end_match = end_keywords.search(text_after_start)
+        if end_match:
+            text_after_start = text_after_start[:end_match.start()]
+        if text_after_start.strip():
+            return text_after_start
+
+    return fallback_text
+
+
+# --- 합성 공고 ---
+def build_posting(blocks, kind):
+    """표/이미지가 많은 공고 본문을 흉내 낸 HTML을 만듭니다."""
+    filler = []
+    for i in range(blocks):
+        if kind == "table":
+            filler.append(f"<table><tr><td>항목 {i}</td><td><span>세부 <b>내용</b> {i}</span></td></tr></table>")
+        else:
+            filler.append(f"<div class='img_wrap'><p><img src='view_img_{i}.png'><span>이미지 설명 {i}</span></p></div>")
+    body = "".join(filler)
+    return (f"<div class='wrap'><div class='intro'>{body}</div>"
+            f"<div><h3>담당업무</h3></div><div><ul><li>서비스 백엔드 개발</li><li>데이터 파이프라인 운영</li></ul></div>"
+            f"<div><h3>자격요건</h3></div><div><ul><li>Python 3년 이상</li></ul></div>"
+            f"<div><h3>우대사항</h3></div><div><p>AWS 경험</p></div>"
+            f"<div><h3>복리후생</h3></div><div><p>4대보험</p></div>{body}</div>")
+
+
+def build_inline_posting():
+    """섹션 제목 줄 없이 한 문단 안에 담당업무/자격요건이 이어지는 공고 (본문 중간 키워드 폴백 경로)."""
+    return ("<div class='wrap'><p><span>[채용 포지션] 주요업무</span> <span>- 인지 알고리즘 개발</span> "
+            "<span>- 센서 퓨전 모듈 개발</span> <span>자격요건</span> <span>- C++ 3년 이상</span></p></div>")
+
+
+def measure(func, *args, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    cases = [(f"{kind} x{size}", build_posting(size, kind)) for kind in ("table", "image") for size in SIZES]
+    cases.append(("inline", build_inline_posting()))
+    try:
+        with open(FIXTURE_PATH, encoding="utf-8") as f:
+            cases.append((FIXTURE_PATH, f.read()))
+    except OSError:
+        print(f"[WARN] '{FIXTURE_PATH}'를 찾을 수 없어 건너뜁니다.")
+
+    for name, html in cases:
+        legacy_time, legacy_result = measure(legacy_parse_responsibilities_robust, html, "", repeat=1)
+        new_time, sections = measure(extract_sections, html)
+        # 기존 구현은 폴백 시 줄 구분 없이 텍스트를 이어 붙이므로 공백을 제외하고 비교
+        same = ''.join(legacy_result.split()) == ''.join(sections["responsibilities"].split())
+        found = [field for field, value in sections.items() if value]
+        print(f"- {name:>22} ({len(html) / 1024:,.0f}KB): 기존 {legacy_time * 1000:,.1f}ms → 신규 {new_time * 1000:,.1f}ms "
+              f"({legacy_time / new_time:,.1f}배), 담당업무 일치 {'O' if same else 'X'}, 추출 섹션 {found}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import csv
+import re
+import sys
+import time
+import emoji
+import pandas as pd
+from text_normalizer import normalize_text
+
+# --- 설정 ---
+INPUT_PATH = "saramin_final.csv"
+TARGET_COLUMN = "responsibilities"
+REPEAT = 20  # 측정 안정화를 위한 반복 횟수
+
+
+# --- 기존 구현 (비교 기준, 수정하지 말 것) ---
+def legacy_clean_text_basic(text):
+    """preprocessed.py / scraper_perpocessed.py의 기존 clean_text"""
+    text = emoji.replace_emoji(text, replace='')
+    text = re.sub(r'\s*[•\-\·]\s*', r'\n- ', text)
+    text = re.sub(r'\s{2,}', ' ', text)
+    text = re.sub(r'[|※]', ' ', text)
+    text = re.sub(r'\.{2,}', '…', text)
+    text = re.sub(r',,', ',', text)
+    text = re.sub(r'\?{2,}', '?', text)
+    keywords = ["자격요건", "주요업무", "우대사항", "복리후생", "근무조건", "모집부문", "전형절차"]
+    for kw in keywords:
+        text = re.sub(rf'\s*{kw}', f'\n\n=== {kw} ===', text)
+    text = re.sub(r'([가-힣])([A-Za-z])', r'\1 \2', text)
+    text = re.sub(r'([A-Za-z])([가-힣])', r'\1 \2', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def legacy_clean_text_readable(text):
+    """saramin_test.py의 기존 clean_text"""
+    text = emoji.replace_emoji(text, replace='')
+    text = re.sub(r'[•◎\-\·⁃=|※ㆍ●>[\]]', ' ', text)
+    text = re.sub(r'([가-힣])([A-Za-z0-9])', r'\1 \2', text)
+    text = re.sub(r'([A-Za-z0-9])([가-힣])', r'\1 \2', text)
+    text = re.sub(r'\s*\n\s*', '\n', text)
+    text = re.sub(r'[ \t]{2,}', ' ', text)
+    keywords = ["자격요건", "주요업무", "우대사항", "복리후생", "기술스택", "개발환경", "근무조건", "모집부문", "전형절차"]
+    for kw in keywords:
+        text = re.sub(rf'(\s*{kw}\s*)', f'\n\n{kw} ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+CASES = [
+    ("preprocessed/scraper", legacy_clean_text_basic, "scraper"),
+    ("readable", legacy_clean_text_readable, "readable"),
+]
+
+
+def load_rows(path):
+    """CSV의 텍스트와, 이모지/기호를 섞은 원문 형태의 변형을 함께 돌려줍니다."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        rows = [row[TARGET_COLUMN] for row in csv.DictReader(f) if row.get(TARGET_COLUMN)]
+    return {
+        "CSV 원문": rows,
+        "이모지 포함": [f"✅ {row} 🚀 ㆍ[필수] {row[:50]}..,,??" for row in rows],
+    }
+
+
+def measure(func, rows):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for row in rows:
+            func(row)
+    return time.perf_counter() - start
+
+
+def main():
+    datasets = load_rows(INPUT_PATH)
+    print(f"[INFO] '{INPUT_PATH}'의 텍스트로 {REPEAT}회 반복 측정합니다.")
+    all_identical = True
+    for dataset_name, rows in datasets.items():
+        for name, legacy, profile in CASES:
+            mismatches = sum(1 for row in rows if legacy(row).encode('utf-8') != normalize_text(row, profile).encode('utf-8'))
+            legacy_time = measure(legacy, rows)
+            new_time = measure(lambda row: normalize_text(row, profile), rows)
+            all_identical = all_identical and mismatches == 0
+            print(f"- [{dataset_name} {len(rows)}건] {name}: 기존 {legacy_time:.3f}s → 신규 {new_time:.3f}s "
+                  f"({legacy_time / new_time:.1f}배), 결과 불일치 {mismatches}건")
+    # 결측값 처리도 기존과 동일한지 확인
+    assert pd.isna(normalize_text(float('nan'), "preprocessed"))
+    assert normalize_text(float('nan'), "scraper") == "" and normalize_text("", "readable") == ""
+    if not all_identical:
+        print("[ERROR] 기존 구현과 결과가 다른 텍스트가 있습니다.")
+        sys.exit(1)
+    print("[INFO] 모든 텍스트에서 기존 구현과 바이트 단위로 동일합니다.")
+
+
+if __name__ == "__main__":
+    main()
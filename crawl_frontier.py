@@ -0,0 +1,184 @@
+import json
+import sqlite3
+import time
+from posting_store import extract_rec_idx, SQLITE_TIMEOUT
+
+# --- 설정 ---
+FRONTIER_PATH = "crawl_frontier.sqlite3"
+CHECKPOINT_EVERY = 20     # 완료한 상세 공고가 이만큼 쌓이면 체크포인트
+CHECKPOINT_SECONDS = 10.0 # 마지막 체크포인트 후 이 시간이 지나도 체크포인트
+
+
+class CrawlFrontier:
+    """
+    수집 진행 상태(키워드별 목록 페이지 커서, 상세 수집 대기열과 완료 여부)를 SQLite에 기록해
+    프로세스가 중간에 죽어도 --resume으로 멈춘 곳부터 이어서 수집할 수 있게 합니다.
+    - 목록 페이지는 한 페이지를 읽을 때마다 그 페이지의 공고와 다음 페이지 번호를 함께 커밋합니다.
+    - 상세 공고의 완료 표시는 모아 두었다가 체크포인트마다 flush()(출력 파일 기록) 후 커밋하므로,
+      완료로 기록된 공고는 항상 출력 파일에 이미 들어 있습니다.
+    - 마지막 체크포인트 이후 출력 파일에 기록된 공고는 이어서 수집하기 전에 recover()로 완료 표시합니다.
+    """
+
+    def __init__(self, path=FRONTIER_PATH, checkpoint_every=CHECKPOINT_EVERY, checkpoint_seconds=CHECKPOINT_SECONDS):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_seconds = checkpoint_seconds
+        self.flush = None  # 체크포인트 직전에 호출 (예: sink.flush, 출력 파일을 먼저 기록)
+        self.conn = sqlite3.connect(path, timeout=SQLITE_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS keywords (
+                keyword TEXT PRIMARY KEY,
+                next_page INTEGER NOT NULL,
+                listing_done INTEGER NOT NULL DEFAULT 0,
+                updated REAL NOT NULL
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS listings (
+                keyword TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                base_info TEXT NOT NULL,
+                PRIMARY KEY (keyword, position)
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS details (
+                key TEXT PRIMARY KEY,
+                link TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                status TEXT NOT NULL,
+                updated REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self._pending = {}  # 공고 키 → 체크포인트 때 기록할 상태 ('done' / 'failed')
+        self._last_checkpoint = time.monotonic()
+        self.checkpoints = 0
+        self.pages_resumed = 0
+        self.details_skipped = 0
+
+    @staticmethod
+    def key(link):
+        return extract_rec_idx(link) or link
+
+    def reset(self):
+        """이전 실행의 진행 상태를 모두 지웁니다 (새로 수집할 때)."""
+        with self.conn:
+            for table in ("keywords", "listings", "details"):
+                self.conn.execute(f"DELETE FROM {table}")
+        self._pending.clear()
+
+    # --- 목록 페이지 커서 ---
+    def cursor(self, keyword):
+        """(다음에 읽을 페이지 번호, 이미 모은 공고 기본 정보 목록, 목록 수집 완료 여부). 처음이면 (1, [], False)."""
+        row = self.conn.execute("SELECT next_page, listing_done FROM keywords WHERE keyword = ?", (keyword,)).fetchone()
+        if row is None:
+            return 1, [], False
+        listings = [json.loads(base_info) for (base_info,) in self.conn.execute(
+            "SELECT base_info FROM listings WHERE keyword = ? ORDER BY position", (keyword,))]
+        self.pages_resumed += row[0] - 1
+        return row[0], listings, bool(row[1])
+
+    def save_page(self, keyword, page_number, listings):
+        """읽은 목록 페이지의 공고를 추가하고 커서를 다음 페이지로 옮깁니다."""
+        with self.conn:
+            start = self.conn.execute("SELECT COUNT(*) FROM listings WHERE keyword = ?", (keyword,)).fetchone()[0]
+            self.conn.executemany("INSERT OR REPLACE INTO listings (keyword, position, base_info) VALUES (?, ?, ?)",
+                                  [(keyword, start + offset, json.dumps(listing, ensure_ascii=False))
+                                   for offset, listing in enumerate(listings)])
+            self.conn.execute("""
+                INSERT INTO keywords (keyword, next_page, updated) VALUES (?, ?, ?)
+                ON CONFLICT(keyword) DO UPDATE SET next_page = excluded.next_page, updated = excluded.updated
+            """, (keyword, page_number + 1, time.time()))
+
+    def finish_listing(self, keyword):
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO keywords (keyword, next_page, listing_done, updated) VALUES (?, 1, 1, ?)
+                ON CONFLICT(keyword) DO UPDATE SET listing_done = 1, updated = excluded.updated
+            """, (keyword, time.time()))
+
+    # --- 상세 수집 대기열 ---
+    def enqueue(self, keyword, base_info_list):
+        """상세 수집할 공고를 대기열에 넣습니다 (이미 있는 공고의 상태는 그대로 둠)."""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO details (key, link, keyword, status, updated) VALUES (?, ?, ?, 'queued', ?)",
+                [(self.key(base_info['link']), base_info['link'], keyword, now) for base_info in base_info_list])
+
+    def is_done(self, link):
+        """이전 실행(또는 이번 실행)에서 이미 출력 파일에 기록된 공고인지 확인합니다."""
+        key = self.key(link)
+        if self._pending.get(key) == "done":
+            return True
+        row = self.conn.execute("SELECT status FROM details WHERE key = ?", (key,)).fetchone()
+        done = row is not None and row[0] == "done"
+        self.details_skipped += done
+        return done
+
+    def recover(self, records):
+        """출력 파일에 이미 있는 공고를 완료로 표시합니다 (마지막 체크포인트 이후에 기록된 공고). 표시한 개수를 반환."""
+        now = time.time()
+        with self.conn:
+            recovered = self.conn.executemany(
+                "UPDATE details SET status = 'done', updated = ? WHERE key = ? AND status != 'done'",
+                [(now, self.key(record['link'])) for record in records if record.get('link')]).rowcount
+        if recovered:
+            print(f"[INFO] 마지막 체크포인트 이후 출력 파일에 기록된 공고 {recovered}건을 완료로 표시했습니다.")
+        return recovered
+
+    def keys(self, status=None):
+        """상세 대기열에 있는 공고 키 집합 (status를 주면 그 상태의 공고만, 커밋된 상태 기준)."""
+        if status is None:
+            return {key for (key,) in self.conn.execute("SELECT key FROM details")}
+        return {key for (key,) in self.conn.execute("SELECT key FROM details WHERE status = ?", (status,))}
+
+    def mark_done(self, link):
+        self._mark(link, "done")
+
+    def mark_failed(self, link):
+        self._mark(link, "failed")
+
+    def _mark(self, link, status):
+        self._pending[self.key(link)] = status
+        if (len(self._pending) >= self.checkpoint_every
+                or time.monotonic() - self._last_checkpoint >= self.checkpoint_seconds):
+            self.checkpoint()
+
+    def checkpoint(self):
+        """출력 파일을 먼저 기록한 뒤, 모아 둔 상세 완료/실패 표시를 커밋합니다."""
+        if self.flush is not None:
+            self.flush()
+        if self._pending:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany("UPDATE details SET status = ?, updated = ? WHERE key = ?",
+                                      [(status, now, key) for key, status in self._pending.items()])
+            self._pending.clear()
+        self._last_checkpoint = time.monotonic()
+        self.checkpoints += 1
+
+    def close(self):
+        """남은 완료 표시를 기록하고 닫습니다. flush는 호출하지 않으므로 출력 싱크를 먼저 닫아야 합니다."""
+        self.flush = None
+        self.checkpoint()
+        self.conn.close()
+
+    def summary(self):
+        counts = dict(self.conn.execute("SELECT status, COUNT(*) FROM details GROUP BY status").fetchall())
+        return {
+            "queued": counts.get("queued", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "pages_resumed": self.pages_resumed,
+            "details_skipped": self.details_skipped,
+            "checkpoints": self.checkpoints,
+        }
+
+    def print_summary(self):
+        s = self.summary()
+        print(f"[INFO] 수집 진행 상태: 완료 {s['done']}건, 실패 {s['failed']}건, 대기 {s['queued']}건 "
+              f"(이어서 수집: 목록 {s['pages_resumed']}페이지 · 상세 {s['details_skipped']}건 건너뜀, "
+              f"체크포인트 {s['checkpoints']}회)")
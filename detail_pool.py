@@ -0,0 +1,95 @@
+import asyncio
+from metrics import metrics
+
+# --- 설정 ---
+DETAIL_PAGES_PER_CONTEXT = 4   # 브라우저 컨텍스트당 상세 페이지 탭 수
+MAX_CONCURRENT_DETAILS = 8     # 전체 키워드를 합친 동시 상세 페이지 처리 한도
+
+
+def create_detail_semaphore(limit=MAX_CONCURRENT_DETAILS):
+    """모든 키워드 작업이 공유하는 전역 동시성 제한 세마포어를 만듭니다."""
+    return asyncio.Semaphore(limit)
+
+
+async def run_detail_pool(context, items, handler, num_pages=DETAIL_PAGES_PER_CONTEXT, semaphore=None, on_result=None,
+                          lifecycle=None):
+    """
+    공유 큐에 담긴 items를 N개의 페이지(탭)가 나누어 처리합니다.
+    - handler(page, index, item)의 반환값을 입력 순서 그대로 리스트로 돌려줍니다.
+    - 처리 중 예외가 발생한 항목은 None으로 채웁니다.
+    - semaphore가 주어지면 다른 키워드 작업과 동시 처리 한도를 공유합니다.
+    - on_result가 주어지면 결과를 모아 두지 않고, 입력 순서대로 준비되는 즉시 on_result(result)로
+      넘긴 뒤 None이 아닌 결과의 개수를 반환합니다.
+    - lifecycle(BrowserLifecycle)이 주어지면 탭을 context 대신 lifecycle에서 열고, 항목마다 교체 여부를 확인합니다.
+      탭이 죽어서(crash) 실패한 항목은 새 탭에서 한 번 더 처리합니다.
+    """
+    if not items:
+        return 0 if on_result else []
+
+    queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        queue.put_nowait((index, item))
+
+    results = [None] * len(items)
+    done = [False] * len(items)
+    retried = set()
+    next_index = 0
+    emitted = 0
+
+    def release_ready():
+        # 앞선 항목이 모두 끝난 구간만 순서대로 내보내고 메모리에서 비움
+        nonlocal next_index, emitted
+        while next_index < len(items) and done[next_index]:
+            result = results[next_index]
+            results[next_index] = None
+            if result is not None:
+                on_result(result)
+                emitted += 1
+            next_index += 1
+
+    async def handle(page, index, item):
+        try:
+            if semaphore is None:
+                return await handler(page, index, item)
+            # 전역 한도 대기 시간 (동시성 설정 조정용)
+            with metrics.timer("pool.semaphore_wait"):
+                await semaphore.acquire()
+            try:
+                return await handler(page, index, item)
+            finally:
+                semaphore.release()
+        except Exception as e:
+            print(f"[ERROR] {index + 1}번째 항목 처리 중 오류 발생: {e}")
+            return None
+
+    async def worker():
+        page = await lifecycle.new_page() if lifecycle is not None else await context.new_page()
+        try:
+            while True:
+                try:
+                    index, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                result = await handle(page, index, item)
+                if lifecycle is not None:
+                    crashed = result is None and lifecycle.crashed(page)
+                    page = await lifecycle.after_item(page)
+                    if crashed and index not in retried:
+                        # 탭이 죽어 실패한 항목은 버리지 않고 대기열에 다시 넣음 (이 탭이 바로 이어서 처리)
+                        retried.add(index)
+                        metrics.count("pool.crash_retry")
+                        queue.put_nowait((index, item))
+                        continue
+                results[index] = result
+                done[index] = True
+                if on_result is not None:
+                    release_ready()
+        finally:
+            if not page.is_closed():
+                await page.close()
+
+    worker_count = max(1, min(num_pages, len(items)))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
+    if on_result is not None:
+        return emitted
+    return results
@@ -0,0 +1,63 @@
+# --- 필드 명세 ---
+# 필드 이름 → (항목 안의 CSS 선택자, 읽을 값)
+# - 읽을 값: "text"(innerText, 앞뒤 공백 제거), "html"(innerHTML), 그 밖에는 DOM 속성 이름
+#   (href/src는 DOM 속성으로 읽으므로 항상 절대 주소), 속성이 없으면 HTML 속성(getAttribute)
+# - 선택자가 None이면 항목 요소 자신에서 읽습니다.
+SARAMIN_LISTING_FIELDS = {
+    "link": (".job_tit a", "href"),
+    "title": (".job_tit a", "text"),
+    "company": (".corp_name a", "text"),
+}
+JOBKOREA_LISTING_FIELDS = {
+    "link": (".title", "href"),
+}
+JOBKOREA_DETAIL_FIELDS = {
+    "title": ("h1.title", "text"),
+    "description": (".detail-body", "text"),
+}
+
+# 브라우저 안에서 실행: 항목마다 명세의 모든 필드를 읽어 객체 배열로 반환 (찾지 못한 필드는 null)
+_EXTRACT_ALL_JS = """
+(root, [itemSelector, fields]) => {
+    const read = (el, what) => {
+        if (what === 'text') return el.innerText.trim();
+        if (what === 'html') return el.innerHTML;
+        if (what in el && typeof el[what] === 'string') return el[what];
+        return el.getAttribute(what);
+    };
+    const items = itemSelector ? Array.from(root.querySelectorAll(itemSelector)) : [root];
+    return items.map(item => {
+        const row = {};
+        for (const [name, [selector, what]] of Object.entries(fields)) {
+            const el = selector ? item.querySelector(selector) : item;
+            row[name] = el ? read(el, what) : null;
+        }
+        return row;
+    });
+}
+"""
+
+_BODY_JS = "body => [body.innerHTML, body.innerText]"
+
+
+async def extract_all(context, item_selector, fields, required=None):
+    """
+    페이지/프레임에서 item_selector에 맞는 모든 항목의 필드를 evaluate 한 번으로 읽어 dict 목록으로 반환합니다.
+    - context: Page, Frame 또는 FrameLocator (locator()를 제공하는 객체)
+    - required에 있는 필드(기본: 모든 필드)가 비어 있는 항목은 제외합니다.
+    """
+    required = list(fields) if required is None else required
+    rows = await context.locator(":root").evaluate(_EXTRACT_ALL_JS, [item_selector, fields])
+    return [row for row in rows if all(row.get(name) for name in required)]
+
+
+async def extract_fields(context, fields):
+    """문서 전체에서 명세의 필드를 evaluate 한 번으로 읽어 dict 하나로 반환합니다 (없는 필드는 None)."""
+    rows = await context.locator(":root").evaluate(_EXTRACT_ALL_JS, [None, fields])
+    return rows[0]
+
+
+async def extract_body(context):
+    """본문(body)의 (HTML, 텍스트)를 evaluate 한 번으로 읽습니다."""
+    html, text = await context.locator("body").evaluate(_BODY_JS)
+    return html, text
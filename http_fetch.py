@@ -0,0 +1,164 @@
+import asyncio
+from urllib.parse import urljoin
+import httpx
+from bs4 import BeautifulSoup
+from rate_limiter import ThrottledError, ServerError, THROTTLE_STATUSES, retry_after_seconds
+
+# --- 설정 ---
+SARAMIN_BASE_URL = "https://www.saramin.co.kr"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+MAX_CONNECTIONS = 20          # 커넥션 풀 최대 연결 수
+MAX_KEEPALIVE_CONNECTIONS = 10
+REQUEST_TIMEOUT = 15.0
+MIN_DETAIL_TEXT_LENGTH = 100  # 이보다 짧으면 JS 렌더링이 필요한 페이지로 간주
+
+# iframe이 없는 상세 페이지에서 본문으로 사용할 선택자 (우선순위 순)
+DETAIL_BODY_SELECTORS = ['div.job_definition', '.user_content', '.jv_detail', '.job_description', '.content', '.rec_cont']
+
+
+# --- HTML 파서 (오프라인 테스트 가능) ---
+def parse_listing_html(html, base_url=SARAMIN_BASE_URL):
+    """검색 결과 HTML에서 공고 기본 정보(링크/제목/회사) 목록을 추출합니다."""
+    soup = BeautifulSoup(html, 'lxml')
+    items = []
+    for job_listing in soup.select('.item_recruit'):
+        link_element = job_listing.select_one('.job_tit a')
+        company_element = job_listing.select_one('.corp_name a')
+        if link_element is None or company_element is None:
+            continue
+        link = link_element.get('href')
+        if not link:
+            continue
+        full_link = urljoin(base_url, link) if not link.startswith('http') else link
+        items.append({
+            'link': full_link,
+            'title': link_element.get_text(strip=True),
+            'company': company_element.get_text(strip=True),
+        })
+    return items
+
+
+def find_detail_iframe_src(html, base_url=SARAMIN_BASE_URL):
+    """상세 페이지 HTML에서 본문 iframe(iframe_content_*)의 절대 주소를 찾습니다."""
+    soup = BeautifulSoup(html, 'lxml')
+    iframe = soup.select_one("iframe[id^='iframe_content']")
+    if iframe is None or not iframe.get('src'):
+        return None
+    return urljoin(base_url, iframe['src'])
+
+
+def parse_detail_body(html):
+    """상세 본문 HTML에서 (본문 HTML, 본문 텍스트)를 추출합니다. 내용이 부족하면 None."""
+    soup = BeautifulSoup(html, 'lxml')
+    body = None
+    for selector in DETAIL_BODY_SELECTORS:
+        body = soup.select_one(selector)
+        if body is not None:
+            break
+    if body is None:
+        body = soup.body
+    if body is None:
+        return None
+    for tag in body.find_all(['script', 'style', 'noscript']):
+        tag.decompose()
+    text = body.get_text(separator='\n', strip=True)
+    if len(text) < MIN_DETAIL_TEXT_LENGTH:
+        return None
+    return body.decode_contents(), text
+
+
+# --- HTTP 고속 경로 ---
+class FastFetcher:
+    """
+    keep-alive 커넥션 풀을 사용하는 비동기 HTTP 클라이언트로 목록/상세 페이지를 직접 파싱합니다.
+    - 파싱에 실패하거나 JS가 필요한 페이지면 None을 반환하고, 호출 측이 Playwright 경로로 처리합니다.
+    - 경로별(HTTP/Playwright) 처리 건수를 집계합니다.
+    - cache(ResponseCache)가 주어지면 성공한 응답을 캐시에 저장합니다.
+    - limiter(RateLimiter)가 주어지면 호스트별 속도 제한 안에서 요청하고, 429/503/타임아웃은 재시도합니다.
+    """
+
+    def __init__(self, max_connections=MAX_CONNECTIONS, timeout=REQUEST_TIMEOUT, transport=None, cache=None,
+                 limiter=None):
+        self.cache = cache
+        self.limiter = limiter
+        self.client = httpx.AsyncClient(
+            headers={'User-Agent': USER_AGENT, 'Accept-Language': 'ko-KR,ko;q=0.9'},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+            timeout=timeout,
+            follow_redirects=True,
+            transport=transport,
+        )
+        self.stats = {"listing_http": 0, "listing_playwright": 0, "detail_http": 0, "detail_playwright": 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def _request(self, url):
+        response = await self.client.get(url)
+        if response.status_code in THROTTLE_STATUSES:
+            raise ThrottledError(response.status_code, retry_after_seconds(response.headers.get('retry-after')))
+        if response.status_code >= 500:
+            raise ServerError(response.status_code)
+        if response.status_code != 200:
+            return None
+        return response.text
+
+    async def _get_text(self, url):
+        try:
+            if self.limiter is not None:
+                return await self.limiter.call(url, lambda: self._request(url))
+            return await self._request(url)
+        except (httpx.HTTPError, asyncio.TimeoutError, ThrottledError, ServerError):
+            return None
+
+    async def fetch_listing(self, url):
+        """검색 결과 페이지를 HTTP로 가져와 파싱합니다. 실패 시 None (Playwright로 넘김)."""
+        html = await self._get_text(url)
+        items = parse_listing_html(html, url) if html else []
+        if not items:
+            self.stats["listing_playwright"] += 1
+            return None
+        self.stats["listing_http"] += 1
+        if self.cache is not None:
+            self.cache.put(url, "listing", {"html": html})
+        return items
+
+    async def fetch_detail(self, url):
+        """상세 페이지(본문 iframe 포함)를 HTTP로 가져와 (HTML, 텍스트)를 반환합니다. 실패 시 None."""
+        result = None
+        html = await self._get_text(url)
+        if html:
+            iframe_src = find_detail_iframe_src(html, url)
+            if iframe_src:
+                iframe_html = await self._get_text(iframe_src)
+                result = parse_detail_body(iframe_html) if iframe_html else None
+            else:
+                result = parse_detail_body(html)
+        if result is None:
+            self.stats["detail_playwright"] += 1
+            return None
+        self.stats["detail_http"] += 1
+        if self.cache is not None:
+            self.cache.put(url, "detail", {"html": result[0], "text": result[1]})
+        return result
+
+    def hit_rates(self):
+        """목록/상세 각각의 HTTP 경로 적중률을 반환합니다."""
+        rates = {}
+        for kind in ("listing", "detail"):
+            total = self.stats[f"{kind}_http"] + self.stats[f"{kind}_playwright"]
+            rates[kind] = self.stats[f"{kind}_http"] / total if total else 0.0
+        return rates
+
+    def print_summary(self):
+        rates = self.hit_rates()
+        print(f"[INFO] HTTP 고속 경로 적중률: 목록 {rates['listing']:.0%} "
+              f"({self.stats['listing_http']}/{self.stats['listing_http'] + self.stats['listing_playwright']}), "
+              f"상세 {rates['detail']:.0%} "
+              f"({self.stats['detail_http']}/{self.stats['detail_http'] + self.stats['detail_playwright']})")
@@ -0,0 +1,100 @@
+import asyncio
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+import httpx
+
+# --- 설정 ---
+IMAGE_SELECTOR = 'img[src*="view_img"]'
+MAX_IMAGE_CONNECTIONS = 10   # 이미지 다운로드용 커넥션 풀 크기
+IMAGE_TIMEOUT = 20.0
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+
+
+class ImagePosting:
+    """본문이 이미지로만 이루어진 공고. 본문 이미지 주소 목록을 담습니다."""
+
+    def __init__(self, urls):
+        self.urls = urls
+
+    def __repr__(self):
+        return f"ImagePosting({len(self.urls)}개 이미지)"
+
+
+async def collect_image_urls(content_context):
+    """상세 페이지(또는 프레임)에서 본문 이미지의 절대 주소를 한 번에 수집합니다."""
+    urls = await content_context.locator(IMAGE_SELECTOR).evaluate_all("els => els.map(el => el.src)")
+    # 같은 이미지가 여러 번 나와도 순서를 유지하며 한 번만
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+class ImageOCRPipeline:
+    """
+    이미지 공고의 본문 이미지를 커넥션 풀로 병렬 다운로드하고, OCR을 동시에 수행해 텍스트로 합칩니다.
+    - 브라우저 페이지와 무관하게 동작하므로 페이지는 바로 다음 공고로 넘어갈 수 있습니다.
+    - ocr는 submit(image_bytes) -> awaitable[str]을 제공하는 객체입니다 (OCRStage 또는 테스트용 스텁).
+    - 로컬 파일 경로/file:// 주소도 읽을 수 있어 로컬 이미지 픽스처로 검증할 수 있습니다.
+    """
+
+    def __init__(self, ocr, client=None, max_connections=MAX_IMAGE_CONNECTIONS):
+        self.ocr = ocr
+        self._own_client = client is None
+        self.client = client or httpx.AsyncClient(
+            headers={'User-Agent': USER_AGENT},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=IMAGE_TIMEOUT,
+            follow_redirects=True,
+        )
+        self.images_downloaded = 0
+        self.download_failures = 0
+        self.ocr_failures = 0
+
+    async def aclose(self):
+        if self._own_client:
+            await self.client.aclose()
+
+    async def _read_local(self, path):
+        return await asyncio.to_thread(lambda: open(path, "rb").read())
+
+    async def download(self, url):
+        """이미지 하나를 받아 바이트로 반환합니다. 실패하면 None."""
+        try:
+            parsed = urlparse(url)
+            if parsed.scheme == "file":
+                data = await self._read_local(url2pathname(parsed.path))
+            elif parsed.scheme in ("http", "https"):
+                response = await self.client.get(url)
+                response.raise_for_status()
+                data = response.content
+            else:
+                data = await self._read_local(url)
+            self.images_downloaded += 1
+            return data
+        except (httpx.HTTPError, OSError) as e:
+            self.download_failures += 1
+            print(f"[WARN] 이미지 다운로드 실패: {url} ({e})")
+            return None
+
+    async def _download_and_ocr(self, url):
+        data = await self.download(url)
+        if data is None:
+            return ""
+        try:
+            return await self.ocr.submit(data)
+        except Exception as e:
+            # 이미지 하나의 OCR 실패로 공고 전체를 잃지 않도록 그 이미지만 빼고 합침
+            self.ocr_failures += 1
+            print(f"[WARN] 이미지 OCR 실패: {url} ({e})")
+            return ""
+
+    async def process(self, urls):
+        """모든 이미지를 병렬로 받아 OCR하고, 원래 이미지 순서대로 텍스트를 이어 붙입니다."""
+        texts = await asyncio.gather(*(self._download_and_ocr(url) for url in urls))
+        return "\n".join(text.strip() for text in texts if text and text.strip())
+
+    def schedule(self, urls):
+        """process()를 백그라운드 작업으로 시작하고 Task를 반환합니다."""
+        return asyncio.ensure_future(self.process(urls))
+
+    def print_summary(self):
+        print(f"[INFO] 이미지 공고: 이미지 {self.images_downloaded}개 다운로드, 실패 {self.download_failures}개, "
+              f"OCR 실패 {self.ocr_failures}개")
@@ -0,0 +1,49 @@
+import asyncio
+from posting_store import extract_rec_idx
+
+
+class InflightRegistry:
+    """
+    여러 키워드 작업이 공유하는 공고 등록부입니다. 같은 공고(rec_idx)의 상세 수집은 한 번만 실행됩니다.
+    - claim()은 await 없이 확인과 등록을 함께 하므로, 두 키워드가 같은 순간에 발견해도 한쪽만 소유자가 됩니다.
+    - 소유하지 못한 키워드는 등록부에 이름만 남기고, 레코드는 keywords(link)로 일치한 키워드 전체를 가집니다.
+    - parties를 주면 listing_done()이 모든 키워드의 목록 수집이 끝날 때까지 기다리는 장벽이 되어,
+      상세 수집을 시작하는 시점에는 각 공고의 키워드 목록이 완성되어 있습니다.
+    """
+
+    def __init__(self, parties=1):
+        self._keywords = {}  # 공고 키 → 일치한 키워드 목록 (발견 순서)
+        self.parties = parties
+        self._arrived = 0
+        self._all_listed = asyncio.Event()
+        self.fetches_saved = 0
+
+    @staticmethod
+    def key(link):
+        return extract_rec_idx(link) or link
+
+    def claim(self, link, keyword):
+        """처음 발견한 공고면 True(이 키워드가 상세 수집), 이미 다른 작업이 맡은 공고면 False."""
+        key = self.key(link)
+        keywords = self._keywords.get(key)
+        if keywords is None:
+            self._keywords[key] = [keyword]
+            return True
+        if keyword not in keywords:
+            keywords.append(keyword)
+        self.fetches_saved += 1
+        return False
+
+    def keywords(self, link):
+        return list(self._keywords.get(self.key(link), []))
+
+    async def listing_done(self):
+        """목록 수집을 마쳤음을 알리고, 모든 키워드가 마칠 때까지 기다립니다."""
+        self._arrived += 1
+        if self._arrived >= self.parties:
+            self._all_listed.set()
+        await self._all_listed.wait()
+
+    def print_summary(self):
+        print(f"[INFO] 키워드 간 중복 제거: 고유 공고 {len(self._keywords)}건, "
+              f"중복 발견으로 상세 수집 {self.fetches_saved}회 절약")
@@ -1,72 +1,105 @@
 
 import asyncio
-import pandas as pd
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from resource_blocker import ResourceBlocker
+from output_sinks import open_sink
+from rate_limiter import RateLimiter, limited_goto
+from metrics import metrics
+from dom_extract import extract_all, extract_fields, JOBKOREA_LISTING_FIELDS, JOBKOREA_DETAIL_FIELDS
 
 # 검색할 키워드
 KEYWORDS = ['IT', '자율주행', '모빌리티']
+JOBKOREA_BASE_URL = "https://www.jobkorea.co.kr"  # 로컬 목 서버(mock_server.py)로 벤치마크할 때는 그 주소로 바꿈
+CRAWL_MODE = "text"  # 리소스 차단 프로필 ('full', 'text', 'ocr')
+OUTPUT_PATH = "jobkorea_postings.csv"  # 확장자로 형식 결정 (.csv / .jsonl / .parquet, 확장자 없는 폴더면 수집일/출처별 Parquet 데이터셋)
+# .parquet 파일 하나는 종료할 때 footer를 써야 완성되므로 도중에 죽으면 모두 읽을 수 없음 → 긴 수집은 .jsonl / .csv 또는 데이터셋 폴더
+OUTPUT_COLUMNS = ["source", "keyword", "title", "description"]
+METRICS_PATH = "jobkorea_metrics"  # 실행 종료 시 단계별 측정값을 .json / .prom으로 저장
+TRACE_PATH = None  # 공고별 단계 시간 추적 파일 (예: "jobkorea_trace.jsonl")
 
-async def scrape_jobkorea(page, keyword):
-    """잡코리아에서 특정 키워드로 채용 공고를 스크레이핑합니다."""
+async def scrape_jobkorea(page, keyword, sink=None, limiter=None):
+    """잡코리아에서 특정 키워드로 채용 공고를 스크레이핑합니다. sink가 주어지면 공고마다 바로 기록합니다."""
     print(f"잡코리아에서 '{keyword}' 키워드로 검색을 시작합니다.")
-    url = f"https://www.jobkorea.co.kr/Search/?stext={keyword}"
-    await page.goto(url, wait_until="domcontentloaded")
+    url = f"{JOBKOREA_BASE_URL}/Search/?stext={keyword}"
+    with metrics.timer("listing.goto"):
+        await limited_goto(page, url, limiter, wait_until="domcontentloaded")
 
     try:
         # 검색 결과가 로드될 때까지 대기 (30초로 증가)
-                await page.wait_for_selector("div.post", timeout=30000)
+        with metrics.timer("listing.wait_results"):
+            await page.wait_for_selector("div.post", timeout=30000)
     except PlaywrightTimeoutError:
         print(f"잡코리아에서 '{keyword}'에 대한 검색 결과가 없거나 로딩에 실패했습니다.")
         return []
 
-    # 공고 링크 수집
-        links = await page.eval_on_selector_all("div.post .title", """
-        (elements => elements.map(el => el.href))
-    """)
+    # 공고 링크 수집 (evaluate 한 번으로 모든 공고의 링크를 읽음)
+    with metrics.timer("listing.extract"):
+        posts = await extract_all(page, "div.post", JOBKOREA_LISTING_FIELDS)
+    links = [post["link"] for post in posts]
 
     jobs = []
     print(f"잡코리아에서 {len(links)}개의 공고를 찾았습니다. 내용을 수집합니다.")
 
     for link in links[:15]:  # 시간 관계상 일부만 수집 (필요시 조정)
-        try:
-            await page.goto(link, wait_until="domcontentloaded")
-            await page.wait_for_selector("h1.title", timeout=10000)
-            
-            title = await page.locator("h1.title").inner_text()
-            
-            content = await page.locator(".detail-body").inner_text()
+        with metrics.trace(link=link, keyword=keyword):
+            try:
+                with metrics.timer("detail.goto"):
+                    await limited_goto(page, link, limiter, wait_until="domcontentloaded")
+                with metrics.timer("detail.wait_title"):
+                    await page.wait_for_selector("h1.title", timeout=10000)
+
+                # 제목과 본문을 evaluate 한 번으로 읽음
+                with metrics.timer("detail.extract"):
+                    fields = await extract_fields(page, JOBKOREA_DETAIL_FIELDS)
             
-            jobs.append({
-                "source": "잡코리아",
-                "keyword": keyword,
-                "title": title.strip(),
-                "description": content.strip()
-            })
-        except PlaywrightTimeoutError:
-            print(f"잡코리아 공고({link}) 내용을 가져오는 데 실패했습니다.")
-        except Exception as e:
-            print(f"처리 중 오류 발생: {link}, 오류: {e}")
+                job = {
+                    "source": "잡코리아",
+                    "keyword": keyword,
+                    "title": fields["title"],
+                    "description": fields["description"] or ""
+                }
+                if sink is not None:
+                    sink.write(job)
+                else:
+                    jobs.append(job)
+            except PlaywrightTimeoutError:
+                metrics.fail("detail.failed")
+                print(f"잡코리아 공고({link}) 내용을 가져오는 데 실패했습니다.")
+            except Exception as e:
+                metrics.fail("detail.failed")
+                print(f"처리 중 오류 발생: {link}, 오류: {e}")
 
     return jobs
 
 async def main():
     """메인 실행 함수"""
-    all_jobs = []
+    # 공고는 완료되는 즉시 파일에 기록 (메모리에 모아두지 않음)
+    sink = open_sink(OUTPUT_PATH, OUTPUT_COLUMNS)
+    metrics.enable_trace(TRACE_PATH)
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=False) # 브라우저 동작 확인을 위해 False로 설정
         page = await browser.new_page()
+        blocker = ResourceBlocker(CRAWL_MODE)
+        await blocker.attach(page)
+        # 호스트별 적응형 속도 제한 + 재시도 + 회로 차단
+        limiter = RateLimiter()
 
-        for keyword in KEYWORDS:
-            jobkorea_jobs = await scrape_jobkorea(page, keyword)
-            all_jobs.extend(jobkorea_jobs)
+        try:
+            for keyword in KEYWORDS:
+                await scrape_jobkorea(page, keyword, sink, limiter)
+        finally:
+            sink.close()
 
         await browser.close()
+        blocker.print_summary()
+        limiter.print_summary()
+        metrics.print_summary()
+
+    metrics.count("postings.written", sink.count)
+    metrics.export(METRICS_PATH)
 
-    if all_jobs:
-        # 데이터프레임으로 변환 후 CSV 파일로 저장
-        df = pd.DataFrame(all_jobs)
-        df.to_csv("jobkorea_postings.csv", index=False, encoding="utf-8-sig")
-        print(f"\n스크레이핑 완료! 'jobkorea_postings.csv' 파일에 총 {len(all_jobs)}개의 공고가 저장되었습니다.")
+    if sink.count:
+        print(f"\n스크레이핑 완료! '{OUTPUT_PATH}' 파일에 총 {sink.count}개의 공고가 저장되었습니다.")
     else:
         print("\n수집된 채용 공고가 없습니다.")
 
@@ -0,0 +1,221 @@
+import contextvars
+import json
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+# --- 설정 ---
+# 단계 소요 시간(초) 히스토그램 구간
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = "crawl"
+RESERVOIR_SIZE = 1024  # 백분위 계산용으로 보관하는 표본 수 (넘으면 균등 표본 추출로 교체, 메모리 일정)
+
+# 현재 작업(코루틴)이 처리 중인 공고의 추적 정보 (asyncio 작업마다 따로 유지됨)
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+
+
+class Histogram:
+    """
+    누적 구간 개수와 개수/합계/최소/최대를 보관합니다. 긴 수집에서도 메모리가 늘지 않도록 원본 값은 모두 두지 않고,
+    백분위는 최대 reservoir_size개의 균등 표본(저수지 표본 추출)으로 계산합니다.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, reservoir_size=RESERVOIR_SIZE):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.reservoir_size = reservoir_size
+        self.samples = []
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self._random = random.Random(0)
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+        if len(self.samples) < self.reservoir_size:
+            self.samples.append(value)
+        else:
+            # 지금까지의 값 모두가 같은 확률로 표본에 남도록 교체
+            slot = self._random.randrange(self.count)
+            if slot < self.reservoir_size:
+                self.samples[slot] = value
+
+    def percentile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "min": self.min if self.min is not None else 0.0,
+            "max": self.max if self.max is not None else 0.0,
+        }
+
+
+def _metric_name(name):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', f"{METRIC_PREFIX}_{name}")
+
+
+class MetricsRegistry:
+    """
+    수집 파이프라인의 단계별 타이머, 카운터, 히스토그램을 모으는 레지스트리입니다.
+    - timer(stage): with 블록의 소요 시간을 단계 히스토그램에 기록합니다 (예외가 나면 '<stage>.errors'도 증가).
+    - trace(...): 공고 하나를 처리하는 동안의 단계별 시간을 모아 추적 파일(JSON Lines)에 한 줄로 기록합니다.
+    - export(path): '<path>.json'(요약)과 '<path>.prom'(Prometheus 텍스트 형식)으로 내보냅니다.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._trace_file = None
+        self.started = time.time()
+
+    # --- 기록 ---
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def fail(self, name):
+        """실패 카운터를 올리고, 추적 중인 공고가 있으면 상태를 'failed'로 표시합니다."""
+        self.count(name)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace["status"] = "failed"
+
+    def observe(self, name, value, buckets=DEFAULT_BUCKETS):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(buckets)
+            histogram.observe(value)
+
+    def observe_stage(self, stage, seconds):
+        with self._lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = Histogram()
+            histogram.observe(seconds)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace["stages"][stage] = trace["stages"].get(stage, 0.0) + seconds
+
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.count(f"{stage}.errors")
+            raise
+        finally:
+            self.observe_stage(stage, time.perf_counter() - start)
+
+    # --- 공고별 추적 ---
+    def enable_trace(self, path):
+        """공고별 추적 파일을 엽니다. path가 없으면 추적하지 않습니다."""
+        if path:
+            self._trace_file = open(path, "a", encoding="utf-8")
+
+    @contextmanager
+    def trace(self, **fields):
+        """with 블록 안에서 측정된 단계 시간을 fields와 함께 추적 파일에 한 줄로 기록합니다."""
+        if self._trace_file is None:
+            yield None
+            return
+        trace = {**fields, "stages": {}}
+        token = _current_trace.set(trace)
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield trace
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            _current_trace.reset(token)
+            trace.setdefault("status", status)
+            trace["total"] = time.perf_counter() - start
+            with self._lock:
+                self._trace_file.write(json.dumps(trace, ensure_ascii=False) + "\n")
+                self._trace_file.flush()
+
+    # --- 내보내기 ---
+    def summary(self):
+        with self._lock:
+            return {
+                "elapsed": time.time() - self.started,
+                "stages": {stage: h.summary() for stage, h in self.stages.items()},
+                "counters": dict(self.counters),
+                "histograms": {name: h.summary() for name, h in self.histograms.items()},
+            }
+
+    def to_prometheus(self):
+        lines = []
+
+        def histogram_lines(metric, histogram, label=""):
+            sep = "," if label else ""
+            for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                lines.append(f'{metric}_bucket{{{label}{sep}le="{bound}"}} {count}')
+            lines.append(f'{metric}_bucket{{{label}{sep}le="+Inf"}} {histogram.count}')
+            suffix = f"{{{label}}}" if label else ""
+            lines.append(f"{metric}_sum{suffix} {histogram.sum}")
+            lines.append(f"{metric}_count{suffix} {histogram.count}")
+
+        with self._lock:
+            if self.stages:
+                metric = _metric_name("stage_seconds")
+                lines.append(f"# HELP {metric} 수집 단계별 소요 시간")
+                lines.append(f"# TYPE {metric} histogram")
+                for stage, histogram in sorted(self.stages.items()):
+                    histogram_lines(metric, histogram, f'stage="{stage}"')
+            for name, value in sorted(self.counters.items()):
+                metric = _metric_name(name) + "_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+            for name, histogram in sorted(self.histograms.items()):
+                metric = _metric_name(name)
+                lines.append(f"# TYPE {metric} histogram")
+                histogram_lines(metric, histogram)
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """'<path>.json'과 '<path>.prom'을 기록하고 추적 파일을 닫습니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        with open(f"{path}.prom", "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
+
+    def print_summary(self, top=8):
+        """누적 시간이 가장 긴 단계부터 출력합니다."""
+        stages = sorted(self.summary()["stages"].items(), key=lambda item: item[1]["sum"], reverse=True)
+        for stage, s in stages[:top]:
+            print(f"[INFO] 단계 {stage}: 합계 {s['sum']:.2f}s (n={s['count']}, p50 {s['p50']:.3f}s, "
+                  f"p95 {s['p95']:.3f}s, 최대 {s['max']:.3f}s)")
+
+
+# 프로세스 전체에서 공유하는 기본 레지스트리
+metrics = MetricsRegistry()
@@ -0,0 +1,325 @@
+import argparse
+import html
+import io
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from PIL import Image, ImageDraw
+from http_fetch import parse_listing_html
+
+# --- 설정 ---
+FIXTURE_PATH = "saramin_result.html"  # 실제 검색 결과 페이지 (공고 20개) — 목록 페이지의 틀로 사용
+DEFAULT_LATENCY = 0.05     # 응답마다 더하는 평균 지연 시간(초)
+DEFAULT_JITTER = 0.5       # 지연 시간 변동 폭 (평균 대비 비율, 0.5면 ±50%)
+DEFAULT_PAGES = 10         # 키워드별 검색 결과 페이지 수 (이후 페이지는 결과 없음)
+DEFAULT_IMAGE_RATE = 0.1   # 이미지로만 된 공고 비율
+DEFAULT_INLINE_RATE = 0.3  # iframe 없이 본문이 페이지에 바로 있는 공고 비율
+DEFAULT_OVERLAP = 0.2      # 모든 키워드의 검색 결과에 함께 나오는 공고 비율
+HANG_SECONDS = 35.0        # 타임아웃 주입 시 응답을 붙잡아 두는 시간 (스크레이퍼의 요청 제한 시간보다 길게)
+JOBKOREA_POSTS_PER_PAGE = 20
+FIRST_REC_IDX = 60000000
+
+# 상세 본문을 만들 때 쓰는 문장 (섹션 제목 → 항목 후보)
+SECTION_LINES = {
+    "담당업무": ["자율주행 인지 모듈 개발", "차량 데이터 수집 파이프라인 구축", "웹 서비스 백엔드 API 개발 및 운영",
+             "모빌리티 플랫폼 신규 기능 설계", "머신러닝 모델 학습·배포 자동화", "사내 데이터 분석 대시보드 개발"],
+    "자격요건": ["관련 분야 경력 3년 이상", "Python 또는 C++ 능숙자", "Linux 환경 개발 경험",
+             "Git 기반 협업 경험", "학력 무관", "해외여행에 결격사유가 없는 자"],
+    "우대사항": ["ROS 사용 경험자", "클라우드(AWS/GCP) 운영 경험", "관련 전공 석사 이상 🎓",
+             "오픈소스 기여 경험", "영어 커뮤니케이션 가능자 ✨"],
+    "복리후생": ["4대보험", "유연근무제", "점심 식대 지원 🍱", "자기계발비 지원", "연차 외 리프레시 휴가"],
+}
+
+
+def _fixture_template(path):
+    """
+    검색 결과 HTML을 목록 틀로 바꿉니다.
+    - 스크립트를 지우고 외부 이미지 주소를 떼어 내 네트워크 없이 열리게 합니다.
+    - 공고마다 다른 rec_idx를 '@@SLOT<n>@@' 자리표시자로 바꿔 요청마다 새 번호를 채울 수 있게 합니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    text = re.sub(r'<script\b.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'(<img\b[^>]*?)\s(?:src|srcset)="(?:https?:)?//[^"]*"', r'\1', text, flags=re.IGNORECASE)
+    original_ids = list(dict.fromkeys(re.findall(r'rec_idx=(\d+)', text)))
+    for slot, rec_idx in enumerate(original_ids):
+        text = re.sub(rf'\b{rec_idx}\b', f'@@SLOT{slot}@@', text)
+    return text, len(original_ids)
+
+
+class MockState:
+    """목 서버 한 대의 설정, 고정 데이터, 요청 통계."""
+
+    def __init__(self, latency, jitter, failure_rate, timeout_rate, pages, image_rate, inline_rate, overlap, seed):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        self.pages = pages
+        self.image_rate = image_rate
+        self.inline_rate = inline_rate
+        self.overlap = overlap
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.template, self.slots = _fixture_template(FIXTURE_PATH)
+        with open(FIXTURE_PATH, encoding="utf-8") as f:
+            self.listings = parse_listing_html(f.read())  # 제목/회사명 후보
+        self._images = {}
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.injected = {"429": 0, "503": 0, "timeout": 0}
+
+    def record(self, route):
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    # --- 공고 번호 ---
+    def posting_id(self, keyword, page_number, slot):
+        """
+        키워드/페이지/순번이 같으면 항상 같은 번호. overlap 비율만큼은 키워드와 상관없는 공용 번호를 써서
+        여러 키워드 검색 결과에 같은 공고가 함께 나오게 합니다.
+        """
+        position = (page_number - 1) * self.slots + slot
+        if random.Random(f"{self.seed}:shared:{position}").random() < self.overlap:
+            return FIRST_REC_IDX + position
+        block = zlib.crc32(keyword.encode("utf-8")) % 997 + 1
+        return FIRST_REC_IDX + block * 100000 + position
+
+    def layout(self, rec_idx):
+        """공고 번호별로 고정된 상세 페이지 형태: 'image', 'inline', 'iframe'."""
+        r = random.Random(f"{self.seed}:layout:{rec_idx}").random()
+        if r < self.image_rate:
+            return "image"
+        if r < self.image_rate + self.inline_rate:
+            return "inline"
+        return "iframe"
+
+    def listing_of(self, rec_idx):
+        return self.listings[rec_idx % len(self.listings)]
+
+    # --- 페이지 생성 ---
+    def search_page(self, keyword, page_number):
+        if page_number > self.pages:
+            return "<html><body><div class='content'><p class='noresult'>검색결과가 없습니다.</p></div></body></html>"
+        ids = [self.posting_id(keyword, page_number, slot) for slot in range(self.slots)]
+        return re.sub(r'@@SLOT(\d+)@@', lambda m: str(ids[int(m.group(1))]), self.template)
+
+    def detail_body(self, rec_idx):
+        rng = random.Random(f"{self.seed}:body:{rec_idx}")
+        if self.layout(rec_idx) == "image":
+            images = "".join(f'<img src="/upload/view_img/{rec_idx}_{k}.png" alt="">' for k in range(rng.randint(1, 3)))
+            return f'<div class="user_content">{images}</div>'
+        parts = []
+        for heading, lines in SECTION_LINES.items():
+            items = "".join(f"<li>• {html.escape(line)}</li>" for line in rng.sample(lines, rng.randint(2, len(lines))))
+            parts.append(f"<h3><strong>{heading}</strong></h3><ul>{items}</ul>")
+        return f'<div class="user_content">{"".join(parts)}</div>'
+
+    def detail_page(self, rec_idx):
+        listing = self.listing_of(rec_idx)
+        if self.layout(rec_idx) == "inline":
+            content = f'<div class="job_definition">{self.detail_body(rec_idx)}</div>'
+        else:
+            content = (f'<iframe id="iframe_content_0" name="iframe_content_0" '
+                       f'src="/zf_user/jobs/relay/view-detail?rec_idx={rec_idx}&rec_seq=0" '
+                       f'width="100%" height="2000" frameborder="0"></iframe>')
+        return (f"<html><head><title>{html.escape(listing['title'])}</title></head><body>"
+                f"<div class='wrap_jview'><section class='jview jview-0-{rec_idx}'>"
+                f"<h1 class='tit_job'>{html.escape(listing['title'])}</h1>"
+                f"<div class='title_inner'><a class='company'>{html.escape(listing['company'])}</a></div>"
+                f"<div class='jv_cont jv_detail'><div class='cont'>{content}</div></div>"
+                f"</section></div></body></html>")
+
+    def detail_frame(self, rec_idx):
+        return f"<html><body>{self.detail_body(rec_idx)}</body></html>"
+
+    def image(self, name):
+        """본문 이미지 (공고마다 다른 무늬라 dHash 중복 제거에 걸리지 않음)."""
+        with self.lock:
+            data = self._images.get(name)
+        if data is None:
+            rng = random.Random(f"{self.seed}:image:{name}")
+            image = Image.new("RGB", (600, 800), "white")
+            draw = ImageDraw.Draw(image)
+            for _ in range(40):
+                x, y = rng.randrange(560), rng.randrange(780)
+                draw.rectangle([x, y, x + rng.randint(20, 300), y + rng.randint(8, 20)], fill=(rng.randrange(200),) * 3)
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG")
+            data = buffer.getvalue()
+            with self.lock:
+                self._images[name] = data
+        return data
+
+    def jobkorea_search_page(self, keyword, page_number=1):
+        posts = []
+        block = zlib.crc32(keyword.encode("utf-8")) % 997 + 1
+        for i in range(JOBKOREA_POSTS_PER_PAGE if page_number <= self.pages else 0):
+            gno = FIRST_REC_IDX + block * 100000 + (page_number - 1) * JOBKOREA_POSTS_PER_PAGE + i
+            listing = self.listing_of(gno)
+            posts.append(f"<div class='post'><div class='post-list-corp'><a class='name'>{html.escape(listing['company'])}</a></div>"
+                         f"<div class='post-list-info'><a class='title' href='/Recruit/GI_Read/{gno}'>"
+                         f"{html.escape(listing['title'])}</a></div></div>")
+        return f"<html><body><div class='list-default'>{''.join(posts)}</div></body></html>"
+
+    def jobkorea_detail_page(self, gno):
+        listing = self.listing_of(gno)
+        return (f"<html><body><h1 class='title'>{html.escape(listing['title'])}</h1>"
+                f"<div class='detail-body'>{self.detail_body(gno)}</div></body></html>")
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 찍지 않음
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _inject(self, state):
+        """설정된 비율로 429/503 응답이나 응답 지연(타임아웃)을 주입합니다. 주입했으면 True."""
+        r = state.rng.random()
+        if r < state.timeout_rate:
+            with state.lock:
+                state.injected["timeout"] += 1
+            time.sleep(HANG_SECONDS)
+            return False  # 오래 붙잡아 둔 뒤에는 정상 응답 (클라이언트는 이미 포기했을 수 있음)
+        if r < state.timeout_rate + state.failure_rate:
+            status = 429 if state.rng.random() < 0.5 else 503
+            with state.lock:
+                state.injected[str(status)] += 1
+            self._send(status, f"<html><body>{status}</body></html>", headers={"Retry-After": "1"})
+            return True
+        return False
+
+    def do_GET(self):
+        state = self.server.state
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip("/") or "/"
+
+        if state.latency:
+            time.sleep(max(0.0, state.latency * state.rng.uniform(1 - state.jitter, 1 + state.jitter)))
+
+        try:
+            match = re.match(r'/upload/view_img/([\w.-]+)\.png$', path)
+            if match:
+                state.record("image")
+                self._send(200, state.image(match.group(1)), content_type="image/png")
+                return
+            if self._inject(state):
+                return
+
+            if path == "/zf_user/search":
+                state.record("search")
+                page_number = int(query.get("recruitPage", "1") or 1)
+                self._send(200, state.search_page(query.get("searchword", ""), page_number))
+            elif path == "/zf_user/jobs/relay/view" and query.get("rec_idx", "").isdigit():
+                state.record("detail")
+                self._send(200, state.detail_page(int(query["rec_idx"])))
+            elif path == "/zf_user/jobs/relay/view-detail" and query.get("rec_idx", "").isdigit():
+                state.record("detail_frame")
+                self._send(200, state.detail_frame(int(query["rec_idx"])))
+            elif path == "/Search":
+                state.record("jobkorea_search")
+                page_number = int(query.get("Page_No", "1") or 1)
+                self._send(200, state.jobkorea_search_page(query.get("stext", ""), page_number))
+            elif re.match(r'/Recruit/GI_Read/\d+$', path):
+                state.record("jobkorea_detail")
+                self._send(200, state.jobkorea_detail_page(int(path.rsplit("/", 1)[1])))
+            else:
+                state.record("not_found")
+                self._send(404, "<html><body>Not Found</body></html>")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 먼저 끊음 (타임아웃 등)
+
+
+class MockServer:
+    """
+    사람인/잡코리아 페이지를 흉내 내는 로컬 HTTP 서버입니다 (표준 라이브러리만 사용, 별도 스레드에서 실행).
+    - 검색 결과: saramin_result.html을 틀로 recruitPage마다 다른 공고 번호를 채워 응답합니다.
+    - 상세: iframe_content_0이 있는 페이지, 본문이 바로 있는 페이지, 이미지로만 된 공고를 공고 번호별로 고정해 섞습니다.
+    - 잡코리아: Page_No로 넘기는 div.post 검색 결과와 h1.title/.detail-body 상세 페이지.
+    - latency/jitter로 응답 지연을, failure_rate로 429/503을, timeout_rate로 응답 지연(타임아웃)을 주입합니다.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=DEFAULT_LATENCY, jitter=DEFAULT_JITTER, failure_rate=0.0,
+                 timeout_rate=0.0, pages=DEFAULT_PAGES, image_rate=DEFAULT_IMAGE_RATE, inline_rate=DEFAULT_INLINE_RATE,
+                 overlap=DEFAULT_OVERLAP, seed=0):
+        self.httpd = ThreadingHTTPServer((host, port), MockHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = MockState(latency, jitter, failure_rate, timeout_rate, pages, image_rate, inline_rate,
+                                     overlap, seed)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def summary(self):
+        state = self.httpd.state
+        with state.lock:
+            return {"requests": dict(state.requests), "injected": dict(state.injected)}
+
+    def print_summary(self):
+        s = self.summary()
+        routes = ", ".join(f"{route} {count}" for route, count in sorted(s["requests"].items()))
+        print(f"[INFO] 목 서버 {self.base_url}: 요청 {sum(s['requests'].values())}회 ({routes}), "
+              f"주입 429 {s['injected']['429']}회 / 503 {s['injected']['503']}회 / 타임아웃 {s['injected']['timeout']}회")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크용 사람인/잡코리아 목 서버")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="평균 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help="지연 변동 폭 (평균 대비 비율)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="429/503 응답 비율")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help=f"응답을 {HANG_SECONDS:.0f}초 붙잡아 두는 비율")
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="키워드별 검색 결과 페이지 수")
+    parser.add_argument("--image-rate", type=float, default=DEFAULT_IMAGE_RATE, help="이미지 공고 비율")
+    parser.add_argument("--inline-rate", type=float, default=DEFAULT_INLINE_RATE, help="iframe 없는 상세 페이지 비율")
+    parser.add_argument("--overlap", type=float, default=DEFAULT_OVERLAP, help="모든 키워드에 함께 나오는 공고 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockServer(port=args.port, latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+                        timeout_rate=args.timeout_rate, pages=args.pages, image_rate=args.image_rate,
+                        inline_rate=args.inline_rate, overlap=args.overlap, seed=args.seed)
+    print(f"[INFO] 목 서버 실행 중: {server.base_url}/zf_user/search?searchword=IT&recruitPage=1 (Ctrl+C로 종료)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.print_summary()
+        server.httpd.server_close()
@@ -0,0 +1,223 @@
+import argparse
+import hashlib
+import re
+import sqlite3
+import time
+import zlib
+import numpy as np
+from posting_store import extract_rec_idx, SQLITE_TIMEOUT
+
+# --- 설정 ---
+INDEX_PATH = "near_duplicates.sqlite3"
+SHINGLE_SIZE = 5         # 공백/기호를 뺀 본문에서 글자 5개씩 겹쳐 자른 조각(shingle)
+NUM_PERM = 128           # MinHash 서명 길이
+BANDS = 16               # LSH 밴드 수 (밴드당 NUM_PERM / BANDS = 8행) → 유사도 약 0.7부터 후보로 잡힘
+THRESHOLD = 0.8          # 후보 중 추정 자카드 유사도가 이 이상이면 유사 중복으로 판정
+MIN_SHINGLES = 20        # 조각이 이보다 적은 짧은 본문은 판정하지 않음 (우연히 겹치기 쉬움)
+SEED = 1
+TEXT_FIELDS = ['responsibilities', 'qualifications', 'preferred']  # 레코드에서 비교할 본문 필드
+
+_ROWS = NUM_PERM // BANDS
+_rng = np.random.default_rng(SEED)
+# 곱셈-시프트 해시 계수 (64비트 곱셈은 넘침을 그대로 버림, 상위 32비트 사용)
+_A = _rng.integers(1, 2 ** 63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2 ** 63, size=NUM_PERM, dtype=np.uint64)
+
+
+# --- 서명 ---
+def shingles(text):
+    """공백/기호를 뺀 소문자 본문의 글자 SHINGLE_SIZE개 조각 집합 (crc32 해시)."""
+    compact = re.sub(r'[\W_]+', '', (text or "").lower())
+    return {zlib.crc32(compact[i:i + SHINGLE_SIZE].encode('utf-8'))
+            for i in range(len(compact) - SHINGLE_SIZE + 1)}
+
+
+def minhash(shingle_set):
+    """조각 집합의 MinHash 서명 (NUM_PERM개의 uint32)."""
+    values = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))[:, None]
+    with np.errstate(over='ignore'):
+        hashed = (values * _A + _B) >> np.uint64(32)
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def similarity(signature_a, signature_b):
+    """두 서명으로 추정한 자카드 유사도."""
+    return float(np.mean(signature_a == signature_b))
+
+
+def band_buckets(signature):
+    """밴드마다 서명 구간의 해시 (같은 버킷에 들어간 공고끼리만 비교)."""
+    buckets = []
+    for band in range(BANDS):
+        digest = hashlib.blake2b(signature[band * _ROWS:(band + 1) * _ROWS].tobytes(), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, 'big', signed=True))
+    return buckets
+
+
+def record_text(record):
+    return "\n".join(str(record.get(field) or "") for field in TEXT_FIELDS)
+
+
+def record_key(record):
+    link = record.get('link') or ""
+    return extract_rec_idx(link) or link
+
+
+# --- 색인 ---
+class NearDuplicateIndex:
+    """
+    MinHash 서명과 LSH 밴드 버킷으로 유사 중복 공고를 찾는 색인입니다 (SQLite에 저장, 실행 간에 이어짐).
+    - add()는 같은 버킷에 있는 공고만 후보로 비교하므로 공고 수에 거의 비례하는 시간으로 동작합니다.
+    - 유사 중복끼리는 유니언-파인드로 묶어, 처음 들어온 공고를 클러스터 대표로 유지합니다.
+    - path에 ":memory:"를 주면 한 번의 실행 안에서만 사용합니다.
+    """
+
+    def __init__(self, path=INDEX_PATH, threshold=THRESHOLD):
+        self.threshold = threshold
+        self.conn = sqlite3.connect(path, timeout=SQLITE_TIMEOUT)
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS signatures (
+                key TEXT PRIMARY KEY,
+                link TEXT,
+                signature BLOB NOT NULL,
+                parent TEXT NOT NULL,
+                added REAL NOT NULL
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (band, bucket, key)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+        self.added = 0
+        self.duplicates = 0
+        self.skipped_short = 0
+        self.comparisons = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    # --- 유니언-파인드 ---
+    def find(self, key):
+        """key가 속한 클러스터의 대표 공고 키 (경로 압축 포함)."""
+        path = []
+        while True:
+            row = self.conn.execute("SELECT parent FROM signatures WHERE key = ?", (key,)).fetchone()
+            if row is None or row[0] == key:
+                break
+            path.append(key)
+            key = row[0]
+        for node in path[:-1]:
+            self.conn.execute("UPDATE signatures SET parent = ? WHERE key = ?", (key, node))
+        return key
+
+    def _union(self, key_a, key_b):
+        root_a, root_b = self.find(key_a), self.find(key_b)
+        if root_a == root_b:
+            return root_a
+        # 먼저 들어온 공고가 대표가 되도록
+        added_a = self.conn.execute("SELECT added FROM signatures WHERE key = ?", (root_a,)).fetchone()[0]
+        added_b = self.conn.execute("SELECT added FROM signatures WHERE key = ?", (root_b,)).fetchone()[0]
+        root, child = (root_a, root_b) if (added_a, root_a) <= (added_b, root_b) else (root_b, root_a)
+        self.conn.execute("UPDATE signatures SET parent = ? WHERE key = ?", (root, child))
+        return root
+
+    # --- 추가 / 조회 ---
+    def _candidates(self, key, buckets):
+        found = set()
+        for band, bucket in enumerate(buckets):
+            for (candidate,) in self.conn.execute(
+                    "SELECT key FROM bands WHERE band = ? AND bucket = ? AND key != ?", (band, bucket, key)):
+                found.add(candidate)
+        return found
+
+    def add(self, key, text, link=None):
+        """
+        공고 하나를 색인에 넣고, 이미 색인된 공고와 유사 중복이면 (대표 공고 키, 대표 링크, 가장 높은 유사도)를,
+        아니면 None을 반환합니다. 본문이 너무 짧으면 색인하지 않고 None.
+        """
+        shingle_set = shingles(text)
+        if len(shingle_set) < MIN_SHINGLES:
+            self.skipped_short += 1
+            return None
+        signature = minhash(shingle_set)
+        buckets = band_buckets(signature)
+
+        best = 0.0
+        with self.conn:
+            existing = self.conn.execute("SELECT signature FROM signatures WHERE key = ?", (key,)).fetchone()
+            if existing is None:
+                self.conn.execute("INSERT INTO signatures (key, link, signature, parent, added) VALUES (?, ?, ?, ?, ?)",
+                                  (key, link, signature.tobytes(), key, time.time()))
+                self.added += 1
+            elif existing[0] != signature.tobytes():
+                # 본문이 바뀐 공고는 서명과 버킷만 새로 고침 (클러스터 소속은 유지)
+                self.conn.execute("UPDATE signatures SET signature = ?, link = ? WHERE key = ?",
+                                  (signature.tobytes(), link, key))
+                self.conn.execute("DELETE FROM bands WHERE key = ?", (key,))
+            for candidate in self._candidates(key, buckets):
+                row = self.conn.execute("SELECT signature FROM signatures WHERE key = ?", (candidate,)).fetchone()
+                self.comparisons += 1
+                score = similarity(signature, np.frombuffer(row[0], dtype=np.uint32))
+                if score >= self.threshold:
+                    self._union(key, candidate)
+                    best = max(best, score)
+            self.conn.executemany("INSERT OR IGNORE INTO bands (band, bucket, key) VALUES (?, ?, ?)",
+                                  [(band, bucket, key) for band, bucket in enumerate(buckets)])
+            root = self.find(key)
+
+        if root == key:
+            return None
+        self.duplicates += 1
+        root_link = self.conn.execute("SELECT link FROM signatures WHERE key = ?", (root,)).fetchone()[0]
+        return root, root_link, best
+
+    def add_record(self, record):
+        """레코드의 본문 필드로 add()를 호출합니다."""
+        return self.add(record_key(record), record_text(record), record.get('link'))
+
+    def clusters(self, min_size=2):
+        """대표 공고 키 → 소속 공고 키 목록 (min_size 이상인 클러스터만)."""
+        groups = {}
+        for (key,) in self.conn.execute("SELECT key FROM signatures ORDER BY added").fetchall():
+            groups.setdefault(self.find(key), []).append(key)
+        self.conn.commit()
+        return {root: members for root, members in groups.items() if len(members) >= min_size}
+
+    def print_summary(self):
+        print(f"[INFO] 유사 중복 감지: {self.added}건 색인, 유사 중복 {self.duplicates}건, "
+              f"후보 비교 {self.comparisons}회, 짧은 본문 제외 {self.skipped_short}건")
+
+
+if __name__ == "__main__":
+    from search_index import read_records
+
+    parser = argparse.ArgumentParser(description="수집 결과에서 유사 중복 공고 클러스터 찾기 (MinHash + LSH)")
+    parser.add_argument("files", nargs="+", help="결과 파일 (.csv / .jsonl / .parquet) 또는 Parquet 데이터셋 폴더")
+    parser.add_argument("--index", default=":memory:", help=f"색인 파일 (예: {INDEX_PATH}, 기본은 메모리)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="유사 중복으로 볼 추정 자카드 유사도")
+    args = parser.parse_args()
+
+    index = NearDuplicateIndex(args.index, args.threshold)
+    titles = {}
+    start = time.perf_counter()
+    for path in args.files:
+        for record in read_records(path):
+            titles[record_key(record)] = f"{record.get('company', '')} | {record.get('title', '')}"
+            index.add_record(record)
+    elapsed = time.perf_counter() - start
+    clusters = index.clusters()
+    index.print_summary()
+    print(f"[INFO] {elapsed:.2f}s, 유사 중복 클러스터 {len(clusters)}개")
+    for root, members in sorted(clusters.items(), key=lambda item: -len(item[1])):
+        print(f"- 클러스터 ({len(members)}건)")
+        for key in members:
+            print(f"    {key}: {titles.get(key, '')}")
+    index.close()
@@ -0,0 +1,103 @@
+import asyncio
+import hashlib
+import io
+import statistics
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+import pytesseract
+
+# --- 설정 ---
+OCR_WORKERS = 2           # OCR 전용 프로세스 수
+MAX_CACHED_TASKS = 500    # 같은 내용의 이미지가 재사용할 수 있도록 기억해 두는 최근 OCR 작업 수
+
+
+# --- 작업 프로세스에서 실행되는 함수 ---
+def run_tesseract(image_bytes, lang, config, tesseract_cmd):
+    """이미지 바이트에 대해 Tesseract OCR을 수행합니다."""
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    return pytesseract.image_to_string(Image.open(io.BytesIO(image_bytes)), lang=lang, config=config)
+
+
+# --- OCR 단계 ---
+class OCRStage:
+    """
+    스크린샷/이미지 OCR을 이벤트 루프 밖(프로세스 풀)에서 처리하는 단계입니다.
+    - submit()은 바로 asyncio.Task를 돌려주므로 스크레이퍼는 기다리지 않고 다음 공고로 넘어갈 수 있습니다.
+    - 같은 내용(sha256)은 한 번만 OCR하고 결과를 재사용합니다. 최근 max_cached개의 작업만 기억합니다 (LRU).
+      지각 해시로는 재사용하지 않습니다: 같은 틀의 다른 공고 스크린샷은 축소하면 거의 같아 다른 공고의 글자가 들어갈 수 있음.
+    - 대기열 깊이와 이미지별 지연 시간을 집계합니다.
+    - ocr_func를 주면 Tesseract 대신 사용합니다 (ocr_func(image_bytes) -> str, 피클 가능한 함수).
+    """
+
+    def __init__(self, workers=OCR_WORKERS, lang='kor', config='', tesseract_cmd=None, ocr_func=None,
+                 max_cached=MAX_CACHED_TASKS):
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.lang = lang
+        self.config = config
+        self.tesseract_cmd = tesseract_cmd
+        self.ocr_func = ocr_func
+        self.max_cached = max_cached
+        self._by_content = OrderedDict()  # sha256 → Task (진행 중인 작업도 공유, 최근 사용 순)
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.latencies = []
+        self.cache_hits = 0
+        self.processed = 0
+
+    def submit(self, image_bytes):
+        """이미지를 OCR 대기열에 넣고, 결과 텍스트를 돌려줄 Task를 반환합니다."""
+        key = hashlib.sha256(image_bytes).hexdigest()
+        task = self._by_content.get(key)
+        if task is not None:
+            self.cache_hits += 1
+            self._by_content.move_to_end(key)
+            return task
+        task = asyncio.ensure_future(self._process(image_bytes))
+        self._by_content[key] = task
+        if len(self._by_content) > self.max_cached:
+            self._by_content.popitem(last=False)
+        return task
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def _process(self, image_bytes):
+        start = time.perf_counter()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            try:
+                if self.ocr_func is not None:
+                    text = await self._run(self.ocr_func, image_bytes)
+                else:
+                    text = await self._run(run_tesseract, image_bytes, self.lang, self.config, self.tesseract_cmd)
+            except Exception as e:
+                print(f"[ERROR] OCR 처리 중 오류 발생: {e}")
+                text = ""
+            self.processed += 1
+            self.latencies.append(time.perf_counter() - start)
+            return text
+        finally:
+            self.queue_depth -= 1
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        return {
+            "processed": self.processed,
+            "cache_hits": self.cache_hits,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "latency_p50": statistics.median(latencies) if latencies else 0.0,
+            "latency_max": latencies[-1] if latencies else 0.0,
+        }
+
+    def print_summary(self):
+        s = self.summary()
+        print(f"[INFO] OCR: 처리 {s['processed']}건, 캐시 재사용 {s['cache_hits']}건, 최대 대기열 {s['max_queue_depth']}, "
+              f"지연 p50 {s['latency_p50']:.2f}s / 최대 {s['latency_max']:.2f}s")
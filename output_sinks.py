@@ -0,0 +1,288 @@
+import csv
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from urllib.parse import quote
+
+# --- 설정 ---
+DEFAULT_BATCH_SIZE = 20  # 이 개수만큼 모이면 파일에 기록
+PARQUET_BATCH_SIZE = 500  # Parquet는 row group(파티션 데이터셋은 파일) 하나에 이만큼 모아 기록
+PARQUET_COMPRESSION = "zstd"
+# 값 종류가 적어 행마다 반복되는 열은 사전(dictionary) 인코딩 (나머지 긴 본문 열은 압축만)
+DICTIONARY_COLUMNS = {'source', 'keyword', 'keywords', 'company', 'location', 'crawl_date'}
+PARTITION_COLUMNS = ['crawl_date', 'source']  # 파티션 데이터셋의 폴더 구조 (crawl_date=.../source=.../)
+
+
+class RecordSink:
+    """
+    수집된 레코드를 완료되는 즉시 파일에 이어 쓰는 출력 싱크의 기본 클래스입니다.
+    - write()는 내부 버퍼에 쌓고 batch_size마다 flush()로 한꺼번에 기록합니다.
+    - 락으로 보호되므로 여러 작업자(스레드/코루틴)가 같은 싱크에 기록해도 안전합니다.
+    - columns가 주어지면 그 순서와 항목만 기록합니다.
+    - 목록 값(예: keywords)은 CSV/Parquet에서는 ", "로 이어 붙이고, JSON Lines에서는 그대로 기록합니다.
+    """
+    flatten_lists = True
+
+    def __init__(self, path, columns=None, batch_size=DEFAULT_BATCH_SIZE, append=False):
+        self.path = path
+        self.columns = columns
+        self.batch_size = batch_size
+        self.append = append
+        self.count = 0
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _project(self, record):
+        if self.columns is None:
+            row = dict(record)
+        else:
+            row = {col: record.get(col) for col in self.columns}
+        if self.flatten_lists:
+            for col, value in row.items():
+                if isinstance(value, list):
+                    row[col] = ", ".join(str(item) for item in value)
+        return row
+
+    def write(self, record):
+        with self._lock:
+            self._buffer.append(self._project(record))
+            self.count += 1
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._close()
+
+    def _write_batch(self, rows):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+
+class CSVSink(RecordSink):
+    """UTF-8-BOM CSV로 기록합니다 (엑셀 호환, 기존 saramin_final.csv와 같은 형식)."""
+
+    def __init__(self, path, columns, batch_size=DEFAULT_BATCH_SIZE, append=False):
+        super().__init__(path, columns, batch_size, append)
+        resume = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "a" if resume else "w", encoding="utf-8" if resume else "utf-8-sig", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, lineterminator="\n")
+        if not resume:
+            self._writer.writeheader()
+
+    def _write_batch(self, rows):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class JSONLSink(RecordSink):
+    """한 줄에 레코드 하나씩 JSON Lines로 기록합니다."""
+    flatten_lists = False
+
+    def __init__(self, path, columns=None, batch_size=DEFAULT_BATCH_SIZE, append=False):
+        super().__init__(path, columns, batch_size, append)
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def _write_batch(self, rows):
+        self._file.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+# --- Arrow/Parquet 공통 ---
+def arrow_schema(columns):
+    """모든 열을 문자열로, DICTIONARY_COLUMNS는 사전 인코딩 문자열로 두는 Arrow 스키마."""
+    import pyarrow as pa
+    return pa.schema([(col, pa.dictionary(pa.int32(), pa.string()) if col in DICTIONARY_COLUMNS else pa.string())
+                      for col in columns])
+
+
+def arrow_table(rows, columns):
+    """레코드(dict) 목록을 arrow_schema(columns)의 테이블로 만듭니다."""
+    import pyarrow as pa
+    schema = arrow_schema(columns)
+    arrays = [pa.array([None if row.get(field.name) is None else str(row[field.name]) for row in rows],
+                       type=pa.string()).cast(field.type) for field in schema]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def dictionary_encode(table):
+    """
+    pandas 등에서 만든 테이블을 arrow_schema와 같은 형태로 맞춥니다: DICTIONARY_COLUMNS는 int32 사전 인코딩,
+    값이 모두 비어 있는(null) 열과 large_string 열은 string. 청크마다 같은 스키마가 되어 한 파일에 이어 쓸 수 있습니다.
+    """
+    import pyarrow as pa
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if field.name in DICTIONARY_COLUMNS:
+            column = column.cast(pa.string()).dictionary_encode()
+        elif pa.types.is_null(field.type) or pa.types.is_large_string(field.type):
+            column = column.cast(pa.string())
+        else:
+            continue
+        table = table.set_column(i, pa.field(field.name, column.type), column)
+    return table
+
+
+def partition_dir(path, partition):
+    """(열, 값) 쌍으로 된 파티션의 hive 폴더 경로 (pyarrow처럼 값은 URI 인코딩)."""
+    return os.path.join(path, *(f"{col}={quote(str(value), safe='')}" for col, value in partition))
+
+
+def clear_partitions(path, partitions, cleared):
+    """덮어쓰기 모드에서 이번 실행이 처음 기록하는 파티션 폴더만 지웁니다 (cleared에 지운 파티션을 모음)."""
+    for partition in partitions:
+        if partition not in cleared:
+            cleared.add(partition)
+            shutil.rmtree(partition_dir(path, partition), ignore_errors=True)
+
+
+def parquet_options(schema):
+    """압축과, 사전 인코딩 열에만 Parquet 사전 인코딩을 쓰는 기록 옵션."""
+    import pyarrow as pa
+    return {"compression": PARQUET_COMPRESSION,
+            "use_dictionary": [field.name for field in schema if pa.types.is_dictionary(field.type)]}
+
+
+class ParquetSink(RecordSink):
+    """
+    배치마다 row group 하나씩 Parquet 파일로 기록합니다 (pyarrow 필요, 반복되는 열은 사전 인코딩).
+    - 장애에 안전하지 않습니다: 파일 끝(footer)은 close()에서야 기록되므로, 도중에 프로세스가 죽으면
+      그때까지 기록한 레코드를 포함해 파일 전체를 읽을 수 없고 이어 쓰기(--resume)도 할 수 없습니다.
+    - 긴 수집은 JSONL / CSV나, 배치마다 완성된 파일을 남기는 PartitionedParquetSink(확장자 없는 폴더 경로)를 쓰세요.
+    """
+
+    def __init__(self, path, columns, batch_size=DEFAULT_BATCH_SIZE, append=False):
+        if append:
+            raise ValueError("Parquet 싱크는 이어 쓰기를 지원하지 않습니다.")
+        super().__init__(path, columns, max(batch_size, PARQUET_BATCH_SIZE), append)
+        self._schema = arrow_schema(columns)
+        self._writer = None
+
+    def _write_batch(self, rows):
+        import pyarrow.parquet as pq
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self._schema, **parquet_options(self._schema))
+        self._writer.write_table(arrow_table(rows, self.columns))
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class PartitionedParquetSink(RecordSink):
+    """
+    수집일(crawl_date)과 출처(source)로 나눈 Parquet 데이터셋 폴더에 기록합니다 (pyarrow 필요).
+    - path/crawl_date=2024-05-01/source=사람인/part-....parquet 형태의 hive 파티션이므로, 분석 시 날짜/출처 조건으로
+      필요한 파일만 읽습니다 (pyarrow.dataset / pandas.read_parquet / preprocessed.py).
+    - crawl_date는 레코드에 값이 없으면 싱크를 연 날짜입니다.
+    - 파일 이름에 실행 id가 붙으므로 같은 날 다른 실행(다른 수집기)의 파일 옆에 새 파일을 추가하고, 아무것도 지우지 않습니다.
+      overwrite=True일 때만 이번 실행이 기록하는 (crawl_date, source) 파티션을 처음 기록하기 전에 지웁니다.
+    """
+
+    def __init__(self, path, columns, batch_size=DEFAULT_BATCH_SIZE, append=False, crawl_date=None, overwrite=False):
+        if append and overwrite:
+            raise ValueError("이어 쓰기와 덮어쓰기를 함께 지정할 수 없습니다.")
+        super().__init__(path, columns, max(batch_size, PARQUET_BATCH_SIZE), append)
+        self.crawl_date = crawl_date or time.strftime("%Y-%m-%d")
+        self._columns = list(columns) + [col for col in PARTITION_COLUMNS if col not in columns]
+        self._schema = arrow_schema(self._columns)
+        self._run_id = uuid.uuid4().hex[:8]
+        self._batches = 0
+        self.overwrite = overwrite
+        self._cleared = set()
+        os.makedirs(path, exist_ok=True)
+
+    def _project(self, record):
+        row = super()._project(record)
+        row['crawl_date'] = record.get('crawl_date') or self.crawl_date
+        row['source'] = record.get('source') or "unknown"
+        return row
+
+    def _write_batch(self, rows):
+        import pyarrow.parquet as pq
+        if self.overwrite:
+            clear_partitions(self.path, {tuple((col, row[col]) for col in PARTITION_COLUMNS) for row in rows},
+                             self._cleared)
+        pq.write_to_dataset(arrow_table(rows, self._columns), self.path, partition_cols=PARTITION_COLUMNS,
+                            basename_template=f"part-{self._run_id}-{self._batches}-{{i}}.parquet",
+                            existing_data_behavior="overwrite_or_ignore", **parquet_options(self._schema))
+        self._batches += 1
+
+
+class TeeSink:
+    """
+    같은 레코드를 여러 싱크에 함께 기록합니다 (예: CSV 파일 + 검색 색인).
+    count는 첫 번째 싱크의 기록 개수입니다.
+    """
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def path(self):
+        return self.sinks[0].path
+
+    @property
+    def count(self):
+        return self.sinks[0].count
+
+    def write(self, record):
+        for sink in self.sinks:
+            sink.write(record)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+SINK_TYPES = {".csv": CSVSink, ".jsonl": JSONLSink, ".parquet": ParquetSink}
+
+
+def open_sink(path, columns, batch_size=DEFAULT_BATCH_SIZE, append=False, overwrite=False):
+    """
+    파일 확장자(.csv / .jsonl / .parquet)에 맞는 싱크를 엽니다. 확장자가 없는 폴더 경로면 파티션 Parquet 데이터셋
+    (overwrite=True면 이번 실행이 기록하는 파티션만 지우고 다시 씀).
+    """
+    ext = os.path.splitext(path.rstrip("/\\"))[1].lower()
+    if not ext:
+        return PartitionedParquetSink(path, columns, batch_size=batch_size, append=append, overwrite=overwrite)
+    if ext not in SINK_TYPES:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {path}")
+    return SINK_TYPES[ext](path, columns, batch_size=batch_size, append=append)
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import os
+import time
+from metrics import metrics
+
+try:
+    import psutil  # 프로세스별 메모리 측정 (없으면 Linux는 /proc에서 직접 읽음)
+except ImportError:
+    psutil = None
+
+# --- 설정 ---
+MAX_NAVIGATIONS_PER_PAGE = 50  # 탭 하나로 이만큼 페이지를 이동하면 닫고 새 탭으로 교체
+RENDERER_RSS_LIMIT_MB = 1500   # 렌더러 프로세스 RSS 합계가 이를 넘으면 브라우저 컨텍스트를 새로 만듦
+SAMPLE_INTERVAL = 10.0         # 메모리 측정 간격 (초, 탭이 항목 하나를 마칠 때 확인)
+MEMORY_HISTORY_PATH = None     # 측정 기록을 JSON Lines로 저장 (예: "memory_history.jsonl")
+SUMMARY_POINTS = 8             # print_summary에 보여줄 측정 시점 수
+
+
+# --- 메모리 측정 ---
+def _proc_children():
+    """/proc에서 부모 pid → 자식 pid 목록."""
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", encoding="utf-8", errors="replace") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(name))
+    return children
+
+
+def _proc_rss_mb(pid):
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _proc_is_renderer(pid):
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        return b"--type=renderer" in f.read()
+
+
+def process_memory():
+    """
+    (Python RSS, 렌더러 RSS 합계, 브라우저 전체 RSS)를 MB로 반환합니다. 측정할 수 없는 값은 None.
+    브라우저 전체는 이 프로세스의 모든 자손 프로세스(Playwright 드라이버, 브라우저, GPU/렌더러 프로세스)의 합입니다.
+    """
+    if psutil is not None:
+        me = psutil.Process()
+        renderer = browser = 0.0
+        for child in me.children(recursive=True):
+            try:
+                rss = child.memory_info().rss / (1024 * 1024)
+                browser += rss
+                if "--type=renderer" in child.cmdline():
+                    renderer += rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return me.memory_info().rss / (1024 * 1024), renderer, browser
+    if not os.path.isdir("/proc"):
+        return None, None, None
+
+    children = _proc_children()
+    renderer = browser = 0.0
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            rss = _proc_rss_mb(pid)
+            browser += rss
+            if _proc_is_renderer(pid):
+                renderer += rss
+        except OSError:
+            continue
+    return _proc_rss_mb(os.getpid()), renderer, browser
+
+
+# --- 탭 / 컨텍스트 수명 관리 ---
+class BrowserLifecycle:
+    """
+    긴 수집에서 브라우저 메모리가 계속 늘지 않도록 탭과 컨텍스트를 주기적으로 새로 만듭니다.
+    - 탭은 max_navigations번 이동했거나, 죽었거나(crash), 이전 세대 컨텍스트에 속하면 항목 사이에서 새 탭으로 교체됩니다.
+      상세 탭은 공고마다, 목록 탭은 검색 결과 페이지마다 after_item()으로 확인합니다.
+    - 렌더러 RSS 합계가 renderer_limit_mb를 넘으면 새 컨텍스트를 만들고(setup으로 리소스 차단 등을 다시 등록),
+      이전 컨텍스트는 그 안의 탭이 하던 항목을 모두 마치고 닫힌 뒤에 닫습니다. 대기 중인 작업은 그대로 남습니다.
+    - 메모리(Python/렌더러/브라우저 RSS)는 sample_interval마다 기록하며 history와 print_summary로 확인합니다.
+    """
+
+    def __init__(self, browser, setup=None, max_navigations=MAX_NAVIGATIONS_PER_PAGE,
+                 renderer_limit_mb=RENDERER_RSS_LIMIT_MB, sample_interval=SAMPLE_INTERVAL,
+                 history_path=MEMORY_HISTORY_PATH, **context_options):
+        self.browser = browser
+        self.setup = setup  # async setup(context): 새 컨텍스트마다 호출 (예: ResourceBlocker.attach)
+        self.max_navigations = max_navigations
+        self.renderer_limit_mb = renderer_limit_mb
+        self.sample_interval = sample_interval
+        self.history_path = history_path
+        self.context_options = context_options
+        self.context = None
+        self._generation = 0
+        self._contexts = {}  # 세대 → [컨텍스트, 열린 탭 수]
+        self._pages = {}     # 탭 → {"generation", "navigations", "crashed"}
+        self._closing = set()
+        self._started = time.monotonic()
+        self._last_sample = None
+        self.history = []
+        self.pages_opened = 0
+        self.pages_recycled = 0
+        self.contexts_restarted = 0
+        self.crashes = 0
+
+    async def start(self):
+        await self._new_context()
+        await self.sample()
+        return self.context
+
+    async def _new_context(self):
+        context = await self.browser.new_context(**self.context_options)
+        if self.setup is not None:
+            await self.setup(context)
+        self._generation += 1
+        self._contexts[self._generation] = [context, 0]
+        self.context = context
+
+    async def new_page(self):
+        """현재 컨텍스트에 탭을 엽니다. 닫힐 때는 누가 닫든 자동으로 집계됩니다."""
+        generation = self._generation
+        page = await self.context.new_page()
+        state = {"generation": generation, "navigations": 0, "crashed": False}
+        self._pages[page] = state
+        self._contexts[generation][1] += 1
+        self.pages_opened += 1
+
+        def on_navigated(frame):
+            if frame == page.main_frame:
+                state["navigations"] += 1
+
+        def on_crash(_):
+            state["crashed"] = True
+            self.crashes += 1
+            metrics.count("lifecycle.page_crashed")
+
+        page.on("framenavigated", on_navigated)
+        page.on("crash", on_crash)
+        page.on("close", lambda _: self._on_close(page))
+        return page
+
+    def _on_close(self, page):
+        state = self._pages.pop(page, None)
+        if state is None:
+            return
+        entry = self._contexts.get(state["generation"])
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0 and state["generation"] != self._generation:
+            # 이전 세대 컨텍스트의 마지막 탭이 닫힘 → 컨텍스트도 닫음
+            del self._contexts[state["generation"]]
+            task = asyncio.ensure_future(self._close_context(entry[0]))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _close_context(self, context):
+        try:
+            await context.close()
+        except Exception as e:
+            print(f"[WARN] 이전 브라우저 컨텍스트 닫기 실패: {e}")
+
+    def crashed(self, page):
+        """탭이 죽었거나 이미 닫혔는지 확인합니다 (그 탭에서 실패한 항목은 다시 처리할 수 있음)."""
+        state = self._pages.get(page)
+        return state is None or state["crashed"] or page.is_closed()
+
+    async def after_item(self, page):
+        """
+        탭이 항목(상세 공고 하나, 또는 목록 페이지 하나)을 마칠 때 호출합니다.
+        메모리를 측정하고, 교체가 필요한 탭이면 닫고 새 탭을 반환합니다.
+        """
+        await self._maybe_sample()
+        state = self._pages.get(page)
+        if state is None or state["crashed"] or page.is_closed():
+            reason = "crash"
+        elif state["generation"] != self._generation:
+            reason = "context"
+        elif state["navigations"] >= self.max_navigations:
+            reason = "navigations"
+        else:
+            return page
+        self.pages_recycled += 1
+        metrics.count(f"lifecycle.page_recycled.{reason}")
+        if not page.is_closed():
+            try:
+                await page.close()
+            except Exception:
+                self._on_close(page)
+        return await self.new_page()
+
+    async def _maybe_sample(self):
+        now = time.monotonic()
+        if self._last_sample is not None and now - self._last_sample < self.sample_interval:
+            return
+        sample = await self.sample()
+        # 이전 세대 탭이 아직 남아 있으면 그 탭들이 정리될 때까지 다시 시작하지 않음 (반복 재시작 방지)
+        if (sample["renderer_mb"] is not None and sample["renderer_mb"] > self.renderer_limit_mb
+                and len(self._contexts) == 1):
+            print(f"[INFO] 렌더러 메모리 {sample['renderer_mb']:,.0f}MB > {self.renderer_limit_mb:,}MB, "
+                  f"브라우저 컨텍스트를 새로 만듭니다.")
+            await self.restart_context()
+
+    async def restart_context(self):
+        """새 컨텍스트를 만들어 이후의 탭은 그곳에서 열고, 이전 컨텍스트는 탭이 모두 교체되면 닫습니다."""
+        old_generation = self._generation
+        await self._new_context()
+        self.contexts_restarted += 1
+        metrics.count("lifecycle.context_restarted")
+        entry = self._contexts.get(old_generation)
+        if entry is not None and entry[1] <= 0:
+            del self._contexts[old_generation]
+            await self._close_context(entry[0])
+
+    async def sample(self):
+        """지금의 메모리와 탭/컨텍스트 수를 기록합니다."""
+        self._last_sample = time.monotonic()
+        # /proc 순회(프로세스마다 파일 읽기)는 느릴 수 있으므로 이벤트 루프를 막지 않도록 스레드에서 측정
+        python_mb, renderer_mb, browser_mb = await asyncio.to_thread(process_memory)
+        sample = {
+            "elapsed": round(self._last_sample - self._started, 1),
+            "python_mb": None if python_mb is None else round(python_mb, 1),
+            "renderer_mb": None if renderer_mb is None else round(renderer_mb, 1),
+            "browser_mb": None if browser_mb is None else round(browser_mb, 1),
+            "pages": len(self._pages),
+            "contexts": len(self._contexts),
+        }
+        self.history.append(sample)
+        for key in ("python_mb", "renderer_mb", "browser_mb"):
+            if sample[key] is not None:
+                metrics.observe(f"memory.{key}", sample[key], buckets=(64, 128, 256, 512, 1024, 2048, 4096, 8192))
+        if self.history_path:
+            with open(self.history_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(sample) + "\n")
+        return sample
+
+    async def close(self):
+        """모든 컨텍스트를 닫습니다 (브라우저는 호출 측이 닫음)."""
+        await self.sample()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        for context, _ in list(self._contexts.values()):
+            await self._close_context(context)
+        self._contexts.clear()
+
+    def summary(self):
+        def peak(key):
+            values = [sample[key] for sample in self.history if sample[key] is not None]
+            return max(values) if values else None
+
+        return {
+            "pages_opened": self.pages_opened,
+            "pages_recycled": self.pages_recycled,
+            "contexts_restarted": self.contexts_restarted,
+            "crashes": self.crashes,
+            "peak_python_mb": peak("python_mb"),
+            "peak_renderer_mb": peak("renderer_mb"),
+            "peak_browser_mb": peak("browser_mb"),
+            "samples": len(self.history),
+        }
+
+    def print_summary(self):
+        def mb(value):
+            return f"{value:,.0f}MB" if value is not None else "N/A"
+
+        s = self.summary()
+        print(f"[INFO] 탭/컨텍스트 수명 관리: 탭 {s['pages_opened']}개 열림 (교체 {s['pages_recycled']}회, "
+              f"crash {s['crashes']}회), 컨텍스트 재시작 {s['contexts_restarted']}회, "
+              f"최대 RSS Python {mb(s['peak_python_mb'])} / 렌더러 {mb(s['peak_renderer_mb'])} / "
+              f"브라우저 전체 {mb(s['peak_browser_mb'])}")
+        # 시간에 따른 메모리 변화 (고르게 고른 측정 시점 몇 개)
+        step = max(1, len(self.history) // SUMMARY_POINTS)
+        points = self.history[::step]
+        if self.history and points[-1] is not self.history[-1]:
+            points.append(self.history[-1])
+        for sample in points:
+            print(f"    {sample['elapsed']:>7.1f}s: Python {mb(sample['python_mb'])}, 렌더러 {mb(sample['renderer_mb'])}, "
+                  f"브라우저 전체 {mb(sample['browser_mb'])} (탭 {sample['pages']}개, 컨텍스트 {sample['contexts']}개)")
@@ -0,0 +1,118 @@
+import time
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from metrics import Histogram
+
+# --- 설정 ---
+INITIAL_TIMEOUT = 3.0    # 학습 전(전체 관측이 MIN_SAMPLES 미만일 때) 기다리는 최대 시간(초)
+MIN_TIMEOUT = 0.3
+MAX_TIMEOUT = 10.0
+MIN_SAMPLES = 10         # 이만큼 관측한 뒤부터 학습한 제한 시간을 사용 (표본이 적은 형태는 모든 형태의 관측으로 대신함)
+TIMEOUT_PERCENTILE = 0.95
+SAFETY_FACTOR = 2.0      # 학습한 제한 시간 = 관측 백분위 × 이 값
+MISS_PENALTY = 2.0       # 형태를 감지하지 못하면 학습한 제한 시간에 곱하는 값 (감지에 성공할 때마다 서서히 1로 돌아옴)
+PENALTY_DECAY = 0.9
+
+# --- 페이지 형태 ---
+# 형태 이름 → CSS 선택자 (여러 형태가 함께 있으면 앞에 있는 형태로 판정)
+SARAMIN_DETAIL_LAYOUTS = {
+    "iframe": "iframe[id^='iframe_content']",
+    "inline": "div.job_definition",
+    "description": ".job_description",
+    "image": 'img[src*="view_img"]',
+}
+# 상세 본문 iframe 안의 형태 (이미지 공고도 본문 영역 안에 있으므로 이미지를 먼저 판정)
+SARAMIN_FRAME_LAYOUTS = {
+    "image": 'img[src*="view_img"]',
+    "inline": "div.job_definition",
+    "description": ".job_description",
+    "text": ".user_content",
+}
+
+# 브라우저 안에서 실행: 선택자가 처음으로 일치하는 형태 이름
+_MATCH_JS = """
+(root, layouts) => {
+    for (const [name, selector] of layouts) {
+        if (root.querySelector(selector)) return name;
+    }
+    return null;
+}
+"""
+
+
+class PageReadiness:
+    """
+    알려진 페이지 형태의 선택자를 한꺼번에 기다려, 가장 먼저 나타난 형태에서 바로 준비 완료로 판단합니다.
+    - 모든 선택자를 하나의 선택자 목록(a, b, c)으로 기다리므로 브라우저 왕복 한 번으로 경쟁시킵니다.
+    - 형태별로 준비까지 걸린 시간을 관측해 제한 시간을 학습합니다
+      (관측한 형태마다 백분위 × SAFETY_FACTOR 중 가장 긴 값). 표본이 적은 형태는 모든 형태를 합친 관측의 백분위를
+      대신 쓰므로, 드문 형태 때문에 매번 INITIAL_TIMEOUT까지 기다리지 않습니다.
+      학습한 시간이 너무 짧아 감지에 실패하면 제한 시간을 늘렸다가, 감지에 성공할수록 다시 줄입니다.
+    - 어느 형태도 나타나지 않으면 None을 반환하고, 호출 측이 페이지 전체를 대상으로 처리합니다.
+    """
+
+    def __init__(self, layouts, initial_timeout=INITIAL_TIMEOUT):
+        self.layouts = list(layouts.items())
+        self.selector = ", ".join(selector for _, selector in self.layouts)
+        self.initial_timeout = initial_timeout
+        self.timings = {}  # 형태 이름 → Histogram (준비까지 걸린 시간)
+        self.overall = Histogram()  # 모든 형태를 합친 준비 시간
+        self.misses = 0
+        self.waited_on_miss = 0.0
+        self.penalty = 1.0
+
+    def learned_timeout(self, layout):
+        """형태의 학습한 제한 시간. 그 형태의 표본이 적으면 전체 관측으로 계산하고, 전체도 적으면 None."""
+        histogram = self.timings.get(layout)
+        if histogram is None or histogram.count < MIN_SAMPLES:
+            histogram = self.overall
+        if histogram.count < MIN_SAMPLES:
+            return None
+        return min(MAX_TIMEOUT, max(MIN_TIMEOUT, histogram.percentile(TIMEOUT_PERCENTILE) * SAFETY_FACTOR))
+
+    def timeout(self):
+        """이번 대기의 제한 시간(초)."""
+        if self.overall.count < MIN_SAMPLES:
+            return self.initial_timeout
+        return min(MAX_TIMEOUT, max(self.learned_timeout(layout) for layout in self.timings) * self.penalty)
+
+    async def wait(self, context):
+        """
+        context(Page, Frame 또는 FrameLocator)에 알려진 형태 중 하나가 나타날 때까지 기다려 그 형태 이름을 반환합니다.
+        제한 시간 안에 나타나지 않으면 None.
+        """
+        timeout = self.timeout()
+        start = time.perf_counter()
+        try:
+            await context.locator(self.selector).first.wait_for(state="attached", timeout=timeout * 1000)
+        except PlaywrightTimeoutError:
+            self.misses += 1
+            self.waited_on_miss += time.perf_counter() - start
+            self.penalty = min(MAX_TIMEOUT / MIN_TIMEOUT, self.penalty * MISS_PENALTY)
+            return None
+        elapsed = time.perf_counter() - start
+        self.penalty = max(1.0, self.penalty * PENALTY_DECAY)
+        layout = await context.locator(":root").evaluate(_MATCH_JS, self.layouts)
+        if layout is not None:
+            histogram = self.timings.get(layout)
+            if histogram is None:
+                histogram = self.timings[layout] = Histogram()
+            histogram.observe(elapsed)
+            self.overall.observe(elapsed)
+        return layout
+
+    def summary(self):
+        return {
+            "timeout": self.timeout(),
+            "misses": self.misses,
+            "waited_on_miss": self.waited_on_miss,
+            "layouts": {
+                layout: {**histogram.summary(), "learned_timeout": self.learned_timeout(layout)}
+                for layout, histogram in self.timings.items()
+            },
+        }
+
+    def print_summary(self, name="상세 페이지"):
+        s = self.summary()
+        layouts = ", ".join(f"{layout} {l['count']}건 (p50 {l['p50']:.2f}s)" for layout, l in s["layouts"].items())
+        print(f"[INFO] {name} 준비 감지: {layouts or '관측 없음'}, 미감지 {s['misses']}건 "
+              f"(대기 {s['waited_on_miss']:.1f}s), 현재 제한 시간 {s['timeout']:.2f}s")
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import sqlite3
+import time
+from urllib.parse import urlparse, parse_qs
+
+# --- 설정 ---
+STORE_PATH = "postings.sqlite3"
+REFETCH_AFTER_DAYS = 7  # 목록 정보가 같아도 이 기간이 지나면 상세 내용을 다시 수집
+SQLITE_TIMEOUT = 30  # 여러 프로세스가 함께 쓸 때 잠금 대기 시간(초)
+SARAMIN_VIEW_PATH = "/zf_user/jobs/relay/view"
+
+
+# --- 링크 정규화 ---
+def extract_rec_idx(link):
+    """사람인 공고 링크에서 rec_idx를 추출합니다. 없으면 None."""
+    if not link:
+        return None
+    values = parse_qs(urlparse(link).query).get('rec_idx')
+    return values[0] if values else None
+
+
+def canonicalize_link(link):
+    """
+    검색마다 달라지는 파라미터(search_uuid, searchword, location 등)를 제거한 공고 링크를 반환합니다.
+    호스트는 원래 링크의 것을 그대로 쓰므로 로컬 목 서버(mock_server.py)의 링크도 그 서버를 가리킵니다.
+    """
+    rec_idx = extract_rec_idx(link)
+    if rec_idx is None:
+        return link
+    parsed = urlparse(link)
+    return f"{parsed.scheme}://{parsed.netloc}{SARAMIN_VIEW_PATH}?rec_idx={rec_idx}"
+
+
+def listing_hash(base_info):
+    """목록 단계에서 알 수 있는 정보(제목/회사)의 해시. 공고 수정 여부를 판단하는 데 사용합니다."""
+    key = f"{base_info.get('title', '')}\x1f{base_info.get('company', '')}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+CONTENT_FIELDS = ['responsibilities', 'qualifications', 'preferred', 'benefits']  # 본문 변경 여부를 비교할 필드
+
+
+def content_hash(record):
+    """상세 본문 필드의 해시. 다시 수집한 공고의 본문이 바뀌었는지 비교하는 데 사용합니다."""
+    body = json.dumps([record.get(field) for field in CONTENT_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+
+# --- 저장소 ---
+class PostingStore:
+    """
+    rec_idx를 키로 이미 수집한 공고를 SQLite에 기록하는 증분 수집용 저장소입니다.
+    - 목록 해시가 같고 마지막 수집 후 REFETCH_AFTER_DAYS가 지나지 않았으면 상세 수집을 건너뜁니다.
+      (목록만으로는 본문 수정을 알 수 없으므로, 제목/회사가 그대로인 공고의 본문 수정은 다시 수집할 때 발견됩니다.)
+    - 다시 수집한 공고는 save()에서 본문 해시를 비교해 신규/본문 변경/변경 없음으로 구분해 집계합니다.
+    """
+
+    def __init__(self, path=STORE_PATH, refetch_after_days=REFETCH_AFTER_DAYS):
+        self.conn = sqlite3.connect(path, timeout=SQLITE_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # 샤드 프로세스들이 동시에 읽고 쓸 수 있도록
+        self.refetch_after = refetch_after_days * 86400
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS postings (
+                rec_idx TEXT PRIMARY KEY,
+                link TEXT NOT NULL,
+                listing_hash TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                record TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                last_fetched REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.skipped = 0
+        self.fetched = {"new": 0, "changed": 0, "unchanged": 0}
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def lookup_unchanged(self, base_info):
+        """변경되지 않은 공고면 저장된 레코드를, 새로 수집해야 하면 None을 반환합니다."""
+        rec_idx = extract_rec_idx(base_info.get('link'))
+        if rec_idx is None:
+            return None
+        row = self.conn.execute(
+            "SELECT listing_hash, record, last_fetched FROM postings WHERE rec_idx = ?", (rec_idx,)
+        ).fetchone()
+        if row is None:
+            return None
+        stored_listing_hash, record, last_fetched = row
+        now = time.time()
+        if stored_listing_hash != listing_hash(base_info) or now - last_fetched > self.refetch_after:
+            return None
+        self.conn.execute("UPDATE postings SET last_seen = ? WHERE rec_idx = ?", (now, rec_idx))
+        self.conn.commit()
+        self.skipped += 1
+        return json.loads(record)
+
+    def save(self, record):
+        """
+        상세 수집을 마친 공고를 기록하고, 저장돼 있던 본문과 비교한 결과('new' / 'changed' / 'unchanged')를 반환합니다.
+        링크에 rec_idx가 없으면 기록하지 않고 None.
+        """
+        rec_idx = extract_rec_idx(record.get('link'))
+        if rec_idx is None:
+            return None
+        now = time.time()
+        new_hash = content_hash(record)
+        row = self.conn.execute("SELECT content_hash FROM postings WHERE rec_idx = ?", (rec_idx,)).fetchone()
+        status = "new" if row is None else "changed" if row[0] != new_hash else "unchanged"
+        self.conn.execute("""
+            INSERT INTO postings (rec_idx, link, listing_hash, content_hash, record, first_seen, last_seen, last_fetched)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(rec_idx) DO UPDATE SET
+                link = excluded.link, listing_hash = excluded.listing_hash,
+                content_hash = excluded.content_hash, record = excluded.record,
+                last_seen = excluded.last_seen, last_fetched = excluded.last_fetched
+        """, (rec_idx, canonicalize_link(record['link']), listing_hash(record),
+              new_hash, json.dumps(record, ensure_ascii=False), now, now, now))
+        self.conn.commit()
+        self.fetched[status] += 1
+        return status
+
+    def print_summary(self):
+        print(f"[INFO] 증분 수집: 상세 {sum(self.fetched.values())}건 수집 (신규 {self.fetched['new']}건, "
+              f"본문 변경 {self.fetched['changed']}건, 다시 수집했지만 변경 없음 {self.fetched['unchanged']}건), "
+              f"목록 정보가 같아 {self.skipped}건 건너뜀")
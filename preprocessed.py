@@ -1,51 +1,208 @@
+import argparse
+import os
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-import re
-import emoji
+from text_normalizer import normalize_text
+from output_sinks import dictionary_encode, parquet_options, clear_partitions, PARTITION_COLUMNS
+from metrics import metrics
+
+# --- 설정 ---
+DEFAULT_CHUNK_SIZE = 20000  # 청크 모드에서 한 번에 읽는 행 수
 
 def clean_text(text):
-    """모든 이모지 제거 + 글머리 기호 정리 + 가독성 향상"""
-    if pd.isna(text):
-        return text
-    
-    # 1. 모든 이모지 제거 (emoji 라이브러리 사용)
-    text = emoji.replace_emoji(text, replace='')
-    
-    # 2. 글머리 기호 줄바꿈 처리 (•, -, · 등 → \n- )
-    text = re.sub(r'\s*[•\-\·]\s*', r'\n- ', text)
-    
-    # 3. 연속 공백 제거
-    text = re.sub(r'\s{2,}', ' ', text)
-    
-    # 4. 특수문자 정리 (불필요한 기호 제거)
-    text = re.sub(r'[|※]', ' ', text)
-    
-    # 5. 문장부호 정리
-    text = re.sub(r'\.{2,}', '…', text)   # ... -> …
-    text = re.sub(r',,', ',', text)       # ,, -> ,
-    text = re.sub(r'\?{2,}', '?', text)   # ?? -> ?
-    
-    # 6. 주요 키워드 구분선 추가
-    keywords = ["자격요건", "주요업무", "우대사항", "복리후생", "근무조건", "모집부문", "전형절차"]
-    for kw in keywords:
-        text = re.sub(rf'\s*{kw}', f'\n\n=== {kw} ===', text)
-    
-    # 7. 한글-영어 사이 띄어쓰기 보정
-    text = re.sub(r'([가-힣])([A-Za-z])', r'\1 \2', text)
-    text = re.sub(r'([A-Za-z])([가-힣])', r'\1 \2', text)
-    
-    # 8. 중복 줄바꿈 제거
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    return text.strip()
-
-def process_csv(input_file, output_file, target_column="responsibilities"):
-    """CSV 파일을 정제하고 새로운 파일 저장"""
-    df = pd.read_csv(input_file)
-    df[f"{target_column}_cleaned"] = df[target_column].apply(clean_text)
-    df.to_csv(output_file, index=False, encoding="utf-8-sig")
-    print(f"✅ 정제된 파일이 저장되었습니다: {output_file}")
+    """모든 이모지 제거 + 글머리 기호 정리 + 가독성 향상 (text_normalizer의 'preprocessed' 프로필)"""
+    return normalize_text(text, "preprocessed")
+
+def clean_values(values):
+    """작업 프로세스에서 실행: 값 목록을 정제해 같은 순서로 반환"""
+    return [clean_text(value) for value in values]
+
+# --- 입출력 (CSV / Parquet 파일 / 파티션 Parquet 데이터셋) ---
+def is_parquet(path):
+    """.parquet 파일이나 확장자 없는 폴더(output_sinks의 파티션 데이터셋)면 True."""
+    ext = os.path.splitext(path.rstrip("/\\"))[1].lower()
+    return ext == ".parquet" or not ext
+
+def parquet_dataset(path):
+    import pyarrow.dataset as ds
+    return ds.dataset(path, format="parquet", partitioning="hive")
+
+def read_frame(path, columns=None):
+    """파일 전체를 읽습니다. columns를 주면 그 열만 읽습니다 (Parquet는 해당 열의 데이터만 디스크에서 읽음)."""
+    if is_parquet(path):
+        return parquet_dataset(path).to_table(columns=columns).to_pandas()
+    return pd.read_csv(path, usecols=columns)
+
+def iter_frames(path, chunksize, columns=None):
+    """최대 chunksize행씩 DataFrame으로 읽습니다."""
+    if is_parquet(path):
+        for batch in parquet_dataset(path).to_batches(columns=columns, batch_size=chunksize):
+            if batch.num_rows:
+                yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns)
+
+def read_columns(path, columns=None):
+    """데이터 행 없이 열 이름만 읽습니다."""
+    if is_parquet(path):
+        names = parquet_dataset(path).schema.names
+        return [name for name in names if columns is None or name in columns]
+    return list(pd.read_csv(path, nrows=0, usecols=columns).columns)
+
+class FrameWriter:
+    """
+    정제 결과를 청크마다 이어 씁니다. 출력 경로의 확장자로 형식을 정합니다.
+    - .csv: UTF-8-BOM CSV, .parquet: row group을 이어 붙인 Parquet 파일 하나
+    - 확장자 없는 폴더: crawl_date/source로 나눈 Parquet 데이터셋 (crawl_date 열이 없으면 오늘 날짜).
+      기존 파일은 지우지 않고 실행 id를 붙인 새 파일을 추가하며, overwrite=True일 때만 기록하는 파티션을 먼저 지웁니다.
+    - Parquet는 반복되는 열(source, company 등)을 사전 인코딩하고 압축합니다.
+    """
+
+    def __init__(self, path, overwrite=False):
+        self.path = path
+        self.ext = os.path.splitext(path.rstrip("/\\"))[1].lower()
+        self.overwrite = overwrite
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+        self._parts = 0
+        self._run_id = uuid.uuid4().hex[:8]
+        self._cleared = set()
+
+    def _table(self, df):
+        import pyarrow as pa
+        table = dictionary_encode(pa.Table.from_pandas(df, preserve_index=False))
+        if self._schema is None:
+            self._schema = table.schema
+        return table.cast(self._schema)
+
+    def write(self, df):
+        if self.ext == ".csv":
+            df.to_csv(self.path, index=False, mode="a" if self.rows else "w", header=not self.rows,
+                      encoding="utf-8" if self.rows else "utf-8-sig")
+        elif self.ext == ".parquet":
+            import pyarrow.parquet as pq
+            table = self._table(df)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, self._schema, **parquet_options(self._schema))
+            self._writer.write_table(table)
+        else:
+            import pyarrow.parquet as pq
+            if "crawl_date" not in df.columns:
+                df = df.assign(crawl_date=time.strftime("%Y-%m-%d"))
+            partition_cols = [col for col in PARTITION_COLUMNS if col in df.columns]
+            if self.overwrite:
+                clear_partitions(self.path, {tuple(zip(partition_cols, values))
+                                             for values in df[partition_cols].drop_duplicates().itertuples(index=False)},
+                                 self._cleared)
+            table = self._table(df)
+            pq.write_to_dataset(table, self.path, partition_cols=partition_cols,
+                                basename_template=f"part-{self._run_id}-{self._parts}-{{i}}.parquet",
+                                existing_data_behavior="overwrite_or_ignore", **parquet_options(self._schema))
+            self._parts += 1
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+# --- 정제 ---
+def process_csv(input_file, output_file, target_column="responsibilities", chunksize=None, workers=None, columns=None,
+                overwrite=False):
+    """
+    CSV(또는 Parquet 파일/데이터셋)를 정제하고 새로운 파일 저장
+    - chunksize를 주면 청크 단위로 읽어 프로세스 풀에서 정제하고, 원래 행 순서대로 바로바로 기록합니다.
+    - columns를 주면 그 열(과 target_column)만 읽고 기록합니다. Parquet 입력은 나머지 열을 디스크에서 읽지도 않습니다.
+    - 출력이 Parquet 데이터셋 폴더면 overwrite=True일 때만 기록하는 파티션의 기존 파일을 지웁니다.
+    """
+    if os.path.abspath(input_file) == os.path.abspath(output_file):
+        raise ValueError("입력과 출력 경로가 같습니다.")
+    if columns is not None and target_column not in columns:
+        columns = list(columns) + [target_column]
+    if chunksize:
+        return process_csv_chunked(input_file, output_file, target_column, chunksize, workers, columns, overwrite)
+
+    start = time.perf_counter()
+    with metrics.timer("preprocess.read"):
+        df = read_frame(input_file, columns)
+    with metrics.timer("preprocess.clean"):
+        df[f"{target_column}_cleaned"] = df[target_column].apply(clean_text)
+    with metrics.timer("preprocess.write"):
+        writer = FrameWriter(output_file, overwrite)
+        writer.write(df)
+        writer.close()
+    metrics.count("preprocess.rows", len(df))
+    elapsed = time.perf_counter() - start
+    print(f"✅ 정제된 파일이 저장되었습니다: {output_file} ({len(df)}행, {len(df) / elapsed:,.0f} rows/sec)")
+
+def timed_chunks(reader):
+    """청크를 하나씩 읽는 데 걸린 시간을 기록하며 그대로 넘겨줍니다."""
+    while True:
+        with metrics.timer("preprocess.read"):
+            chunk = next(reader, None)
+        if chunk is None:
+            return
+        yield chunk
+
+def process_csv_chunked(input_file, output_file, target_column="responsibilities",
+                        chunksize=DEFAULT_CHUNK_SIZE, workers=None, columns=None, overwrite=False):
+    """청크 스트리밍 + 멀티코어 정제. 동시에 처리 중인 청크는 작업자 수의 2배로 제한해 메모리를 일정하게 유지합니다."""
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    total_rows = 0
+    pending = deque()
+    writer = FrameWriter(output_file, overwrite)
+
+    def write_next():
+        nonlocal total_rows
+        chunk, future = pending.popleft()
+        # 작업 프로세스의 정제 결과를 기다린 시간 (길면 작업자 수가 부족하다는 뜻)
+        with metrics.timer("preprocess.clean_wait"):
+            chunk[f"{target_column}_cleaned"] = future.result()
+        with metrics.timer("preprocess.write"):
+            writer.write(chunk)
+        total_rows += len(chunk)
+        metrics.count("preprocess.rows", len(chunk))
+        metrics.count("preprocess.chunks")
+        elapsed = time.perf_counter() - start
+        print(f"[INFO] {total_rows:,}행 처리 ({total_rows / elapsed:,.0f} rows/sec)")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in timed_chunks(iter_frames(input_file, chunksize, columns)):
+            # 청크 전체 대신 정제할 열의 값만 작업 프로세스로 보냄
+            pending.append((chunk, executor.submit(clean_values, chunk[target_column].tolist())))
+            if len(pending) >= workers * 2:
+                write_next()
+        while pending:
+            write_next()
+
+    if not total_rows:
+        # 입력에 데이터 행이 없으면 헤더(열 이름)만 기록
+        writer.write(pd.DataFrame(columns=read_columns(input_file, columns) + [f"{target_column}_cleaned"]))
+    writer.close()
+    elapsed = time.perf_counter() - start
+    print(f"✅ 정제된 파일이 저장되었습니다: {output_file} "
+          f"({total_rows:,}행, 작업자 {workers}개, {total_rows / elapsed if elapsed else 0:,.0f} rows/sec)")
 
 if __name__ == "__main__":
-    input_path = "saramin_cleaned.csv"      
-    output_path = "saramin_cleaned_final.csv"  
-    process_csv(input_path, output_path)
+    parser = argparse.ArgumentParser(description="채용 공고 CSV / Parquet 정제")
+    parser.add_argument("input_path", nargs="?", default="saramin_cleaned.csv",
+                        help="입력 (.csv / .parquet / 파티션 Parquet 데이터셋 폴더)")
+    parser.add_argument("output_path", nargs="?", default="saramin_cleaned_final.csv",
+                        help="출력 (.csv / .parquet / 확장자 없는 폴더면 crawl_date/source 파티션 데이터셋)")
+    parser.add_argument("--column", default="responsibilities", help="정제할 열 이름")
+    parser.add_argument("--columns", nargs="+", default=None, help="읽고 기록할 열만 지정 (정제할 열은 자동 포함)")
+    parser.add_argument("--chunksize", type=int, default=None, help="청크 단위 스트리밍 모드 (예: 20000)")
+    parser.add_argument("--workers", type=int, default=None, help="청크 모드의 작업 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--metrics", default=None, help="단계별 측정값을 저장할 경로 (확장자 없이, .json / .prom 생성)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="출력이 Parquet 데이터셋 폴더일 때 기록하는 crawl_date/source 파티션의 기존 파일을 지움")
+    args = parser.parse_args()
+    process_csv(args.input_path, args.output_path, args.column, args.chunksize, args.workers, args.columns,
+                args.overwrite)
+    metrics.print_summary()
+    if args.metrics:
+        metrics.export(args.metrics)
@@ -0,0 +1,233 @@
+import asyncio
+import random
+import time
+from urllib.parse import urlparse
+import httpx
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+# --- 설정 ---
+INITIAL_RATE = 2.0            # 호스트별 시작 요청 속도 (요청/초)
+MIN_RATE = 0.2
+MAX_RATE = 10.0
+BURST = 4                     # 토큰 버킷 크기 (순간적으로 몰아 보낼 수 있는 요청 수)
+TARGET_LATENCY = 3.0          # 평균 응답 시간이 이보다 길면 서버가 힘들어하는 것으로 보고 속도를 낮춤
+ADDITIVE_INCREASE = 0.2       # 성공할 때마다 올리는 속도 (요청/초)
+FAILURE_DECREASE = 0.5        # 실패(429/타임아웃)하면 속도에 곱하는 값
+SLOW_DECREASE = 0.9           # 응답이 느리면 속도에 곱하는 값
+EWMA_ALPHA = 0.2              # 지연 시간/오류율 지수 이동 평균 가중치
+ERROR_RATE_THRESHOLD = 0.2    # 최근 오류율이 이보다 높으면 성공해도 속도를 올리지 않고 오류율에 비례해 낮춤
+MAX_RETRIES = 4               # 재시도 가능한 오류의 최대 재시도 횟수
+BACKOFF_BASE = 0.5            # 재시도 대기: 0 ~ min(BACKOFF_CAP, BACKOFF_BASE * 2^시도) 사이의 무작위 값
+BACKOFF_CAP = 30.0
+FAILURE_THRESHOLD = 5         # 연속 실패가 이만큼 쌓이면 회로를 열어 호스트를 잠시 멈춤
+COOLDOWN_SECONDS = 30.0
+THROTTLE_STATUSES = {429, 503}
+
+
+class ThrottledError(Exception):
+    """서버가 속도 제한 상태 코드(429/503)로 응답했을 때 발생시킵니다."""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class ServerError(Exception):
+    """서버가 5xx(429/503 제외)로 응답했을 때 발생시킵니다. 재시도하지 않지만 호스트의 오류율과 속도에 반영됩니다."""
+
+    def __init__(self, status, response=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.response = response
+
+
+# 재시도할 오류 (그 밖의 오류는 바로 호출 측으로 전달)
+RETRYABLE_ERRORS = (ThrottledError, PlaywrightTimeoutError, httpx.TransportError, asyncio.TimeoutError, ConnectionError)
+# page.goto()는 연결 끊김/거부 등을 일반 Error("net::ERR_CONNECTION_RESET ...")로 내므로 메시지로 구분해 재시도
+# (탭이 닫힌 경우 등 다른 Playwright 오류는 재시도하지 않음)
+RETRYABLE_NETWORK_ERROR = "net::ERR_"
+
+
+def is_retryable(error, retry_on=RETRYABLE_ERRORS):
+    """재시도할 오류인지 확인합니다."""
+    if isinstance(error, retry_on):
+        return True
+    return isinstance(error, PlaywrightError) and RETRYABLE_NETWORK_ERROR in str(error)
+
+
+def retry_after_seconds(value):
+    """Retry-After 헤더(초 단위)를 숫자로 바꿉니다. 없거나 날짜 형식이면 None."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class HostState:
+    """호스트 하나의 토큰 버킷, 적응형 속도, 회로 차단기 상태. 속도 관련 설정은 share배로 줄여 씁니다."""
+
+    def __init__(self, host, share=1.0):
+        self.host = host
+        self.min_rate = MIN_RATE * share
+        self.max_rate = MAX_RATE * share
+        self.increase = ADDITIVE_INCREASE * share
+        self.burst = max(1.0, BURST * share)
+        self.rate = INITIAL_RATE * share
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.ewma_latency = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.throttled = 0
+        self.retries = 0
+        self.circuit_opens = 0
+
+
+class RateLimiter:
+    """
+    호스트별 적응형 요청 스케줄러입니다.
+    - 토큰 버킷으로 요청 간격을 조절하고, 성공하면 속도를 조금씩 올리고 429/타임아웃/5xx가 나면 크게 낮춥니다 (AIMD).
+      평균 응답 시간이 TARGET_LATENCY를 넘거나, 최근 오류율이 ERROR_RATE_THRESHOLD를 넘으면 성공해도 속도를 낮춥니다.
+    - 재시도 가능한 오류(429/503, 타임아웃, 연결 오류, Playwright의 net::ERR_*)는 지터가 섞인 지수 백오프로
+      재시도합니다 (Retry-After 헤더가 있으면 그 이상 대기).
+    - 연속 실패가 FAILURE_THRESHOLD에 이르면 회로를 열어 COOLDOWN_SECONDS 동안 그 호스트의 요청을 멈춥니다.
+      다시 열린 뒤 첫 요청이 실패하면 곧바로 다시 멈춥니다.
+    - 여러 프로세스가 같은 호스트에 요청하면 share(예: 1/프로세스 수)를 주어 속도/버스트를 나눠 씁니다.
+      상태는 프로세스마다 따로이므로 한 프로세스의 백오프가 다른 프로세스를 늦추지는 않습니다.
+    """
+
+    def __init__(self, max_retries=MAX_RETRIES, retry_on=RETRYABLE_ERRORS, share=1.0):
+        self.max_retries = max_retries
+        self.retry_on = retry_on
+        self.share = share
+        self.hosts = {}
+
+    def _host(self, url):
+        host = urlparse(url).netloc
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = HostState(host, self.share)
+        return state
+
+    async def acquire(self, url):
+        """회로가 닫혀 있고 토큰이 있을 때까지 기다린 뒤 요청 하나를 허용합니다."""
+        state = self._host(url)
+        async with state.lock:
+            while True:
+                now = time.monotonic()
+                if state.open_until > now:
+                    await asyncio.sleep(state.open_until - now)
+                    continue
+                state.tokens = min(state.burst, state.tokens + (now - state.updated) * state.rate)
+                state.updated = now
+                if state.tokens >= 1:
+                    state.tokens -= 1
+                    state.requests += 1
+                    return state
+                await asyncio.sleep((1 - state.tokens) / state.rate)
+
+    def _on_success(self, state, latency):
+        state.consecutive_failures = 0
+        state.error_rate *= 1 - EWMA_ALPHA
+        if state.ewma_latency is None:
+            state.ewma_latency = latency
+        else:
+            state.ewma_latency = (1 - EWMA_ALPHA) * state.ewma_latency + EWMA_ALPHA * latency
+        if state.ewma_latency > TARGET_LATENCY:
+            state.rate = max(state.min_rate, state.rate * SLOW_DECREASE)
+        elif state.error_rate > ERROR_RATE_THRESHOLD:
+            # 오류가 계속 섞여 나오는 호스트는 회로가 열릴 때까지 기다리지 않고 오류율만큼 속도를 줄임
+            state.rate = max(state.min_rate, state.rate * (1 - state.error_rate / 2))
+        else:
+            state.rate = min(state.max_rate, state.rate + state.increase)
+
+    def _on_failure(self, state, error):
+        state.failures += 1
+        if isinstance(error, ThrottledError):
+            state.throttled += 1
+        state.error_rate = (1 - EWMA_ALPHA) * state.error_rate + EWMA_ALPHA
+        state.rate = max(state.min_rate, state.rate * FAILURE_DECREASE)
+        state.consecutive_failures += 1
+        if state.consecutive_failures >= FAILURE_THRESHOLD:
+            state.open_until = time.monotonic() + COOLDOWN_SECONDS
+            state.circuit_opens += 1
+            # 다시 열린 뒤 한 번만 더 실패해도 바로 멈추도록 (half-open)
+            state.consecutive_failures = FAILURE_THRESHOLD - 1
+            print(f"[WARN] {state.host}: 연속 실패로 {COOLDOWN_SECONDS:.0f}초 동안 요청을 멈춥니다 "
+                  f"(속도 {state.rate:.2f}/s로 낮춤)")
+
+    async def call(self, url, func):
+        """
+        func()(코루틴 함수)를 url의 호스트 속도 제한 안에서 실행합니다.
+        재시도 가능한 오류는 백오프 후 다시 시도하고, 마지막 시도까지 실패하면 그 오류를 그대로 발생시킵니다.
+        """
+        for attempt in range(self.max_retries + 1):
+            state = await self.acquire(url)
+            start = time.monotonic()
+            try:
+                result = await func()
+            except Exception as e:
+                if isinstance(e, ServerError):
+                    self._on_failure(state, e)
+                    raise
+                if not is_retryable(e, self.retry_on):
+                    raise
+                self._on_failure(state, e)
+                if attempt == self.max_retries:
+                    raise
+                delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+                if isinstance(e, ThrottledError) and e.retry_after is not None:
+                    delay = max(delay, e.retry_after)
+                state.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            self._on_success(state, time.monotonic() - start)
+            return result
+
+    def summary(self):
+        return {
+            host: {
+                "rate": state.rate,
+                "requests": state.requests,
+                "failures": state.failures,
+                "throttled": state.throttled,
+                "retries": state.retries,
+                "circuit_opens": state.circuit_opens,
+                "error_rate": state.error_rate,
+                "latency_ewma": state.ewma_latency or 0.0,
+            }
+            for host, state in self.hosts.items()
+        }
+
+    def print_summary(self):
+        for host, s in self.summary().items():
+            print(f"[INFO] 속도 제한 {host}: 요청 {s['requests']}회, 실패 {s['failures']}회 (429/503 {s['throttled']}회), "
+                  f"재시도 {s['retries']}회, 회로 차단 {s['circuit_opens']}회, 최종 속도 {s['rate']:.2f}/s, "
+                  f"평균 지연 {s['latency_ewma']:.2f}s")
+
+
+async def limited_goto(page, url, limiter=None, **kwargs):
+    """
+    page.goto()를 속도 제한/재시도 안에서 실행합니다. 429/503 응답은 ThrottledError로 바꿔 재시도하고,
+    그 밖의 5xx 응답은 재시도 없이 그대로 반환하되 호스트의 오류율에 반영합니다.
+    """
+    if limiter is None:
+        return await page.goto(url, **kwargs)
+
+    async def navigate():
+        response = await page.goto(url, **kwargs)
+        if response is not None and response.status in THROTTLE_STATUSES:
+            raise ThrottledError(response.status, retry_after_seconds(await response.header_value("retry-after")))
+        if response is not None and response.status >= 500:
+            raise ServerError(response.status, response)
+        return response
+
+    try:
+        return await limiter.call(url, navigate)
+    except ServerError as e:
+        return e.response
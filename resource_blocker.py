@@ -0,0 +1,114 @@
+from urllib.parse import urlparse
+
+# --- 크롤 모드별 차단 프로필 ---
+# block_types: 차단할 리소스 유형 (Playwright request.resource_type 기준)
+# allow_hosts: 유형과 상관없이 항상 허용할 호스트 (접미사 일치)
+# deny_hosts: 유형과 상관없이 항상 차단할 호스트 (광고/트래커 등, 접미사 일치)
+# deny_keywords: 호스트 이름에 이 문자열이 들어 있으면 차단 (도메인을 특정하기 어려운 트래커용)
+# image_hosts: OCR이 필요한 경우에만 이미지를 허용할 호스트 (접미사 일치)
+AD_TRACKER_HOSTS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "googleadservices.com", "facebook.net", "facebook.com", "criteo.com", "criteo.net",
+    "adnxs.com", "mobon.net", "dable.io", "analytics.naver.com",
+    "wcs.naver.net", "scorecardresearch.com", "hotjar.com", "clarity.ms",
+]
+AD_TRACKER_KEYWORDS = ["kakaopixel"]
+
+CRAWL_PROFILES = {
+    # 모든 리소스를 그대로 받음 (차단 없음)
+    "full": None,
+    # 텍스트 추출 전용: DOM과 iframe_content 프레임만 필요
+    "text": {
+        "block_types": {"image", "media", "font", "stylesheet", "imageset", "texttrack", "beacon", "ping"},
+        "allow_hosts": [],
+        "deny_hosts": AD_TRACKER_HOSTS,
+        "deny_keywords": AD_TRACKER_KEYWORDS,
+        "image_hosts": [],
+    },
+    # OCR용 스크린샷: 스타일과 채용 사이트(image_hosts)의 본문 이미지만 받고, 다른 호스트의 이미지와 나머지는 차단
+    "ocr": {
+        "block_types": {"image", "imageset", "media", "texttrack", "beacon", "ping"},
+        "allow_hosts": [],
+        "deny_hosts": AD_TRACKER_HOSTS,
+        "deny_keywords": AD_TRACKER_KEYWORDS,
+        "image_hosts": ["saramin.co.kr", "saraminimage.co.kr", "jobkorea.co.kr", "jkassets.com"],
+    },
+}
+
+# 차단된 요청의 절약 바이트 추정치 (응답을 받지 않으므로 실제 크기는 알 수 없음)
+ESTIMATED_BYTES = {
+    "image": 40_000, "media": 300_000, "font": 60_000, "stylesheet": 30_000,
+    "script": 50_000, "xhr": 5_000, "fetch": 5_000, "other": 5_000,
+}
+
+
+def _host_matches(host, domains):
+    """호스트가 목록의 도메인이거나 그 하위 도메인인지 확인합니다 ("saramin.co.kr.evil.com"은 일치하지 않음)."""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+def _host_contains(host, keywords):
+    """호스트 이름에 목록의 키워드가 들어 있는지 확인합니다."""
+    return any(keyword in host for keyword in keywords)
+
+
+class ResourceBlocker:
+    """
+    컨텍스트 단위로 요청을 가로채 불필요한 리소스를 차단하고, 절약한 요청 수/바이트를 집계합니다.
+    - 프로필 'full'이면 아무 것도 차단하지 않습니다.
+    """
+
+    def __init__(self, profile="text"):
+        if profile not in CRAWL_PROFILES:
+            raise ValueError(f"알 수 없는 크롤 프로필입니다: {profile}")
+        self.profile_name = profile
+        self.profile = CRAWL_PROFILES[profile]
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+        self.blocked_by_type = {}
+        self.saved_bytes = 0
+
+    def should_block(self, url, resource_type):
+        """URL과 리소스 유형으로 차단 여부를 결정합니다."""
+        if self.profile is None:
+            return False
+        host = urlparse(url).hostname or ""
+        if _host_matches(host, self.profile["allow_hosts"]):
+            return False
+        if _host_matches(host, self.profile["deny_hosts"]) or _host_contains(host, self.profile["deny_keywords"]):
+            return True
+        if resource_type in ("image", "imageset") and _host_matches(host, self.profile["image_hosts"]):
+            return False
+        return resource_type in self.profile["block_types"]
+
+    async def _handle_route(self, route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked_requests += 1
+            self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+            self.saved_bytes += ESTIMATED_BYTES.get(request.resource_type, ESTIMATED_BYTES["other"])
+            await route.abort()
+        else:
+            self.allowed_requests += 1
+            await route.continue_()
+
+    async def attach(self, context):
+        """브라우저 컨텍스트(또는 페이지)에 요청 가로채기를 등록합니다."""
+        if self.profile is None:
+            return
+        await context.route("**/*", self._handle_route)
+
+    def summary(self):
+        """이번 실행에서 절약한 요청/바이트 요약을 반환합니다."""
+        return {
+            "profile": self.profile_name,
+            "allowed_requests": self.allowed_requests,
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "estimated_saved_bytes": self.saved_bytes,
+        }
+
+    def print_summary(self):
+        s = self.summary()
+        print(f"[INFO] 리소스 차단({s['profile']}): 차단 {s['blocked_requests']}건 / 허용 {s['allowed_requests']}건, "
+              f"절약 추정 {s['estimated_saved_bytes'] / 1024 / 1024:.1f}MB, 유형별 {s['blocked_by_type']}")
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+# --- 설정 ---
+CACHE_DIR = "http_cache"
+CACHE_TTL_SECONDS = 24 * 3600       # 캐시 유효 기간
+CACHE_MAX_BYTES = 2 * 1024 ** 3     # 캐시 최대 용량 (초과 시 LRU 제거)
+SQLITE_TIMEOUT = 30                 # 여러 프로세스가 함께 쓸 때 잠금 대기 시간(초)
+
+
+class ResponseCache:
+    """
+    목록/상세 페이지 원본 HTML을 디스크에 저장하는 내용 주소 기반(content-addressed) 캐시입니다.
+    - 본문은 내용의 sha256 이름으로 blobs/ 아래 한 번만 저장되고, 인덱스(SQLite)가 URL → 본문을 가리킵니다.
+    - TTL이 지난 항목은 조회되지 않으며, 전체 용량이 한도를 넘으면 오래 사용되지 않은 항목부터 제거합니다.
+    - ttl=None이면 만료 없이 조회합니다 (재실행/리플레이 용도).
+    - 캐시를 채우고 리플레이하는 것은 HTML을 파싱하는 scraper_perpocessed.py(와 FastFetcher)뿐입니다.
+      saramin_test.py / saramin_scraper.py는 살아 있는 페이지의 DOM(locator, 스크린샷)에서 읽으므로 캐시를 거치지 않습니다.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(os.path.join(cache_dir, "index.sqlite3"), timeout=SQLITE_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # 샤드 프로세스들이 동시에 읽고 쓸 수 있도록
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                blob TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def _blob_path(self, blob):
+        return os.path.join(self.blob_dir, blob[:2], blob)
+
+    def get(self, url):
+        """캐시된 페이로드(dict)를 반환합니다. 없거나 만료되었으면 None."""
+        row = self.conn.execute("SELECT blob, created FROM entries WHERE url = ?", (url,)).fetchone()
+        now = time.time()
+        if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+            self.misses += 1
+            return None
+        try:
+            with open(self._blob_path(row[0]), "rb") as f:
+                payload = json.loads(f.read().decode("utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.conn.execute("UPDATE entries SET accessed = ? WHERE url = ?", (now, url))
+        self.conn.commit()
+        self.hits += 1
+        return payload
+
+    def put(self, url, kind, payload):
+        """페이로드(dict, 예: {'html': ..., 'text': ...})를 URL에 연결해 저장합니다."""
+        data = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        blob = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(blob)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"  # 같은 본문을 다른 프로세스가 동시에 써도 충돌하지 않도록
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        now = time.time()
+        self.conn.execute("""
+            INSERT INTO entries (url, kind, blob, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET kind = excluded.kind, blob = excluded.blob, size = excluded.size,
+                created = excluded.created, accessed = excluded.accessed
+        """, (url, kind, blob, len(data), now, now))
+        self.conn.commit()
+        self._evict()
+
+    def total_bytes(self):
+        """저장된 고유 본문들의 총 용량."""
+        row = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT blob, size FROM entries)").fetchone()
+        return row[0]
+
+    def _evict(self):
+        """용량 한도를 넘으면 가장 오래 접근하지 않은 항목부터 제거합니다."""
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        for url, blob, size in self.conn.execute("SELECT url, blob, size FROM entries ORDER BY accessed ASC").fetchall():
+            self.conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            still_used = self.conn.execute("SELECT 1 FROM entries WHERE blob = ? LIMIT 1", (blob,)).fetchone()
+            if still_used is None:
+                try:
+                    os.remove(self._blob_path(blob))
+                except OSError:
+                    pass
+                total -= size
+            if total <= self.max_bytes:
+                break
+        self.conn.commit()
+
+    def print_summary(self):
+        print(f"[INFO] 응답 캐시: 적중 {self.hits}건 / 미스 {self.misses}건, 저장 용량 {self.total_bytes() / 1024 / 1024:.1f}MB")
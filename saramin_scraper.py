@@ -1,18 +1,42 @@
 import asyncio
-import pandas as pd
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import re
 import os
-from PIL import Image
-import pytesseract
+from resource_blocker import ResourceBlocker
+from output_sinks import open_sink
+from ocr_stage import OCRStage
+from dom_extract import extract_all, SARAMIN_LISTING_FIELDS
+from rate_limiter import RateLimiter, limited_goto
+from metrics import metrics
+from page_readiness import PageReadiness, SARAMIN_DETAIL_LAYOUTS, SARAMIN_FRAME_LAYOUTS
+from near_duplicates import NearDuplicateIndex, record_key
 
 # --- 설정 ---
 KEYWORDS = ['IT', '자율주행', '모빌리티']
+SARAMIN_BASE_URL = "https://www.saramin.co.kr"  # 로컬 목 서버(mock_server.py)로 벤치마크할 때는 그 주소로 바꿈
 SCREENSHOT_DIR = "screenshots"
+CRAWL_MODE = "ocr"  # 리소스 차단 프로필 (스크린샷 OCR을 위해 본문 이미지는 허용)
+OUTPUT_PATH = "saramin_job_results.csv"  # 확장자로 형식 결정 (.csv / .jsonl / .parquet, 확장자 없는 폴더면 수집일/출처별 Parquet 데이터셋)
+# .parquet 파일 하나는 종료할 때 footer를 써야 완성되므로 도중에 죽으면 모두 읽을 수 없음 → 긴 수집은 .jsonl / .csv 또는 데이터셋 폴더
+OUTPUT_COLUMNS = [
+    "source", "keyword", "title", "company", "location",
+    "responsibilities_html", "qualifications_html", "preferred_html",
+    "ocr_text", "link"
+]
+METRICS_PATH = "saramin_ocr_metrics"  # 실행 종료 시 단계별 측정값을 .json / .prom으로 저장
+TRACE_PATH = None  # 공고별 단계 시간 추적 파일 (예: "saramin_ocr_trace.jsonl")
+NEAR_DUPLICATE_PATH = ":memory:"  # 유사 중복 공고 색인 (파일 경로를 주면 실행 간에도 유지, None이면 감지 안 함)
+MAX_REUSED_OCR_TASKS = 500  # 유사 중복 공고가 재사용할 수 있도록 기억해 두는 최근 OCR 작업 수
+NEAR_DUPLICATE_MIN_TEXT = 200  # HTML 본문이 이보다 짧으면(이미지 공고의 회사 공통 문구 등) 유사 중복으로 OCR을 재사용하지 않음
+# 목록 항목에서 읽을 필드 (근무지는 없을 수 있음)
+LISTING_FIELDS = {**SARAMIN_LISTING_FIELDS, "location": (".job_condition span", "text")}
+# 상세 페이지/본문 형태 감지 (화면을 띄워 느리므로 학습 전에는 5초까지 기다리고, 이후 형태별 제한 시간을 학습)
+detail_readiness = PageReadiness(SARAMIN_DETAIL_LAYOUTS, initial_timeout=5.0)
+content_readiness = PageReadiness(SARAMIN_FRAME_LAYOUTS, initial_timeout=5.0)
 
 # --- Tesseract 설정 (오타 수정) ---
-# 1. Tesseract 실행 파일 경로 지정 (경로 앞 공백 제거)
-pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+# 1. Tesseract 실행 파일 경로 지정 (경로 앞 공백 제거, OCR 작업 프로세스마다 적용)
+TESSERACT_CMD = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 # 2. Tesseract 언어 데이터 경로(tessdata) 설정 (경로 앞 공백 제거)
 tessdata_dir_config = r'--tessdata-dir "C:\Program Files\Tesseract-OCR\tessdata"'
 
@@ -25,28 +49,45 @@ def clean_text(text):
     cleaned_lines = [re.sub(r'^\s*-\s*', '', line).strip() for line in lines]
     return cleaned_lines
 
-def perform_ocr(image_path):
-    """주어진 이미지 파일 경로에 대해 OCR을 수행합니다."""
+async def finish_job(job, ocr_task, sink, jobs):
+    """OCR 결과가 준비되면 공고에 합쳐 기록합니다."""
+    if ocr_task is not None:
+        with metrics.timer("ocr.wait"):
+            job["ocr_text"] = (await ocr_task).strip()
+    if sink is not None:
+        sink.write(job)
+    else:
+        jobs.append(job)
+
+async def take_screenshot(content_context, keyword, i, ocr_stage=None):
+    """본문 영역을 스크린샷으로 저장하고 OCR 작업을 제출합니다. OCR 작업(없으면 None)을 반환합니다."""
+    screenshot_path = os.path.join(SCREENSHOT_DIR, f"{keyword.replace(' ', '_')}_{i}.png")
     try:
-        print(f"[INFO] '{image_path}'에 대해 OCR을 수행합니다...")
-        text = pytesseract.image_to_string(Image.open(image_path), lang='kor', config=tessdata_dir_config)
-        print("[INFO] OCR 완료.")
-        return text
+        screenshot_target = content_context.locator("div.job_definition").first
+        if await screenshot_target.count() == 0:
+            screenshot_target = content_context.locator('body')
+
+        with metrics.timer("detail.screenshot"):
+            await screenshot_target.wait_for(state='visible', timeout=5000)
+            screenshot = await screenshot_target.screenshot(path=screenshot_path)
+        if ocr_stage is not None:
+            return ocr_stage.submit(screenshot)
     except Exception as e:
-        print(f"[ERROR] OCR 처리 중 오류 발생: {e}")
-        return ""
+        print(f"[ERROR] 스크린샷 실패: {e}")
+    return None
 
 async def get_job_details_from_html(page_or_frame):
     """채용 공고 상세 페이지(또는 프레임)의 HTML에서 구조화된 데이터를 추출합니다."""
     details = {"responsibilities": [], "qualifications": [], "preferred": []}
     content_element = None
 
-    try:
-        # 1. 기본 컨텐츠 영역 시도
-        await page_or_frame.wait_for_selector("div.job_definition", timeout=5000)
+    # 본문 형태를 한꺼번에 기다리므로 div.job_definition이 없는 공고도 5초씩 기다리지 않음
+    layout = await content_readiness.wait(page_or_frame)
+    if layout == "inline":
+        # 1. 기본 컨텐츠 영역
         content_element = page_or_frame.locator("div.job_definition")
-    except Exception:
-        # 2. 실패 시 body 전체를 대상
+    else:
+        # 2. 없으면 body 전체를 대상
         print("[INFO] 'div.job_definition'을 찾을 수 없어 body 전체를 파싱합니다.")
         content_element = page_or_frame.locator('body')
 
@@ -73,93 +114,103 @@ async def get_job_details_from_html(page_or_frame):
     return details
 
 
-async def scrape_saramin(page, keyword):
-    """사람인에서 특정 키워드로 채용 공고를 스크레이핑합니다."""
+async def scrape_saramin(page, keyword, sink=None, ocr_stage=None, limiter=None, near_duplicates=None, ocr_tasks=None):
+    """
+    사람인에서 특정 키워드로 채용 공고를 스크레이핑합니다. sink가 주어지면 공고마다 바로 기록합니다.
+    - 스크린샷 OCR은 ocr_stage(프로세스 풀)에 맡기고 기다리지 않고 다음 공고로 넘어갑니다.
+    - 페이지 이동은 limiter(RateLimiter)의 호스트별 속도 제한/재시도를 거치며, 재시도 후에도 실패한 공고만 건너뜁니다.
+    - near_duplicates(NearDuplicateIndex)가 주어지면 본문이 이미 처리한 공고와 거의 같은 공고는
+      스크린샷/OCR을 생략하고 대표 공고의 OCR 결과를 재사용합니다. 대표 공고의 OCR 작업은 ocr_tasks(링크 → 작업,
+      실행마다 만드는 사전)에서 찾으며, 최근 MAX_REUSED_OCR_TASKS개만 남깁니다 (없으면 새로 스크린샷/OCR).
+      이미지 공고나 HTML 본문이 짧은 공고는 본문이 이미지에 있어 HTML로 비교할 수 없으므로 항상 새로 OCR합니다.
+    """
     print(f"\n사람인에서 '{keyword}' 키워드로 검색을 시작합니다.")
-    url = f"https://www.saramin.co.kr/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={keyword}"
-    await page.goto(url, wait_until="domcontentloaded")
+    url = f"{SARAMIN_BASE_URL}/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={keyword}"
+    with metrics.timer("listing.goto"):
+        await limited_goto(page, url, limiter, wait_until="domcontentloaded")
 
     try:
-        await page.wait_for_selector(".item_recruit", timeout=10000)
+        with metrics.timer("listing.wait_results"):
+            await page.wait_for_selector(".item_recruit", timeout=10000)
     except PlaywrightTimeoutError:
         print(f"[WARN] 사람인에서 '{keyword}'에 대한 검색 결과가 없거나 로딩에 실패했습니다.")
         return []
 
-    job_listings = await page.locator(".item_recruit").all()
+    # 모든 공고의 기본 정보를 evaluate 한 번으로 먼저 읽어 두므로 상세 페이지에서 목록으로 돌아올 필요가 없음
+    with metrics.timer("listing.extract"):
+        job_listings = await extract_all(page, ".item_recruit", LISTING_FIELDS, required=["link", "title", "company"])
     jobs = []
+    pending = []  # OCR 완료 후 기록될 공고
     print(f"사람인에서 {len(job_listings)}개의 공고를 찾았습니다. 상위 5개 공고의 상세 내용을 수집합니다.")
 
     for i, job_listing in enumerate(job_listings[:5]):
         print(f"--- {i+1}번째 공고 처리 시작 ---")
-        try:
-            title_element = job_listing.locator('.job_tit a')
-            title = await title_element.inner_text()
-            link = await title_element.get_attribute('href')
-            full_link = "https://www.saramin.co.kr" + link if link and not link.startswith('http') else link
-
-            company_element = job_listing.locator('.corp_name a')
-            company = await company_element.inner_text()
-            
-            location = "N/A"
+        with metrics.trace(link=job_listing['link'], keyword=keyword):
             try:
-                location_element = job_listing.locator('.job_condition span').first
-                location = await location_element.inner_text()
-            except Exception:
-                pass
+                title = job_listing['title']
+                full_link = job_listing['link']
+                company = job_listing['company']
+                location = job_listing['location'] or "N/A"
 
-            await page.goto(full_link, wait_until="domcontentloaded", timeout=30000)
+                with metrics.timer("detail.goto"):
+                    await limited_goto(page, full_link, limiter, wait_until="domcontentloaded", timeout=30000)
 
-            content_context = None
-            try:
-                await page.wait_for_selector("iframe#iframe_content_0", timeout=5000)
-                print("[INFO] Iframe을 발견하여 내부 컨텐츠를 처리합니다.")
-                content_context = page.frame("iframe_content_0")
-                if content_context is None:
-                    await page.wait_for_timeout(2000) # 프레임 로드 시간 추가 대기
-                    content_context = page.frame("iframe_content_0")
-                if content_context is None: raise Exception("Iframe을 찾았지만, 객체를 가져오는 데 실패했습니다.")
-            except Exception:
-                print("[INFO] Iframe이 없어 메인 페이지를 처리합니다.")
+                # iframe/본문/이미지 형태를 한꺼번에 기다려 먼저 나타난 형태로 바로 진행
+                with metrics.timer("detail.ready"):
+                    layout = await detail_readiness.wait(page)
+                metrics.count(f"detail.layout.{layout or 'unknown'}")
                 content_context = page
+                if layout == "iframe":
+                    # 프레임 객체는 iframe 요소에서 바로 얻음 (프레임 이름 조회 실패 시 2초씩 기다리지 않음)
+                    iframe = await page.query_selector(SARAMIN_DETAIL_LAYOUTS["iframe"])
+                    frame = await iframe.content_frame() if iframe is not None else None
+                    if frame is not None:
+                        print("[INFO] Iframe을 발견하여 내부 컨텐츠를 처리합니다.")
+                        content_context = frame
+                if content_context is page:
+                    print("[INFO] Iframe이 없어 메인 페이지를 처리합니다.")
 
-            html_details = await get_job_details_from_html(content_context)
+                with metrics.timer("detail.parse"):
+                    html_details = await get_job_details_from_html(content_context)
+
+                ocr_task = None
+                duplicate = None
+                html_text = "\n".join(sum(html_details.values(), []))
+                if near_duplicates is not None and layout != "image" and len(html_text) >= NEAR_DUPLICATE_MIN_TEXT:
+                    with metrics.timer("detail.near_duplicate"):
+                        duplicate = near_duplicates.add(record_key(job_listing), html_text, full_link)
+                if duplicate is not None and ocr_tasks is not None and duplicate[1] in ocr_tasks:
+                    metrics.count("detail.near_duplicate.skipped_ocr")
+                    print(f"[INFO] 유사 중복 공고 (유사도 {duplicate[2]:.2f}): {duplicate[1]}의 OCR 결과를 재사용합니다.")
+                    ocr_task = ocr_tasks[duplicate[1]]
+                else:
+                    ocr_task = await take_screenshot(content_context, keyword, i, ocr_stage)
+                    if ocr_task is not None and ocr_tasks is not None:
+                        ocr_tasks[full_link] = ocr_task
+                        if len(ocr_tasks) > MAX_REUSED_OCR_TASKS:
+                            # 가장 먼저 넣은 작업부터 잊음 (사전은 넣은 순서를 유지)
+                            del ocr_tasks[next(iter(ocr_tasks))]
+
+                job = {
+                    "source": "사람인",
+                    "keyword": keyword,
+                    "title": title.strip(),
+                    "company": company.strip(),
+                    "location": location.strip(),
+                    "link": full_link,
+                    "responsibilities_html": "\n".join(html_details["responsibilities"]),
+                    "qualifications_html": "\n".join(html_details["qualifications"]),
+                    "preferred_html": "\n".join(html_details["preferred"]),
+                    "ocr_text": "",
+                }
+                pending.append(asyncio.ensure_future(finish_job(job, ocr_task, sink, jobs)))
 
-            screenshot_path = os.path.join(SCREENSHOT_DIR, f"{keyword.replace(' ', '_')}_{i}.png")
-            ocr_text = ""
-            try:
-                screenshot_target = content_context.locator("div.job_definition").first
-                if await screenshot_target.count() == 0:
-                    screenshot_target = content_context.locator('body')
-                
-                await screenshot_target.wait_for(state='visible', timeout=5000)
-                await screenshot_target.screenshot(path=screenshot_path)
-                ocr_text = perform_ocr(screenshot_path)
             except Exception as e:
-                print(f"[ERROR] 스크린샷 또는 OCR 실패: {e}")
-
-            jobs.append({
-                "source": "사람인",
-                "keyword": keyword,
-                "title": title.strip(),
-                "company": company.strip(),
-                "location": location.strip(),
-                "link": full_link,
-                "responsibilities_html": "\n".join(html_details["responsibilities"]),
-                "qualifications_html": "\n".join(html_details["qualifications"]),
-                "preferred_html": "\n".join(html_details["preferred"]),
-                "ocr_text": ocr_text.strip(),
-            })
-            
-            await page.go_back()
-            await page.wait_for_selector(".item_recruit", timeout=10000)
+                # 목록 정보는 미리 읽어 두었으므로 검색 페이지로 돌아갈 필요 없이 다음 공고로 진행
+                metrics.fail("detail.failed")
+                print(f"[ERROR] 처리 중 오류 발생: {job_listing['link']} - {repr(e)}")
 
-        except Exception as e:
-            print(f"[ERROR] 처리 중 오류 발생: {repr(e)}")
-            try:
-                await page.goto(url, wait_until="domcontentloaded")
-            except Exception as recovery_e:
-                print(f"[ERROR] 복구 중 오류 발생: {repr(recovery_e)}")
-                break
+    await asyncio.gather(*pending)
     return jobs
 
 
@@ -169,31 +220,50 @@ async def main():
         os.makedirs(SCREENSHOT_DIR)
         print(f"'{SCREENSHOT_DIR}' 폴더를 생성했습니다.")
 
-    all_jobs = []
+    # 공고는 완료되는 즉시 파일에 기록 (메모리에 모아두지 않음)
+    sink = open_sink(OUTPUT_PATH, OUTPUT_COLUMNS)
+    metrics.enable_trace(TRACE_PATH)
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=False)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             device_scale_factor=2
         )
+        blocker = ResourceBlocker(CRAWL_MODE)
+        await blocker.attach(context)
         page = await context.new_page()
+        ocr_stage = OCRStage(lang='kor', config=tessdata_dir_config, tesseract_cmd=TESSERACT_CMD)
+        # 호스트별 적응형 속도 제한 + 재시도 + 회로 차단
+        limiter = RateLimiter()
+        # 본문이 거의 같은 공고(재등록/제목만 바꾼 공고)는 스크린샷/OCR 생략
+        near_duplicates = NearDuplicateIndex(NEAR_DUPLICATE_PATH) if NEAR_DUPLICATE_PATH else None
+        # 이번 실행의 공고 링크 → OCR 작업 (유사 중복 공고가 대표 공고의 OCR 결과를 재사용)
+        ocr_tasks = {} if near_duplicates is not None else None
 
-        for keyword in KEYWORDS:
-            saramin_jobs = await scrape_saramin(page, keyword)
-            all_jobs.extend(saramin_jobs)
+        try:
+            for keyword in KEYWORDS:
+                await scrape_saramin(page, keyword, sink, ocr_stage, limiter, near_duplicates, ocr_tasks)
+        finally:
+            sink.close()
+            ocr_stage.shutdown()
+            if near_duplicates is not None:
+                near_duplicates.close()
 
         await browser.close()
+        blocker.print_summary()
+        detail_readiness.print_summary()
+        content_readiness.print_summary("상세 본문")
+        limiter.print_summary()
+        ocr_stage.print_summary()
+        if near_duplicates is not None:
+            near_duplicates.print_summary()
+        metrics.print_summary()
+
+    metrics.count("postings.written", sink.count)
+    metrics.export(METRICS_PATH)
 
-    if all_jobs:
-        df = pd.DataFrame(all_jobs)
-        df = df[[
-            "source", "keyword", "title", "company", "location", 
-            "responsibilities_html", "qualifications_html", "preferred_html", 
-            "ocr_text", "link"
-        ]]
-        output_filename = "saramin_job_results.csv"
-        df.to_csv(output_filename, index=False, encoding="utf-8-sig")
-        print(f"\n스크레이핑 및 정제 완료! '{output_filename}' 파일에 총 {len(all_jobs)}개의 공고가 저장되었습니다.")
+    if sink.count:
+        print(f"\n스크레이핑 및 정제 완료! '{OUTPUT_PATH}' 파일에 총 {sink.count}개의 공고가 저장되었습니다.")
     else:
         print("\n수집된 채용 공고가 없습니다.")
 
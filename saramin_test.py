@@ -1,13 +1,33 @@
 import asyncio
-import pandas as pd
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-import re
-import emoji
+from text_normalizer import normalize_text
+from detail_pool import run_detail_pool, create_detail_semaphore
+from resource_blocker import ResourceBlocker
+from output_sinks import open_sink
+from ocr_stage import OCRStage
+from image_postings import ImagePosting, ImageOCRPipeline, collect_image_urls
+from dom_extract import extract_all, SARAMIN_LISTING_FIELDS
+from rate_limiter import RateLimiter, limited_goto
+from metrics import metrics
+from page_readiness import PageReadiness, SARAMIN_DETAIL_LAYOUTS, SARAMIN_FRAME_LAYOUTS
 
 # VS Code 연동 테스트를 위한 주석
 # --- 설정 ---
 KEYWORDS = ['IT', '자율주행', '모빌리티']
+SARAMIN_BASE_URL = "https://www.saramin.co.kr"  # 로컬 목 서버(mock_server.py)로 벤치마크할 때는 그 주소로 바꿈
 TARGET_JOB_COUNT = 30  # 키워드별 수집할 목표 공고 개수
+DETAIL_PAGES_PER_CONTEXT = 4  # 키워드별 상세 페이지 동시 탭 수
+MAX_CONCURRENT_DETAILS = 8  # 전체 키워드 합산 동시 상세 처리 한도
+CRAWL_MODE = "text"  # 리소스 차단 프로필 ('full', 'text', 'ocr')
+OUTPUT_PATH = "saramin_final.csv"  # 확장자로 형식 결정 (.csv / .jsonl / .parquet, 확장자 없는 폴더면 수집일/출처별 Parquet 데이터셋)
+# .parquet 파일 하나는 종료할 때 footer를 써야 완성되므로 도중에 죽으면 모두 읽을 수 없음 → 긴 수집은 .jsonl / .csv 또는 데이터셋 폴더
+OUTPUT_COLUMNS = ['source', 'keyword', 'title', 'company', 'link', 'responsibilities']
+METRICS_PATH = "saramin_test_metrics"  # 실행 종료 시 단계별 측정값을 .json / .prom으로 저장
+TRACE_PATH = None  # 공고별 단계 시간 추적 파일 (예: "saramin_test_trace.jsonl")
+
+# 상세 페이지 형태 감지 (모든 키워드가 공유하며 형태별 제한 시간을 학습)
+detail_readiness = PageReadiness(SARAMIN_DETAIL_LAYOUTS)
+frame_readiness = PageReadiness(SARAMIN_FRAME_LAYOUTS)
 
 # --- 텍스트 정제 함수 (AI가 종합적으로 개선) ---
 def clean_text(text):
@@ -16,43 +36,15 @@ def clean_text(text):
     - 불필요한 기호 ([ ], ㆍ, > 등) 및 이모지 제거
     - 공백, 줄바꿈 통일 및 서식 정리
     - 키워드 기준으로 자동 줄바꿈 처리
+    (text_normalizer의 'readable' 프로필)
     """
-    if pd.isna(text) or not text:
-        return ""
-
-    # 1. 이모지 제거
-    text = emoji.replace_emoji(text, replace='')
-
-    # 2. 지정된 모든 특수기호(ㆍ, >, [, ] 등)를 공백으로 변환
-    text = re.sub(r'[•◎\-\·⁃=|※ㆍ●>[\]]', ' ', text)
-
-    # 3. 한글과 영어/숫자 사이에 일관된 공백 추가 (가독성 향상)
-    text = re.sub(r'([가-힣])([A-Za-z0-9])', r'\1 \2', text)
-    text = re.sub(r'([A-Za-z0-9])([가-힣])', r'\1 \2', text)
-
-    # 4. 줄바꿈(newline) 주변의 불필요한 공백(띄어쓰기, 탭)을 모두 제거
-    text = re.sub(r'\s*\n\s*', '\n', text)
-
-    # 5. 두 개 이상의 연속된 공백(띄어쓰기, 탭)을 하나로 통일
-    text = re.sub(r'[ \t]{2,}', ' ', text)
-
-    # 6. 주요 키워드를 기준으로 문단 구분 (괄호 없이 텍스트만 표시)
-    keywords = ["자격요건", "주요업무", "우대사항", "복리후생", "기술스택", "개발환경", "근무조건", "모집부문", "전형절차"]
-    for kw in keywords:
-        # 키워드 앞에 자동으로 줄바꿈 2번을 넣어 문단을 나눔
-        text = re.sub(rf'(\s*{kw}\s*)', f'\n\n{kw} ', text)
-
-    # 7. 세 개 이상의 연속된 줄바꿈을 두 개로 통일 (섹션 간 간격 유지)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-
-    # 8. 전체 텍스트의 앞뒤 공백 최종 제거
-    return text.strip()
+    return normalize_text(text, "readable")
 
 # --- 상세 내용 파싱 (개선된 로직) ---
 async def parse_detail(content_context):
     """
     상세 페이지의 내용을 파싱하여 채용 공고 본문을 추출합니다.
-    - 이미지 기반 공고인 경우 None을 반환합니다.
+    - 이미지 기반 공고인 경우 본문 이미지 주소를 담은 ImagePosting을 반환합니다 (OCR은 호출 측에서).
     - 텍스트 기반 공고인 경우, 여러 선택자를 시도하여 내용을 추출합니다.
     """
     # 1. 이미지 기반 공고인지 확인 (view_img가 포함된 src를 가진 img 태그)
@@ -61,7 +53,7 @@ async def parse_detail(content_context):
         if await img_locator.count() > 0:
             body_text = await content_context.locator('body').inner_text()
             if len(body_text.strip()) < 200:  # 텍스트가 거의 없으면 이미지 공고로 간주
-                return None
+                return ImagePosting(await collect_image_urls(content_context))
     except Exception:
         pass
 
@@ -81,97 +73,179 @@ async def parse_detail(content_context):
     return await content_context.locator('body').inner_text()
 
 # --- 크롤링 ---
-async def scrape_saramin(page, keyword):
-    print(f"사람인에서 '{keyword}' 키워드 검색 시작 (목표: {TARGET_JOB_COUNT}개)")
+async def collect_listing(page, keyword, limiter=None):
+    """검색 결과 페이지를 넘기며 목표 개수만큼 공고 기본 정보(링크/제목/회사)를 수집합니다."""
     base_info_list = []
     current_page = 1
     
     while len(base_info_list) < TARGET_JOB_COUNT:
-        page_url = f"https://www.saramin.co.kr/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={keyword}&recruitPage={current_page}"
+        page_url = f"{SARAMIN_BASE_URL}/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={keyword}&recruitPage={current_page}"
         print(f"[{keyword}] {current_page} 페이지 수집 중... (현재 {len(base_info_list)}개)")
-        await page.goto(page_url, wait_until="domcontentloaded")
+        with metrics.timer("listing.goto"):
+            await limited_goto(page, page_url, limiter, wait_until="domcontentloaded")
 
         try:
-            await page.wait_for_selector(".item_recruit", timeout=5000)
+            with metrics.timer("listing.wait_results"):
+                await page.wait_for_selector(".item_recruit", timeout=5000)
         except PlaywrightTimeoutError:
             print(f"[{keyword}] 더 이상 공고가 없어 중단")
             break
             
-        job_listings = await page.locator(".item_recruit").all()
-        for job_listing in job_listings:
-            try:
-                link_element = job_listing.locator('.job_tit a')
-                link = await link_element.get_attribute('href')
-                full_link = "https://www.saramin.co.kr" + link if link and not link.startswith('http') else link
-                title = await job_listing.locator('.job_tit a').inner_text()
-                company = await job_listing.locator('.corp_name a').inner_text()
-                base_info_list.append({'link': full_link, 'title': title.strip(), 'company': company.strip()})
-                if len(base_info_list) >= TARGET_JOB_COUNT:
-                    break
-            except Exception:
-                pass
+        # 모든 공고의 링크/제목/회사를 evaluate 한 번으로 읽음 (공고마다 locator 왕복 3회 → 페이지당 1회)
+        with metrics.timer("listing.extract"):
+            listings = await extract_all(page, ".item_recruit", SARAMIN_LISTING_FIELDS)
+        for listing in listings:
+            base_info_list.append(listing)
+            if len(base_info_list) >= TARGET_JOB_COUNT:
+                break
         if len(base_info_list) >= TARGET_JOB_COUNT:
             break
         current_page += 1
 
-    print(f"[{keyword}] 총 {len(base_info_list)}개 공고 수집 완료. 상세 분석 시작")
-    detailed_jobs = []
-    
-    for i, base_info in enumerate(base_info_list):
-        try:
-            await page.goto(base_info['link'], wait_until="domcontentloaded", timeout=30000)
-            content_context = page
-            try:
-                await page.wait_for_selector("iframe[id^='iframe_content']", timeout=3000)
-                content_context = page.frame_locator("iframe[id^='iframe_content']").first
-            except PlaywrightTimeoutError:
-                pass
-            
-            # 개선된 파싱 함수 호출
+    return base_info_list
+
+async def process_detail(page, i, base_info, keyword, image_pipeline=None, limiter=None):
+    """상세 페이지 하나를 열어 본문을 추출·정제한 레코드를 반환합니다."""
+    try:
+        with metrics.timer("detail.goto"):
+            await limited_goto(page, base_info['link'], limiter, wait_until="domcontentloaded", timeout=30000)
+        # iframe/본문/이미지 형태를 한꺼번에 기다려 먼저 나타난 형태로 바로 진행
+        with metrics.timer("detail.ready"):
+            layout = await detail_readiness.wait(page)
+        metrics.count(f"detail.layout.{layout or 'unknown'}")
+        content_context = page
+        if layout == "iframe":
+            content_context = page.frame_locator(SARAMIN_DETAIL_LAYOUTS["iframe"]).first
+            # 이미지 공고 판정 전에 iframe 본문이 채워질 때까지 기다림
+            with metrics.timer("detail.frame_ready"):
+                await frame_readiness.wait(content_context)
+        
+        # 개선된 파싱 함수 호출
+        with metrics.timer("detail.parse"):
             responsibilities_raw = await parse_detail(content_context)
-            
-            if responsibilities_raw is None:
-                responsibilities_clean = None  # 이미지 공고는 None으로 처리
-            else:
+        
+        if isinstance(responsibilities_raw, ImagePosting):
+            # 이미지 공고: OCR은 페이지와 분리해 백그라운드에서 진행하고, 결과는 기록 직전에 합침
+            metrics.count("detail.image_postings")
+            responsibilities_clean = None
+            if image_pipeline is not None and responsibilities_raw.urls:
+                base_info['_ocr_task'] = image_pipeline.schedule(responsibilities_raw.urls)
+        else:
+            with metrics.timer("clean"):
                 responsibilities_clean = clean_text(responsibilities_raw)
-            
-            base_info['source'] = "사람인"
-            base_info['keyword'] = keyword
-            base_info['responsibilities'] = responsibilities_clean
-            detailed_jobs.append(base_info)
-            print(f"[{keyword}] {i + 1}번째 공고 처리 완료: {base_info['title']}")
-        except Exception as e:
-            print(f"[{keyword}] {i + 1}번째 공고 처리 실패: {base_info.get('link', '알 수 없는 URL')} - {e}")
+        
+        base_info['source'] = "사람인"
+        base_info['keyword'] = keyword
+        base_info['responsibilities'] = responsibilities_clean
+        print(f"[{keyword}] {i + 1}번째 공고 처리 완료: {base_info['title']}")
+        return base_info
+    except Exception as e:
+        metrics.fail("detail.failed")
+        print(f"[{keyword}] {i + 1}번째 공고 처리 실패: {base_info.get('link', '알 수 없는 URL')} - {e}")
+        return None
+
+async def merge_image_text(record, ocr_task, write):
+    """이미지 공고의 OCR 결과를 정제해 레코드에 합친 뒤 기록합니다. 기록한 레코드 수(1)를 반환합니다."""
+    try:
+        with metrics.timer("ocr.wait"):
+            text = await ocr_task
+    except Exception as e:
+        print(f"[ERROR] 이미지 공고 OCR 실패: {record.get('link')} - {e}")
+        text = ""
+    record['responsibilities'] = clean_text(text) if text.strip() else None
+    write(record)
+    return 1
+
+async def scrape_saramin(page, keyword, semaphore=None, sink=None, image_pipeline=None, limiter=None):
+    """
+    키워드 하나를 수집합니다. sink가 주어지면 완료되는 공고를 바로 기록하고 기록한 개수를 반환합니다.
+    기록한 개수에는 OCR이 끝난 뒤 나중에 합쳐 기록한 이미지 공고도 포함됩니다.
+    """
+    print(f"사람인에서 '{keyword}' 키워드 검색 시작 (목표: {TARGET_JOB_COUNT}개)")
+    base_info_list = await collect_listing(page, keyword, limiter)
+
+    print(f"[{keyword}] 총 {len(base_info_list)}개 공고 수집 완료. 상세 분석 시작 (탭 {DETAIL_PAGES_PER_CONTEXT}개)")
+
+    async def handler(detail_page, i, base_info):
+        with metrics.trace(link=base_info['link'], keyword=keyword):
+            with metrics.timer("detail.total"):
+                return await process_detail(detail_page, i, base_info, keyword, image_pipeline, limiter)
+
+    detailed_jobs = []
+    write = sink.write if sink is not None else detailed_jobs.append
+    pending_ocr = []
+    text_written = 0
+
+    def on_result(record):
+        nonlocal text_written
+        ocr_task = record.pop('_ocr_task', None)
+        if ocr_task is None:
+            write(record)
+            text_written += 1
+        else:
+            pending_ocr.append(asyncio.ensure_future(merge_image_text(record, ocr_task, write)))
+
+    # 상세 페이지는 컨텍스트당 N개의 탭이 공유 큐에서 나누어 처리 (결과는 수집 순서 유지, 이미지 공고는 OCR 완료 후)
+    await run_detail_pool(page.context, base_info_list, handler,
+                          num_pages=DETAIL_PAGES_PER_CONTEXT, semaphore=semaphore,
+                          on_result=on_result)
+    # 이미지 공고는 OCR이 끝나야 기록되므로 개수도 합친 뒤에 셈
+    image_written = sum(await asyncio.gather(*pending_ocr))
+    written = text_written + image_written
+    print(f"[{keyword}] 공고 {written}개 기록 (이미지 공고 OCR 후 기록 {image_written}개 포함)")
 
     await page.close()
+    if sink is not None:
+        return written
     return detailed_jobs
 
 
-# --- 메인 실행 (기존과 동일) ---
+# --- 메인 실행 ---
 async def main():
-    all_jobs = []
+    # 공고는 완료되는 즉시 파일에 기록 (메모리에 모아두지 않음)
+    sink = open_sink(OUTPUT_PATH, OUTPUT_COLUMNS)
+    metrics.enable_trace(TRACE_PATH)
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         context = await browser.new_context(user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
+        blocker = ResourceBlocker(CRAWL_MODE)
+        await blocker.attach(context)
         
+        # 모든 키워드가 공유하는 전역 동시성 제한
+        semaphore = create_detail_semaphore(MAX_CONCURRENT_DETAILS)
+        # 이미지 공고는 본문 이미지를 받아 OCR (브라우저 페이지와 분리)
+        ocr_stage = OCRStage(lang='kor')
+        image_pipeline = ImageOCRPipeline(ocr_stage)
+        # 호스트별 적응형 속도 제한 + 재시도 + 회로 차단
+        limiter = RateLimiter()
         tasks = []
         for keyword in KEYWORDS:
             page = await context.new_page()
-            tasks.append(scrape_saramin(page, keyword))
+            tasks.append(scrape_saramin(page, keyword, semaphore, sink, image_pipeline, limiter))
             
-        results = await asyncio.gather(*tasks)
-        for result_list in results:
-            all_jobs.extend(result_list)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            sink.close()
+            await image_pipeline.aclose()
+            ocr_stage.shutdown()
 
         await browser.close()
-
-    if all_jobs:
-        df = pd.DataFrame(all_jobs)
-        df = df[['source', 'keyword', 'title', 'company', 'link', 'responsibilities']]
-        df.to_csv("saramin_final.csv", index=False, encoding="utf-8-sig")
-        print(f"\n스크레이핑 + 정제 완료! 'saramin_final.csv' 파일에 총 {len(all_jobs)}개 공고 저장됨.")
+        blocker.print_summary()
+        detail_readiness.print_summary()
+        frame_readiness.print_summary("상세 본문 iframe")
+        limiter.print_summary()
+        image_pipeline.print_summary()
+        ocr_stage.print_summary()
+        metrics.print_summary()
+
+    metrics.count("postings.written", sink.count)
+    metrics.export(METRICS_PATH)
+
+    if sink.count:
+        print(f"\n스크레이핑 + 정제 완료! '{OUTPUT_PATH}' 파일에 총 {sink.count}개 공고 저장됨.")
     else:
         print("\n수집된 채용 공고 없음.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -1,172 +1,448 @@
+import argparse
 import asyncio
-import pandas as pd
+import os
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-import re
-from bs4 import BeautifulSoup
-import emoji
+from section_extractor import extract_sections, extract_responsibilities
+from text_normalizer import normalize_text
+from detail_pool import run_detail_pool, create_detail_semaphore
+from resource_blocker import ResourceBlocker
+from http_fetch import FastFetcher, parse_listing_html
+from posting_store import PostingStore, canonicalize_link
+from response_cache import ResponseCache
+from output_sinks import open_sink, TeeSink
+from search_index import SearchIndexSink, read_records
+from crawl_frontier import CrawlFrontier
+from dom_extract import extract_all, extract_body, SARAMIN_LISTING_FIELDS
+from inflight import InflightRegistry
+from rate_limiter import RateLimiter, limited_goto
+from metrics import metrics
+from page_readiness import PageReadiness, SARAMIN_DETAIL_LAYOUTS, SARAMIN_FRAME_LAYOUTS
+from page_lifecycle import BrowserLifecycle
 
 # --- 설정 ---
 KEYWORDS = ['IT', '자율주행', '모빌리티']
+SARAMIN_BASE_URL = "https://www.saramin.co.kr"  # 로컬 목 서버(mock_server.py)로 벤치마크할 때는 그 주소로 바꿈
 TARGET_JOB_COUNT = 100  # 키워드별 수집할 목표 공고 개수
+DETAIL_PAGES_PER_CONTEXT = 4  # 키워드별 상세 페이지 동시 탭 수
+MAX_CONCURRENT_DETAILS = 8  # 전체 키워드 합산 동시 상세 처리 한도
+CRAWL_MODE = "text"  # 리소스 차단 프로필 ('full', 'text', 'ocr')
+USE_HTTP_FAST_PATH = True  # 서버 렌더링 페이지는 브라우저 없이 HTTP로 먼저 시도
+USE_INCREMENTAL_STORE = True  # 이전 실행에서 수집한 변경 없는 공고는 상세 수집 생략
+USE_RESPONSE_CACHE = True  # 목록/상세 원본 HTML을 디스크 캐시에 저장·재사용
+OUTPUT_PATH = "saramin_final.csv"  # 확장자로 형식 결정 (.csv / .jsonl / .parquet, 확장자 없는 폴더면 수집일/출처별 Parquet 데이터셋)
+# .parquet 파일 하나는 종료할 때 footer를 써야 완성되므로 도중에 죽으면 모두 읽을 수 없음 → 긴 수집은 .jsonl / .csv 또는 데이터셋 폴더
+METRICS_PATH = "saramin_metrics"  # 실행 종료 시 단계별 측정값을 .json / .prom으로 저장
+TRACE_PATH = None  # 공고별 단계 시간 추적 파일 (예: "saramin_trace.jsonl", None이면 기록 안 함)
+SEARCH_INDEX_PATH = "postings_index.sqlite3"  # 기록하는 공고를 전문 검색 색인에도 추가 (None이면 색인 안 함)
+FRONTIER_PATH = "crawl_frontier.sqlite3"  # 목록 페이지 커서/상세 완료 여부 기록 (--resume으로 멈춘 곳부터 이어서 수집)
+OUTPUT_COLUMNS = ['source', 'keywords', 'title', 'company', 'link', 'responsibilities', 'qualifications', 'preferred', 'benefits']
+
+# 상세 페이지 형태 감지 (모든 키워드가 공유하며 형태별 제한 시간을 학습)
+detail_readiness = PageReadiness(SARAMIN_DETAIL_LAYOUTS)
+frame_readiness = PageReadiness(SARAMIN_FRAME_LAYOUTS)
 
 # --- 텍스트 정제 함수 (preprocessed.py 통합) ---
 def clean_text(text):
-    """모든 이모지 제거 + 글머리 기호 정리 + 가독성 향상"""
-    if pd.isna(text) or not text:
-        return ""
+    """모든 이모지 제거 + 글머리 기호 정리 + 가독성 향상 (text_normalizer의 'scraper' 프로필)"""
+    return normalize_text(text, "scraper")
+
+# --- 상세 내용 파싱 ---
+def parse_responsibilities_robust(html_content, fallback_text):
+    """담당업무 섹션만 추출합니다. 찾지 못하면 fallback_text (section_extractor의 단일 순회 추출기 사용)"""
+    return extract_responsibilities(html_content, fallback_text)
 
-    # 1. 모든 이모지 제거
-    text = emoji.replace_emoji(text, replace='')
+# --- 크롤링 ---
+def listing_url(keyword, page_number):
+    return f"{SARAMIN_BASE_URL}/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={keyword}&recruitPage={page_number}"
 
-    # 2. 글머리 기호 줄바꿈
-    text = re.sub(r'\s*[•\-\·]\s*', r'\n- ', text)
+async def read_listing_page(page, page_url, cache=None, limiter=None):
+    """Playwright로 검색 결과 페이지 하나를 열어 공고 기본 정보 목록을 읽습니다. 결과가 없으면 None."""
+    with metrics.timer("listing.goto"):
+        await limited_goto(page, page_url, limiter, wait_until="domcontentloaded")
+    try:
+        with metrics.timer("listing.wait_results"):
+            await page.wait_for_selector(".item_recruit", timeout=5000)
+    except PlaywrightTimeoutError:
+        return None
 
-    # 3. 연속 공백 제거
-    text = re.sub(r'\s{2,}', ' ', text)
+    if cache is not None:
+        cache.put(page_url, "listing", {"html": await page.content()})
 
-    # 4. 특수문자 정리
-    text = re.sub(r'[|※]', ' ', text)
+    # 모든 공고의 링크/제목/회사를 evaluate 한 번으로 읽음 (공고마다 locator 왕복 3회 → 페이지당 1회)
+    with metrics.timer("listing.extract"):
+        return await extract_all(page, ".item_recruit", SARAMIN_LISTING_FIELDS)
 
-    # 5. 문장부호 정리
-    text = re.sub(r'\.{2,}', '…', text)
-    text = re.sub(r',,', ',', text)
-    text = re.sub(r'\?{2,}', '?', text)
+async def collect_listing(page, keyword, fetcher=None, cache=None, limiter=None, frontier=None, lifecycle=None):
+    """
+    검색 결과 페이지를 넘기며 목표 개수만큼 공고 기본 정보(링크/제목/회사)를 수집합니다. (공고 목록, 탭)을 반환합니다.
+    frontier(CrawlFrontier)가 주어지면 페이지마다 진행 상태를 기록하고, 기록된 커서가 있으면 그 페이지부터 이어서 읽습니다.
+    lifecycle(BrowserLifecycle)이 주어지면 목록 페이지마다 탭 교체 여부를 확인하므로, 반환한 탭은 처음 받은 탭과 다를 수 있습니다.
+    """
+    base_info_list = []
+    current_page = 1
+    if frontier is not None:
+        current_page, base_info_list, listing_done = frontier.cursor(keyword)
+        if base_info_list:
+            print(f"[{keyword}] 이전 실행에서 {current_page - 1} 페이지까지 {len(base_info_list)}개 수집됨, 이어서 진행")
+        if listing_done:
+            return base_info_list[:TARGET_JOB_COUNT], page
 
-    # 6. 주요 키워드 구분선
-    keywords = ["자격요건", "주요업무", "우대사항", "복리후생", "근무조건", "모집부문", "전형절차"]
-    for kw in keywords:
-        text = re.sub(rf'\s*{kw}', f'\n\n=== {kw} ===', text)
+    while len(base_info_list) < TARGET_JOB_COUNT:
+        page_url = listing_url(keyword, current_page)
+        print(f"[{keyword}] {current_page} 페이지 수집 중... (현재 {len(base_info_list)}개)")
 
-    # 7. 한글-영어 띄어쓰기
-    text = re.sub(r'([가-힣])([A-Za-z])', r'\1 \2', text)
-    text = re.sub(r'([A-Za-z])([가-힣])', r'\1 \2', text)
+        # 1. 캐시 → 2. HTTP 고속 경로 → 3. Playwright 순서로 시도
+        listings = None
+        source = "cache"
+        cached = cache.get(page_url) if cache else None
+        if cached is not None:
+            listings = parse_listing_html(cached['html'], page_url)
+        if listings is None and fetcher:
+            source = "http"
+            with metrics.timer("listing.http"):
+                listings = await fetcher.fetch_listing(page_url)
+        if listings is None:
+            source = "playwright"
+            listings = await read_listing_page(page, page_url, cache, limiter)
+            if lifecycle is not None:
+                # 목록 탭도 페이지를 넘길 때마다 이동 횟수/메모리 한도에 따라 교체
+                page = await lifecycle.after_item(page)
+        metrics.count(f"listing.pages.{source}")
+        if not listings:
+            print(f"[{keyword}] 더 이상 공고가 없어 중단")
+            break
 
-    # 8. 중복 줄바꿈 제거
-    text = re.sub(r'\n{3,}', '\n\n', text)
+        collected = len(base_info_list)
+        for listing in listings:
+            listing['link'] = canonicalize_link(listing['link'])
+            base_info_list.append(listing)
+            if len(base_info_list) >= TARGET_JOB_COUNT:
+                break
+        if frontier is not None:
+            frontier.save_page(keyword, current_page, base_info_list[collected:])
+        current_page += 1
 
-    return text.strip()
+    if frontier is not None:
+        frontier.finish_listing(keyword)
+    return base_info_list, page
 
-# --- 상세 내용 파싱 ---
-def parse_responsibilities_robust(html_content, fallback_text):
-    soup = BeautifulSoup(html_content, 'lxml')
-    start_keywords = re.compile(r'담당\s*업무|주요\s*업무|업무\s*내용')
-    end_keywords = re.compile(r'자격\s*요건|지원\s*자격|필수\s*역량|우대\s*사항')
+async def read_detail_page(page, link, limiter=None):
+    """Playwright로 상세 페이지를 열어 본문(iframe 우선)의 (HTML, 텍스트)를 읽습니다."""
+    with metrics.timer("detail.goto"):
+        await limited_goto(page, link, limiter, wait_until="domcontentloaded", timeout=30000)
+    # iframe/본문/이미지 형태를 한꺼번에 기다려 먼저 나타난 형태로 바로 진행 (iframe이 없는 공고도 3초씩 기다리지 않음)
+    with metrics.timer("detail.ready"):
+        layout = await detail_readiness.wait(page)
+    metrics.count(f"detail.layout.{layout or 'unknown'}")
+    content_context = page
+    if layout == "iframe":
+        content_context = page.frame_locator(SARAMIN_DETAIL_LAYOUTS["iframe"]).first
+        with metrics.timer("detail.frame_ready"):
+            await frame_readiness.wait(content_context)
+
+    with metrics.timer("detail.extract"):
+        return await extract_body(content_context)
+
+def build_record(base_info, keyword, html_content, inner_text):
+    """상세 본문 (HTML, 텍스트)를 파싱·정제해 최종 레코드를 만듭니다."""
+    # 한 번의 DOM 순회로 모든 섹션 추출 (담당업무가 없으면 본문 전체 텍스트 사용)
+    with metrics.timer("parse"):
+        sections = extract_sections(html_content)
+    responsibilities_raw = sections['responsibilities'] or inner_text
     
-    start_tag = soup.find(lambda tag: tag.get_text(strip=True) and start_keywords.search(tag.get_text()))
-    if start_tag:
-        content_parts = []
-        for sibling in start_tag.find_next_siblings():
-            if sibling.get_text(strip=True) and end_keywords.search(sibling.get_text()):
-                break
-            if sibling.get_text(strip=True):
-                content_parts.append(sibling.get_text(separator='\n', strip=True))
-        if content_parts:
-            return '\n'.join(content_parts)
-
-    all_text = soup.get_text()
-    start_match = start_keywords.search(all_text)
-    if start_match:
-        text_after_start = all_text[start_match.end():]
-        end_match = end_keywords.search(text_after_start)
-        if end_match:
-            text_after_start = text_after_start[:end_match.start()]
-        if text_after_start.strip():
-            return text_after_start
+    # --- 최종 정제 적용 ---
+    base_info['source'] = "사람인"
+    base_info['keywords'] = [keyword]
+    with metrics.timer("clean"):
+        base_info['responsibilities'] = clean_text(responsibilities_raw)
+        base_info['qualifications'] = clean_text(sections['qualifications'])
+        base_info['preferred'] = clean_text(sections['preferred'])
+        base_info['benefits'] = clean_text(sections['benefits'])
+    return base_info
+
+async def process_detail(page, i, base_info, keyword, fetcher=None, cache=None, limiter=None):
+    """상세 페이지 하나를 열어 담당업무를 추출·정제한 레코드를 반환합니다."""
+    try:
+        # 1. 캐시 → 2. HTTP 고속 경로 → 3. Playwright 순서로 시도
+        detail = None
+        source = "cache"
+        cached = cache.get(base_info['link']) if cache else None
+        if cached is not None:
+            detail = (cached['html'], cached['text'])
+        if detail is None and fetcher:
+            source = "http"
+            with metrics.timer("detail.http"):
+                detail = await fetcher.fetch_detail(base_info['link'])
+        if detail is None:
+            source = "playwright"
+            detail = await read_detail_page(page, base_info['link'], limiter)
+            if cache is not None:
+                cache.put(base_info['link'], "detail", {"html": detail[0], "text": detail[1]})
+        html_content, inner_text = detail
+        metrics.count(f"detail.source.{source}")
+        metrics.observe("detail.html_kb", len(html_content) / 1024, buckets=(4, 16, 64, 256, 1024, 4096))
         
-    return fallback_text
+        record = build_record(base_info, keyword, html_content, inner_text)
+        print(f"[{keyword}] {i+1}번째 공고 처리 완료: {base_info['title']}")
+        return record
+    except Exception:
+        metrics.fail("detail.failed")
+        print(f"[{keyword}] {i+1}번째 공고 처리 실패: {base_info.get('link', '알 수 없는 URL')}")
+        return None
 
-# --- 크롤링 ---
-async def scrape_saramin(page, keyword):
+async def scrape_saramin(page, keyword, semaphore=None, fetcher=None, store=None, cache=None, sink=None, select=None,
+                         registry=None, limiter=None, frontier=None, lifecycle=None, listing=None):
+    """
+    키워드 하나를 수집합니다. sink가 주어지면 완료되는 공고를 바로 기록하고 기록한 개수를 반환합니다.
+    - select(base_info)가 주어지면 True인 공고만 상세 수집합니다 (샤드 분할용).
+    - registry(InflightRegistry)가 주어지면 다른 키워드가 먼저 맡은 공고는 건너뛰고,
+      레코드의 keywords에는 그 공고가 발견된 키워드가 모두 담깁니다.
+    - limiter(RateLimiter)가 주어지면 모든 페이지 이동이 호스트별 속도 제한과 재시도를 거칩니다.
+    - frontier(CrawlFrontier)가 주어지면 목록 커서와 상세 완료 여부를 기록하고, 이미 기록된 공고는 건너뜁니다.
+    - lifecycle(BrowserLifecycle)이 주어지면 목록/상세 탭을 일정 횟수 이동 후/메모리 한도 초과 시 새로 만듭니다.
+    - listing(공고 기본 정보 목록)이 주어지면 목록 페이지를 읽지 않고 그 공고들을 상세 수집합니다 (샤드 실행용).
+    """
     print(f"사람인에서 '{keyword}' 키워드 검색 시작 (목표: {TARGET_JOB_COUNT}개)")
     base_info_list = []
-    current_page = 1
-    
-    while len(base_info_list) < TARGET_JOB_COUNT:
-        page_url = f"https://www.saramin.co.kr/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={keyword}&recruitPage={current_page}"
-        print(f"[{keyword}] {current_page} 페이지 수집 중... (현재 {len(base_info_list)}개)")
-        await page.goto(page_url, wait_until="domcontentloaded")
+    try:
+        if listing is not None:
+            base_info_list = listing
+        else:
+            base_info_list, page = await collect_listing(page, keyword, fetcher, cache, limiter, frontier, lifecycle)
+        if select is not None:
+            base_info_list = [base_info for base_info in base_info_list if select(base_info)]
+    finally:
+        if registry is not None:
+            # 같은 공고는 먼저 발견한 키워드 하나만 상세 수집하고, 모든 키워드의 목록 수집이 끝난 뒤 시작
+            base_info_list = [base_info for base_info in base_info_list if registry.claim(base_info['link'], keyword)]
+            await registry.listing_done()
+        if frontier is not None:
+            frontier.enqueue(keyword, base_info_list)
 
-        try:
-            await page.wait_for_selector(".item_recruit", timeout=5000)
-        except PlaywrightTimeoutError:
-            print(f"[{keyword}] 더 이상 공고가 없어 중단")
-            break
-            
-        job_listings = await page.locator(".item_recruit").all()
-        for job_listing in job_listings:
-            try:
-                link_element = job_listing.locator('.job_tit a')
-                link = await link_element.get_attribute('href')
-                full_link = "https://www.saramin.co.kr" + link if link and not link.startswith('http') else link
-                title = await job_listing.locator('.job_tit a').inner_text()
-                company = await job_listing.locator('.corp_name a').inner_text()
-                base_info_list.append({'link': full_link, 'title': title.strip(), 'company': company.strip()})
-                if len(base_info_list) >= TARGET_JOB_COUNT:
-                    break
-            except Exception:
-                pass
-        if len(base_info_list) >= TARGET_JOB_COUNT:
+    print(f"[{keyword}] 총 {len(base_info_list)}개 공고 수집 완료. 상세 분석 시작 (탭 {DETAIL_PAGES_PER_CONTEXT}개)")
+
+    def keywords_of(base_info):
+        return registry.keywords(base_info['link']) if registry is not None else [keyword]
+
+    async def handler(detail_page, i, base_info):
+        # 중단된 이전 실행에서 이미 출력 파일에 기록한 공고
+        if frontier is not None and frontier.is_done(base_info['link']):
+            metrics.count("detail.source.frontier")
+            return None
+        with metrics.trace(link=base_info['link'], keyword=keyword):
+            # 이전 실행에서 수집했고 변경이 없는 공고는 저장된 레코드를 재사용
+            if store is not None:
+                stored = store.lookup_unchanged(base_info)
+                if stored is not None:
+                    metrics.count("detail.source.store")
+                    stored['keywords'] = keywords_of(base_info)
+                    return stored
+            with metrics.timer("detail.total"):
+                record = await process_detail(detail_page, i, base_info, keyword, fetcher, cache, limiter)
+            if record is not None:
+                record['keywords'] = keywords_of(record)
+                if store is not None:
+                    status = store.save(record)
+                    if status is not None:
+                        metrics.count(f"store.{status}")
+            elif frontier is not None:
+                frontier.mark_failed(base_info['link'])
+            return record
+
+    def write(record):
+        sink.write(record)
+        if frontier is not None:
+            frontier.mark_done(record['link'])
+
+    # 상세 페이지는 컨텍스트당 N개의 탭이 공유 큐에서 나누어 처리 (결과는 수집 순서 유지)
+    results = await run_detail_pool(lifecycle.context if lifecycle is not None else page.context, base_info_list, handler,
+                                    num_pages=DETAIL_PAGES_PER_CONTEXT, semaphore=semaphore,
+                                    on_result=write if sink is not None else None, lifecycle=lifecycle)
+
+    await page.close()
+    if sink is not None:
+        return results
+    return [job for job in results if job is not None]
+
+# --- 캐시 리플레이 (브라우저 없이 파싱 + 정제만 재실행) ---
+def read_cached_listing(cache, keyword):
+    """캐시에 저장된 검색 결과 페이지에서 목표 개수만큼 공고 기본 정보를 읽습니다."""
+    listings = []
+    current_page = 1
+    while len(listings) < TARGET_JOB_COUNT:
+        page_url = listing_url(keyword, current_page)
+        cached = cache.get(page_url)
+        if cached is None:
             break
+        for listing in parse_listing_html(cached['html'], page_url):
+            listing['link'] = canonicalize_link(listing['link'])
+            listings.append(listing)
+            if len(listings) >= TARGET_JOB_COUNT:
+                break
         current_page += 1
+    return listings
 
-    print(f"[{keyword}] 총 {len(base_info_list)}개 공고 수집 완료. 상세 분석 시작")
-    detailed_jobs = []
-    
-    for i, base_info in enumerate(base_info_list):
-        try:
-            await page.goto(base_info['link'], wait_until="domcontentloaded", timeout=30000)
-            content_context = page
-            try:
-                await page.wait_for_selector("iframe[id^='iframe_content']", timeout=3000)
-                content_context = page.frame_locator("iframe[id^='iframe_content']").first
-            except PlaywrightTimeoutError:
-                pass
-            
-            body_locator = content_context.locator('body')
-            html_content = await body_locator.inner_html()
-            inner_text = await body_locator.inner_text()
-            
-            responsibilities_raw = parse_responsibilities_robust(html_content, inner_text)
-            
-            # --- 최종 정제 적용 ---
-            responsibilities_clean = clean_text(responsibilities_raw)
-            
-            base_info['source'] = "사람인"
-            base_info['keyword'] = keyword
-            base_info['responsibilities'] = responsibilities_clean
-            detailed_jobs.append(base_info)
-            print(f"[{keyword}] {i+1}번째 공고 처리 완료: {base_info['title']}")
-        except Exception:
-            print(f"[{keyword}] {i+1}번째 공고 처리 실패: {base_info.get('link', '알 수 없는 URL')}")
+def replay_from_cache(cache, keywords, sink):
+    """캐시에 저장된 목록/상세 HTML만으로 전체 파싱·정제 파이프라인을 다시 실행합니다 (키워드 간 중복 제거 포함)."""
+    registry = InflightRegistry()
+    owned = []
+    for keyword in keywords:
+        for listing in read_cached_listing(cache, keyword):
+            if registry.claim(listing['link'], keyword):
+                owned.append((keyword, listing))
 
-    await page.close()
-    return detailed_jobs
+    replayed = 0
+    for keyword, listing in owned:
+        detail = cache.get(listing['link'])
+        if detail is None:
+            print(f"[{keyword}] 캐시에 상세 페이지 없음: {listing['link']}")
+            continue
+        record = build_record(listing, keyword, detail['html'], detail['text'])
+        record['keywords'] = registry.keywords(listing['link'])
+        sink.write(record)
+        replayed += 1
+    print(f"[INFO] 캐시 리플레이: {replayed}개 공고 재처리")
+    registry.print_summary()
+    return replayed
 
 # --- 메인 실행 ---
-async def main():
-    all_jobs = []
+def parse_args():
+    parser = argparse.ArgumentParser(description="사람인 채용 공고 수집 + 정제")
+    parser.add_argument("--replay", action="store_true", help="브라우저 없이 응답 캐시로만 파싱·정제를 재실행")
+    parser.add_argument("--resume", action="store_true",
+                        help="중단된 이전 실행의 진행 상태(crawl_frontier.sqlite3)에서 이어서 수집하고 결과 파일에 이어 씀")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="OUTPUT_PATH가 Parquet 데이터셋 폴더일 때 오늘의 사람인 파티션을 지우고 다시 씀 (기본: 기존 파일 옆에 추가)")
+    return parser.parse_args()
+
+def report_results(total):
+    if total:
+        print(f"\n스크레이핑 + 정제 완료! '{OUTPUT_PATH}' 파일에 총 {total}개 공고 저장됨.")
+    else:
+        print("\n수집된 채용 공고 없음.")
+
+async def collect_listings(keywords):
+    """브라우저 하나로 모든 키워드의 목록만 읽어 {키워드: 공고 기본 정보 목록}을 반환합니다 (HTTP 고속 경로 우선)."""
+    listings = {}
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         context = await browser.new_context(user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
+        blocker = ResourceBlocker(CRAWL_MODE)
+        await blocker.attach(context)
+        cache = ResponseCache() if USE_RESPONSE_CACHE else None
+        limiter = RateLimiter()
+        fetcher = FastFetcher(cache=cache, limiter=limiter) if USE_HTTP_FAST_PATH else None
+        try:
+            for keyword in keywords:
+                page = await context.new_page()
+                listings[keyword], page = await collect_listing(page, keyword, fetcher, cache, limiter)
+                await page.close()
+        finally:
+            if fetcher:
+                await fetcher.aclose()
+            if cache:
+                cache.close()
+        await browser.close()
+        limiter.print_summary()
+    return listings
+
+async def crawl(keywords, sink, select=None, frontier=None, listings=None, rate_share=1.0):
+    """
+    브라우저 하나로 키워드들을 수집해 sink에 기록합니다. select와 frontier는 scrape_saramin에 그대로 전달됩니다.
+    listings({키워드: 공고 목록})가 주어지면 목록은 읽지 않고, rate_share는 호스트별 속도 중 이 프로세스의 몫입니다.
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        blocker = ResourceBlocker(CRAWL_MODE)
+        # 탭은 일정 횟수 이동하면, 컨텍스트는 렌더러 메모리가 한도를 넘으면 새로 만듦 (새 컨텍스트에도 리소스 차단 등록)
+        lifecycle = BrowserLifecycle(browser, setup=blocker.attach,
+                                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
+        await lifecycle.start()
         
+        # 모든 키워드가 공유하는 전역 동시성 제한
+        semaphore = create_detail_semaphore(MAX_CONCURRENT_DETAILS)
+        cache = ResponseCache() if USE_RESPONSE_CACHE else None
+        # HTTP 고속 경로와 Playwright가 같은 호스트별 속도 제한을 공유
+        limiter = RateLimiter(share=rate_share)
+        fetcher = FastFetcher(cache=cache, limiter=limiter) if USE_HTTP_FAST_PATH else None
+        store = PostingStore() if USE_INCREMENTAL_STORE else None
+        # 키워드끼리 겹치는 공고는 한 번만 상세 수집 (목록 수집을 모두 마친 뒤 상세 수집 시작)
+        registry = InflightRegistry(parties=len(keywords))
         tasks = []
-        for keyword in KEYWORDS:
-            page = await context.new_page()
-            tasks.append(scrape_saramin(page, keyword))
+        for keyword in keywords:
+            page = await lifecycle.new_page()
+            tasks.append(scrape_saramin(page, keyword, semaphore, fetcher, store, cache, sink, select, registry, limiter,
+                                        frontier, lifecycle, None if listings is None else listings.get(keyword, [])))
+        if frontier is not None:
+            # 체크포인트는 출력 파일을 먼저 기록한 뒤 완료 표시를 커밋
+            frontier.flush = sink.flush
             
-        results = await asyncio.gather(*tasks)
-        for result_list in results:
-            all_jobs.extend(result_list)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            if frontier is not None:
+                frontier.checkpoint()
+            sink.close()
+            if fetcher:
+                await fetcher.aclose()
+            if store:
+                store.close()
 
+        await lifecycle.close()
         await browser.close()
+        blocker.print_summary()
+        lifecycle.print_summary()
+        detail_readiness.print_summary()
+        frame_readiness.print_summary("상세 본문 iframe")
+        registry.print_summary()
+        limiter.print_summary()
+        if fetcher:
+            fetcher.print_summary()
+        if store:
+            store.print_summary()
+        if frontier is not None:
+            frontier.print_summary()
+        if cache:
+            cache.print_summary()
+            cache.close()
+        metrics.print_summary()
 
-    if all_jobs:
-        df = pd.DataFrame(all_jobs)
-        df = df[['source', 'keyword', 'title', 'company', 'link', 'responsibilities']]
-        df.to_csv("saramin_final.csv", index=False, encoding="utf-8-sig")
-        print(f"\n스크레이핑 + 정제 완료! 'saramin_final.csv' 파일에 총 {len(all_jobs)}개 공고 저장됨.")
-    else:
-        print("\n수집된 채용 공고 없음.")
+async def main():
+    args = parse_args()
+    # 공고는 완료되는 즉시 파일에 기록 (메모리에 모아두지 않음), 이어서 수집할 때는 기존 파일 뒤에 추가
+    resume = args.resume and not args.replay
+    if resume and os.path.splitext(OUTPUT_PATH)[1].lower() == ".parquet":
+        # Parquet 파일 하나에는 이어 쓸 수 없으므로 수집을 시작하기 전에 알림
+        raise ValueError(f"--resume은 Parquet 파일('{OUTPUT_PATH}')에 이어 쓸 수 없습니다. "
+                         f"OUTPUT_PATH를 .csv / .jsonl 또는 확장자 없는 Parquet 데이터셋 폴더로 바꾸세요.")
+    sink = open_sink(OUTPUT_PATH, OUTPUT_COLUMNS, append=resume, overwrite=args.overwrite and not resume)
+    if SEARCH_INDEX_PATH:
+        # 검색 색인은 파일과 함께 배치마다 채워지므로 수집이 끝나면 바로 search_index.py로 검색 가능
+        sink = TeeSink(sink, SearchIndexSink(SEARCH_INDEX_PATH))
+
+    if args.replay:
+        cache = ResponseCache(ttl=None)
+        with sink:
+            replay_from_cache(cache, KEYWORDS, sink)
+        cache.print_summary()
+        cache.close()
+        report_results(sink.count)
+        return
+
+    metrics.enable_trace(TRACE_PATH)
+    frontier = CrawlFrontier(FRONTIER_PATH) if FRONTIER_PATH else None
+    if frontier is not None and not resume:
+        frontier.reset()
+    elif frontier is not None and os.path.exists(OUTPUT_PATH):
+        frontier.recover(read_records(OUTPUT_PATH))
+    try:
+        await crawl(KEYWORDS, sink, frontier=frontier)
+    finally:
+        if frontier is not None:
+            frontier.close()
+    metrics.count("postings.written", sink.count)
+    metrics.export(METRICS_PATH)
+    report_results(sink.count)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,306 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from output_sinks import RecordSink, DEFAULT_BATCH_SIZE
+from posting_store import extract_rec_idx, SQLITE_TIMEOUT
+
+# --- 설정 ---
+INDEX_PATH = "postings_index.sqlite3"
+# 검색 대상 필드와 bm25 가중치 (제목/회사명에서 일치하면 본문보다 높게 평가)
+TEXT_FIELDS = {
+    "title": 5.0,
+    "company": 2.0,
+    "responsibilities": 1.0,
+    "qualifications": 1.0,
+    "preferred": 0.5,
+    "benefits": 0.2,
+}
+STORED_FIELDS = ["source", "keywords", "title", "company", "link",
+                 "responsibilities", "qualifications", "preferred", "benefits"]
+DEFAULT_LIMIT = 20
+SNIPPET_TOKENS = 12
+
+_HANGUL_RUN = re.compile(r'[가-힣]+')
+_TOKEN = re.compile(r'[가-힣]+|[0-9a-z]+')
+
+
+# --- 토큰화 ---
+def tokenize(text):
+    """
+    한글은 띄어쓰기·조사와 상관없이 찾을 수 있도록 두 글자씩 겹쳐 자른 바이그램으로, 영문/숫자는 소문자 단어로 나눕니다.
+    예: "자율주행 SW개발" → ['자율', '율주', '주행', 'sw', '개발']
+    """
+    tokens = []
+    for match in _TOKEN.finditer((text or "").lower()):
+        word = match.group()
+        if _HANGUL_RUN.fullmatch(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def index_text(text):
+    """FTS5(unicode61)가 공백으로 나누어 색인하도록 토큰을 공백으로 이어 붙입니다."""
+    return " ".join(tokenize(text))
+
+
+def build_match(query, fields=None):
+    """
+    검색어를 FTS5 MATCH 식으로 바꿉니다. 띄어쓴 단어는 모두 포함해야 하고(AND), '-'로 시작하는 단어는 제외합니다.
+    - 한글 단어는 바이그램 구(phrase)로 찾으므로 단어 안의 부분 문자열도 일치합니다 ('주행' → '자율주행').
+    - 한 글자 한글은 그 글자로 시작하는 바이그램의 접두어 검색입니다.
+    - fields를 주면 그 필드에서만 찾습니다.
+    """
+    column_filter = f"{{{' '.join(fields)}}} : " if fields else ""
+    included, excluded = [], []
+    for word in query.split():
+        negate = word.startswith("-") and len(word) > 1
+        tokens = tokenize(word[1:] if negate else word)
+        if not tokens:
+            continue
+        if len(tokens) == 1 and _HANGUL_RUN.fullmatch(tokens[0]) and len(tokens[0]) == 1:
+            expr = f'"{tokens[0]}"*'
+        else:
+            expr = '"' + " ".join(tokens) + '"'
+        (excluded if negate else included).append(f"{column_filter}{expr}")
+    if not included:
+        return None
+    match = " AND ".join(included)
+    for expr in excluded:
+        match += f" NOT {expr}"
+    return match
+
+
+def record_key(record):
+    """공고 식별자: rec_idx, 없으면 링크, 링크도 없으면 제목+회사명 해시."""
+    link = record.get('link')
+    if link:
+        return extract_rec_idx(link) or link
+    key = f"{record.get('title', '')}\x1f{record.get('company', '')}"
+    return "hash:" + hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _as_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    return str(value)
+
+
+# --- 색인 ---
+class SearchIndex:
+    """
+    수집한 공고를 SQLite FTS5로 색인하고 검색합니다.
+    - 원문은 postings 테이블에, 바이그램 토큰은 내용 없는(contentless) FTS5 테이블에 저장합니다.
+    - 같은 공고(rec_idx)를 다시 넣으면 이전 색인을 지우고 새로 색인합니다.
+    - search()는 bm25 점수(필드별 가중치 TEXT_FIELDS) 순으로 결과를 반환하고, 출처/키워드/회사명으로 거를 수 있습니다.
+    """
+
+    def __init__(self, path=INDEX_PATH):
+        self.conn = sqlite3.connect(path, timeout=SQLITE_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS postings (
+                id INTEGER PRIMARY KEY,
+                key TEXT UNIQUE NOT NULL,
+                {", ".join(f"{field} TEXT" for field in STORED_FIELDS)},
+                indexed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS postings_fts USING fts5(
+                {", ".join(TEXT_FIELDS)}, content='', tokenize='unicode61 remove_diacritics 0'
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS postings_source ON postings(source)")
+        self.conn.commit()
+        self.indexed = 0
+        self.replaced = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def _fts_values(self, row):
+        return [index_text(row[field]) for field in TEXT_FIELDS]
+
+    def _add(self, record):
+        row = {field: _as_text(record.get(field)) for field in STORED_FIELDS}
+        if not row['keywords']:
+            row['keywords'] = _as_text(record.get('keyword'))  # 예전 CSV는 keyword 열
+        key = record_key(record)
+        old = self.conn.execute(
+            f"SELECT id, {', '.join(TEXT_FIELDS)} FROM postings WHERE key = ?", (key,)
+        ).fetchone()
+        if old is not None:
+            # 내용 없는 FTS5 테이블은 색인했던 값과 같은 값으로 'delete' 명령을 보내야 지워짐
+            old_row = dict(zip(TEXT_FIELDS, old[1:]))
+            self.conn.execute(
+                f"INSERT INTO postings_fts(postings_fts, rowid, {', '.join(TEXT_FIELDS)}) "
+                f"VALUES ('delete', ?, {', '.join('?' * len(TEXT_FIELDS))})",
+                [old[0], *self._fts_values(old_row)],
+            )
+            self.conn.execute(
+                f"UPDATE postings SET {', '.join(f'{field} = ?' for field in STORED_FIELDS)}, indexed_at = ? WHERE id = ?",
+                [*(row[field] for field in STORED_FIELDS), time.time(), old[0]],
+            )
+            rowid = old[0]
+            self.replaced += 1
+        else:
+            cursor = self.conn.execute(
+                f"INSERT INTO postings (key, {', '.join(STORED_FIELDS)}, indexed_at) "
+                f"VALUES (?, {', '.join('?' * len(STORED_FIELDS))}, ?)",
+                [key, *(row[field] for field in STORED_FIELDS), time.time()],
+            )
+            rowid = cursor.lastrowid
+        self.conn.execute(
+            f"INSERT INTO postings_fts(rowid, {', '.join(TEXT_FIELDS)}) VALUES (?, {', '.join('?' * len(TEXT_FIELDS))})",
+            [rowid, *self._fts_values(row)],
+        )
+        self.indexed += 1
+
+    def add(self, record):
+        self._add(record)
+        self.conn.commit()
+
+    def add_many(self, records):
+        """레코드 여러 개를 트랜잭션 하나로 색인합니다."""
+        with self.conn:
+            for record in records:
+                self._add(record)
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def search(self, query, fields=None, source=None, keyword=None, company=None, limit=DEFAULT_LIMIT):
+        """
+        검색어와 필터로 공고를 찾아 점수 순으로 반환합니다 (점수가 낮을수록 관련도가 높음, bm25).
+        검색어가 비어 있으면 필터만 적용해 최근 색인 순으로 반환합니다.
+        """
+        if fields:
+            unknown = set(fields) - set(TEXT_FIELDS)
+            if unknown:
+                raise ValueError(f"검색할 수 없는 필드입니다: {', '.join(sorted(unknown))}")
+        match = build_match(query or "", fields)
+        filters, params = [], []
+        if source:
+            filters.append("p.source = ?")
+            params.append(source)
+        if keyword:
+            # keywords는 ", "로 이어 붙인 목록
+            filters.append("(', ' || p.keywords || ', ') LIKE ?")
+            params.append(f"%, {keyword}, %")
+        if company:
+            filters.append("p.company LIKE ?")
+            params.append(f"%{company}%")
+        columns = ", ".join(f"p.{field}" for field in STORED_FIELDS)
+        if match is None:
+            where = f"WHERE {' AND '.join(filters)}" if filters else ""
+            sql = f"SELECT {columns}, NULL FROM postings p {where} ORDER BY p.indexed_at DESC LIMIT ?"
+            rows = self.conn.execute(sql, [*params, limit]).fetchall()
+        else:
+            weights = ", ".join(str(weight) for weight in TEXT_FIELDS.values())
+            where = " AND ".join(["postings_fts MATCH ?", *filters])
+            sql = (f"SELECT {columns}, bm25(postings_fts, {weights}) AS score "
+                   f"FROM postings_fts JOIN postings p ON p.id = postings_fts.rowid "
+                   f"WHERE {where} ORDER BY score LIMIT ?")
+            rows = self.conn.execute(sql, [match, *params, limit]).fetchall()
+        return [{**dict(zip(STORED_FIELDS, row[:-1])), "score": row[-1]} for row in rows]
+
+    def print_summary(self):
+        print(f"[INFO] 검색 색인: {self.indexed}건 색인 (갱신 {self.replaced}건), 전체 {self.count()}건")
+
+
+class SearchIndexSink(RecordSink):
+    """싱크로 기록되는 레코드를 배치마다 검색 색인에 추가합니다 (TeeSink로 파일 싱크와 함께 사용)."""
+
+    def __init__(self, path=INDEX_PATH, columns=None, batch_size=DEFAULT_BATCH_SIZE, append=True):
+        super().__init__(path, columns, batch_size, append)
+        self.index = SearchIndex(path)
+
+    def _write_batch(self, rows):
+        self.index.add_many(rows)
+
+    def _close(self):
+        self.index.print_summary()
+        self.index.close()
+
+
+# --- 기존 결과 파일 색인 ---
+def read_records(path):
+    """CSV(UTF-8-BOM), JSON Lines, Parquet 파일 또는 파티션 Parquet 데이터셋 폴더의 레코드를 차례로 읽습니다."""
+    if path.lower().endswith(".parquet") or os.path.isdir(path):
+        import pyarrow.dataset as ds
+        for batch in ds.dataset(path, format="parquet", partitioning="hive").to_batches():
+            yield from batch.to_pylist()
+    elif path.lower().endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            yield from csv.DictReader(f)
+
+
+def snippet(text, query, width=SNIPPET_TOKENS * 4):
+    """검색어가 처음 나오는 곳 주변의 본문 일부 (없으면 앞부분)."""
+    text = re.sub(r'\s+', ' ', text or "")
+    position = -1
+    for word in query.split():
+        position = text.lower().find(word.lower().lstrip("-"))
+        if position >= 0:
+            break
+    start = max(0, position - width // 2) if position >= 0 else 0
+    return ("…" if start else "") + text[start:start + width] + ("…" if start + width < len(text) else "")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수집한 공고 검색 (SQLite FTS5, 한글 바이그램)")
+    parser.add_argument("query", nargs="?", default="", help="검색어 (띄어쓴 단어는 모두 포함, -단어는 제외)")
+    parser.add_argument("--index", default=INDEX_PATH, help="색인 파일")
+    # 여러 개는 옵션을 반복해서 지정 (nargs="+"면 "--add a.csv 파이썬"의 검색어까지 파일로 읽힘)
+    parser.add_argument("--add", action="append", metavar="FILE",
+                        help="결과 파일(.csv / .jsonl / .parquet) 또는 Parquet 데이터셋 폴더를 색인에 추가 (여러 개는 --add를 반복)")
+    parser.add_argument("--fields", action="append", choices=list(TEXT_FIELDS), metavar="FIELD",
+                        help=f"이 필드에서만 검색 (여러 개는 --fields를 반복, {', '.join(TEXT_FIELDS)})")
+    parser.add_argument("--source", help="출처 (예: 사람인)")
+    parser.add_argument("--keyword", help="수집 키워드")
+    parser.add_argument("--company", help="회사명 일부")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    args = parser.parse_args()
+
+    index = SearchIndex(args.index)
+    for path in args.add or []:
+        if not os.path.exists(path):
+            print(f"[WARN] 파일이 없습니다: {path}")
+            continue
+        start = time.perf_counter()
+        before = index.indexed
+        batch = []
+        for record in read_records(path):
+            batch.append(record)
+            if len(batch) >= 500:
+                index.add_many(batch)
+                batch = []
+        index.add_many(batch)
+        print(f"[INFO] '{path}'에서 {index.indexed - before}건 색인 ({time.perf_counter() - start:.2f}s)")
+
+    if args.query or args.source or args.keyword or args.company:
+        start = time.perf_counter()
+        results = index.search(args.query, args.fields, args.source, args.keyword, args.company, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"'{args.query}' 검색 결과 {len(results)}건 ({elapsed:.1f}ms, 전체 {index.count()}건 중)")
+        for i, result in enumerate(results, 1):
+            score = f"{result['score']:.2f}" if result['score'] is not None else "-"
+            print(f"{i}. [{result['source']}] {result['title']} | {result['company']} (점수 {score})")
+            print(f"   {snippet(result['responsibilities'], args.query)}")
+            print(f"   {result['link']}")
+    index.close()
@@ -0,0 +1,136 @@
+import re
+import lxml.html
+from lxml import etree
+
+# --- 섹션 정의 ---
+# 필드 이름 → 제목으로 인식할 키워드 패턴
+SECTION_PATTERNS = {
+    "responsibilities": r'담당\s*업무|주요\s*업무|업무\s*내용',
+    "qualifications": r'자격\s*요건|지원\s*자격|필수\s*역량',
+    "preferred": r'우대\s*사항',
+    "benefits": r'복리\s*후생|복지\s*제도|혜택\s*및\s*복지',
+    "conditions": r'근무\s*조건|근무\s*환경|근무\s*형태',
+    "process": r'전형\s*절차|채용\s*절차',
+}
+HEADING_MAX_LENGTH = 40  # 이보다 긴 줄은 콜론(:)이 없으면 본문 문장으로 간주
+
+# 줄 앞의 글머리 기호/괄호 등을 허용하고, 키워드 하나를 이름 있는 그룹으로 잡는 단일 패턴
+_HEADING = re.compile(
+    r'^[\s\W\d_]{0,6}(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_PATTERNS.items()) + r')'
+    r'[\s\])】>』」)]*(?P<colon>[:：])?\s*(?P<rest>.*)$'
+)
+
+# 제목 줄이 없을 때 본문 중간에서 찾는 섹션 키워드 (찾은 곳부터 다음 섹션 키워드 전까지를 사용)
+_INLINE_SECTIONS = ["responsibilities"]
+_INLINE_LEADING = re.compile(r'^[\s\])】>』」):：]+')
+
+# 줄바꿈을 만드는 블록 요소
+BLOCK_TAGS = {
+    'p', 'div', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'tr', 'table', 'tbody', 'thead', 'section', 'article',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'footer', 'blockquote', 'pre', 'form', 'hr', 'br',
+}
+CELL_TAGS = {'td', 'th'}
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+
+
+def html_to_lines(html):
+    """DOM을 한 번만 순회하며 블록 요소 경계마다 줄을 나눈 텍스트 줄 목록을 만듭니다."""
+    if not html or not html.strip():
+        return []
+    try:
+        root = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return []
+
+    lines = []
+    buffer = []
+
+    def flush():
+        if buffer:
+            line = ' '.join(''.join(buffer).split())
+            if line:
+                lines.append(line)
+            buffer.clear()
+
+    skip_depth = 0
+    for event, element in etree.iterwalk(root, events=('start', 'end', 'comment', 'pi')):
+        if event in ('comment', 'pi'):
+            # 주석 자체의 내용은 버리고, 뒤에 이어지는 텍스트만 사용
+            if not skip_depth and element.tail:
+                buffer.append(element.tail)
+            continue
+        tag = element.tag
+        if event == 'start':
+            if tag in SKIP_TAGS:
+                skip_depth += 1
+                continue
+            if skip_depth:
+                continue
+            if tag in BLOCK_TAGS:
+                flush()
+            elif tag in CELL_TAGS:
+                buffer.append(' ')
+            if element.text:
+                buffer.append(element.text)
+        else:
+            if tag in SKIP_TAGS:
+                skip_depth -= 1
+            elif not skip_depth and tag in BLOCK_TAGS:
+                flush()
+            if not skip_depth and element.tail and element is not root:
+                buffer.append(element.tail)
+    flush()
+    return lines
+
+
+def _match_heading(line):
+    """섹션 제목 줄이면 (필드 이름, 같은 줄에 이어진 내용)을, 아니면 (None, None)을 반환합니다."""
+    match = _HEADING.match(line)
+    if match is None:
+        return None, None
+    if len(line) > HEADING_MAX_LENGTH and match.group('colon') is None:
+        return None, None
+    name = next(name for name in SECTION_PATTERNS if match.group(name))
+    return name, match.group('rest').strip()
+
+
+def _slice_inline_section(text, name):
+    """본문 중간에 나오는 섹션 키워드부터 다음 섹션 키워드 전까지의 텍스트. 키워드가 없으면 ""."""
+    start = re.search(SECTION_PATTERNS[name], text)
+    if start is None:
+        return ""
+    rest = text[start.end():]
+    end = re.search('|'.join(pattern for other, pattern in SECTION_PATTERNS.items() if other != name), rest)
+    if end is not None:
+        rest = rest[:end.start()]
+    return _INLINE_LEADING.sub('', rest).strip()
+
+
+def extract_sections(html):
+    """
+    공고 본문 HTML에서 담당업무/자격요건/우대사항/복리후생 등의 섹션을 한 번의 순회로 추출합니다.
+    - 반환값: SECTION_PATTERNS의 필드 이름 → 섹션 본문(줄바꿈으로 연결, 없으면 "")
+    - 같은 섹션 제목이 여러 번 나오면 내용을 이어 붙입니다.
+    - 담당업무 제목 줄이 없으면, 본문 중간에 나오는 담당업무 키워드부터 다음 섹션 키워드 전까지를 담당업무로 씁니다.
+    """
+    sections = {name: [] for name in SECTION_PATTERNS}
+    current = None
+    lines = html_to_lines(html)
+    for line in lines:
+        name, rest = _match_heading(line)
+        if name is not None:
+            current = name
+            if rest:
+                sections[name].append(rest)
+        elif current is not None:
+            sections[current].append(line)
+    result = {name: '\n'.join(parts) for name, parts in sections.items()}
+    for name in _INLINE_SECTIONS:
+        if not result[name]:
+            result[name] = _slice_inline_section('\n'.join(lines), name)
+    return result
+
+
+def extract_responsibilities(html, fallback_text):
+    """담당업무 섹션(제목 줄 → 본문 중간 키워드 순으로 찾음)을 반환합니다. 찾지 못하면 fallback_text."""
+    return extract_sections(html)["responsibilities"] or fallback_text
@@ -0,0 +1,125 @@
+"""
+사람인 수집을 여러 작업 프로세스(각자 브라우저 하나)로 나누어 실행하고 결과를 병합합니다.
+- 목록 페이지는 부모 프로세스가 한 번만 읽고, 공고를 rec_idx 기준으로 샤드에 나누어 줍니다.
+- 모든 샤드가 같은 호스트에 요청하므로 샤드마다 호스트별 속도(RateLimiter)의 1/N만 씁니다.
+  합계는 설정한 호스트별 속도를 넘지 않지만, 429 백오프는 그 응답을 받은 샤드만 늦춥니다.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+import scraper_perpocessed as scraper
+from output_sinks import JSONLSink, open_sink
+from posting_store import extract_rec_idx
+from metrics import metrics
+
+# --- 설정 ---
+DEFAULT_SHARDS = os.cpu_count() or 1
+SHARD_DIR = "shards"  # 샤드별 중간 결과(JSON Lines) 저장 폴더
+
+
+# --- 샤드 분할 ---
+def shard_of(link, shards):
+    """공고 링크가 속한 샤드 번호. rec_idx 기준이므로 어느 키워드에서 발견되어도 같은 샤드로 갑니다."""
+    rec_idx = extract_rec_idx(link)
+    if rec_idx is not None and rec_idx.isdigit():
+        return int(rec_idx) % shards
+    return zlib.crc32((link or "").encode("utf-8")) % shards
+
+
+def shard_path(shard_index):
+    return os.path.join(SHARD_DIR, f"shard_{shard_index}.jsonl")
+
+
+def split_listings(listings, shards):
+    """{키워드: 공고 목록}을 샤드별 {키워드: 그 샤드에 속한 공고 목록} 목록으로 나눕니다 (키워드 안의 순서 유지)."""
+    parts = [{keyword: [] for keyword in listings} for _ in range(shards)]
+    for keyword, base_info_list in listings.items():
+        for base_info in base_info_list:
+            parts[shard_of(base_info['link'], shards)][keyword].append(base_info)
+    return parts
+
+
+# --- 작업 프로세스에서 실행되는 함수 ---
+def run_shard(shard_index, shards, keywords, listings):
+    """
+    자체 브라우저로, 부모가 나누어 준 이 샤드의 공고(listings)만 상세 수집해 JSONL 파일에 기록합니다.
+    같은 호스트를 모든 샤드가 함께 요청하므로 호스트별 속도는 1/shards만 씁니다.
+    """
+    sink = JSONLSink(shard_path(shard_index), scraper.OUTPUT_COLUMNS)
+    print(f"[INFO] 샤드 {shard_index + 1}/{shards} 시작 (pid {os.getpid()})")
+    asyncio.run(scraper.crawl(keywords, sink, listings=listings, rate_share=1 / shards))
+    # 샤드마다 단계별 측정값을 따로 저장
+    metrics.count("postings.written", sink.count)
+    metrics.export(os.path.join(SHARD_DIR, f"metrics_{shard_index}"))
+    return sink.count
+
+
+# --- 병합 ---
+def merge_shards(paths, output_path, columns):
+    """샤드 결과를 순서대로 읽어 rec_idx(없으면 링크) 기준으로 중복을 제거하고 하나의 파일로 기록합니다."""
+    seen = set()
+    duplicates = 0
+    with open_sink(output_path, columns) as sink:
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    key = extract_rec_idx(record.get('link')) or record.get('link')
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                    sink.write(record)
+    return sink.count, duplicates
+
+
+def run(shards, keywords, output_path, keep_shards=False):
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    paths = [shard_path(i) for i in range(shards)]
+    start = time.perf_counter()
+
+    # 목록은 부모가 한 번만 읽고, 샤드는 자기 몫의 상세 페이지만 수집 (목록 요청이 샤드 수만큼 늘지 않음)
+    parts = split_listings(asyncio.run(scraper.collect_listings(keywords)), shards)
+    print(f"[INFO] 샤드별 공고 수: {[sum(len(items) for items in part.values()) for part in parts]}")
+
+    # 작업 프로세스마다 브라우저를 따로 띄우므로 spawn으로 깨끗한 프로세스에서 시작
+    with ProcessPoolExecutor(max_workers=shards, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(run_shard, i, shards, keywords, parts[i]) for i in range(shards)]
+        counts = []
+        for i, future in enumerate(futures):
+            try:
+                counts.append(future.result())
+            except Exception as e:
+                print(f"[ERROR] 샤드 {i + 1} 실패: {e}")
+                counts.append(0)
+
+    total, duplicates = merge_shards(paths, output_path, scraper.OUTPUT_COLUMNS)
+    if not keep_shards:
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+    elapsed = time.perf_counter() - start
+    print(f"[INFO] 샤드별 수집 건수: {counts}")
+    print(f"[INFO] 병합: '{output_path}'에 {total}개 공고 기록, 중복 {duplicates}건 제거 "
+          f"({elapsed:.1f}s, {total / elapsed if elapsed else 0:.2f} postings/sec)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사람인 수집을 여러 프로세스(각자 브라우저 하나)로 나누어 실행")
+    parser.add_argument("--shards", type=int, default=DEFAULT_SHARDS, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--keywords", nargs="+", default=scraper.KEYWORDS, help="검색 키워드 목록")
+    parser.add_argument("--output", default=scraper.OUTPUT_PATH,
+                        help="병합 결과 파일 (.csv / .jsonl / .parquet) 또는 Parquet 데이터셋 폴더 "
+                             "(.parquet 파일 하나는 도중에 죽으면 읽을 수 없으므로 긴 수집에는 쓰지 않음)")
+    parser.add_argument("--keep-shards", action="store_true", help=f"'{SHARD_DIR}/'의 샤드별 중간 결과를 지우지 않음")
+    args = parser.parse_args()
+    run(max(1, args.shards), args.keywords, args.output, args.keep_shards)
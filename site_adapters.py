@@ -0,0 +1,163 @@
+import re
+from urllib.parse import urlparse, quote
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from section_extractor import extract_sections
+from text_normalizer import normalize_text
+from posting_store import canonicalize_link, extract_rec_idx
+from dom_extract import extract_all, extract_fields, extract_body, SARAMIN_LISTING_FIELDS, JOBKOREA_LISTING_FIELDS
+from page_readiness import PageReadiness, SARAMIN_DETAIL_LAYOUTS, SARAMIN_FRAME_LAYOUTS
+from rate_limiter import limited_goto
+from metrics import metrics
+
+# --- 통합 출력 스키마 ---
+# 모든 사이트의 레코드가 같은 열을 가짐 (목록/상세에서 찾지 못한 값은 빈 문자열)
+NORMALIZED_COLUMNS = ['source', 'keywords', 'title', 'company', 'link',
+                      'responsibilities', 'qualifications', 'preferred', 'benefits']
+SECTION_FIELDS = ['responsibilities', 'qualifications', 'preferred', 'benefits']
+
+
+class SiteAdapter:
+    """
+    사이트 하나를 수집하는 데 필요한 부분만 모은 인터페이스입니다. 스케줄러(unified_crawler.py)는 사이트를 몰라도
+    listing_url → read_listing → canonicalize/key → read_detail 순서로 어느 사이트든 같은 방식으로 수집합니다.
+    - name: 레코드의 source 값, site: 명령행/설정에서 쓰는 짧은 이름
+    - read_listing(page)는 공고 기본 정보(link/title/company) 목록, read_detail(page)는 (본문 HTML, 본문 텍스트)를 반환합니다.
+    """
+
+    name = None
+    site = None
+    listing_selector = None   # 검색 결과 항목 선택자 (나타날 때까지 기다림)
+    listing_fields = None
+    crawl_mode = "text"       # 리소스 차단 프로필
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+
+    def listing_url(self, keyword, page_number):
+        raise NotImplementedError
+
+    def canonicalize(self, link):
+        """같은 공고를 가리키는 링크를 하나로 정규화합니다."""
+        return link
+
+    def key(self, link):
+        """사이트 간에도 겹치지 않는 공고 식별자 (키워드 간 중복 제거에 사용)."""
+        return f"{self.site}:{link}"
+
+    async def read_listing(self, page, page_url, limiter=None):
+        """검색 결과 페이지 하나를 읽습니다. 결과가 없으면 None."""
+        with metrics.timer(f"{self.site}.listing.goto"):
+            await limited_goto(page, page_url, limiter, wait_until="domcontentloaded")
+        try:
+            with metrics.timer(f"{self.site}.listing.wait_results"):
+                await page.wait_for_selector(self.listing_selector, timeout=5000)
+        except PlaywrightTimeoutError:
+            return None
+        with metrics.timer(f"{self.site}.listing.extract"):
+            return await extract_all(page, self.listing_selector, self.listing_fields, required=["link"])
+
+    async def read_detail(self, page):
+        raise NotImplementedError
+
+    def build_record(self, base_info, keywords, html_content, inner_text):
+        """상세 본문을 섹션별로 나누고 정제해 통합 스키마의 레코드를 만듭니다 (담당업무가 없으면 본문 전체)."""
+        with metrics.timer("parse"):
+            sections = extract_sections(html_content)
+        sections['responsibilities'] = sections['responsibilities'] or inner_text
+        record = {
+            'source': self.name,
+            'keywords': keywords,
+            'title': base_info.get('title') or "",
+            'company': base_info.get('company') or "",
+            'link': base_info['link'],
+        }
+        with metrics.timer("clean"):
+            for field in SECTION_FIELDS:
+                record[field] = normalize_text(sections[field], "scraper")
+        return record
+
+    def print_summary(self):
+        pass
+
+
+class SaraminAdapter(SiteAdapter):
+    name = "사람인"
+    site = "saramin"
+    listing_selector = ".item_recruit"
+    listing_fields = SARAMIN_LISTING_FIELDS
+
+    def __init__(self, base_url="https://www.saramin.co.kr"):
+        super().__init__(base_url)
+        self.detail_readiness = PageReadiness(SARAMIN_DETAIL_LAYOUTS)
+        self.frame_readiness = PageReadiness(SARAMIN_FRAME_LAYOUTS)
+
+    def listing_url(self, keyword, page_number):
+        return (f"{self.base_url}/zf_user/search?search_area=main&search_done=y&search_optional_item=n"
+                f"&searchType=search&searchword={quote(keyword)}&recruitPage={page_number}")
+
+    def canonicalize(self, link):
+        return canonicalize_link(link)
+
+    def key(self, link):
+        return f"{self.site}:{extract_rec_idx(link) or link}"
+
+    async def read_detail(self, page):
+        with metrics.timer("saramin.detail.ready"):
+            layout = await self.detail_readiness.wait(page)
+        metrics.count(f"saramin.detail.layout.{layout or 'unknown'}")
+        content_context = page
+        if layout == "iframe":
+            content_context = page.frame_locator(SARAMIN_DETAIL_LAYOUTS["iframe"]).first
+            await self.frame_readiness.wait(content_context)
+        with metrics.timer("saramin.detail.extract"):
+            return await extract_body(content_context)
+
+    def print_summary(self):
+        self.detail_readiness.print_summary("사람인 상세 페이지")
+
+
+class JobKoreaAdapter(SiteAdapter):
+    name = "잡코리아"
+    site = "jobkorea"
+    listing_selector = "div.post"
+    listing_fields = {
+        **JOBKOREA_LISTING_FIELDS,
+        "title": (".title", "text"),
+        "company": (".name", "text"),
+    }
+    detail_fields = {
+        "html": (".detail-body", "html"),
+        "text": (".detail-body", "text"),
+    }
+
+    def __init__(self, base_url="https://www.jobkorea.co.kr"):
+        super().__init__(base_url)
+
+    def listing_url(self, keyword, page_number):
+        return f"{self.base_url}/Search/?stext={quote(keyword)}&Page_No={page_number}"
+
+    def canonicalize(self, link):
+        """검색 추적용 쿼리(?sc=..., #anchor 등)를 떼고 공고 경로만 남깁니다."""
+        parsed = urlparse(link)
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+    def key(self, link):
+        match = re.search(r'/GI_Read/(\d+)', link)
+        return f"{self.site}:{match.group(1) if match else link}"
+
+    async def read_detail(self, page):
+        with metrics.timer("jobkorea.detail.ready"):
+            await page.wait_for_selector("h1.title", timeout=10000)
+        with metrics.timer("jobkorea.detail.extract"):
+            fields = await extract_fields(page, self.detail_fields)
+        if fields["html"] is None:
+            # 본문 영역이 없는 공고는 페이지 전체를 사용
+            return await extract_body(page)
+        return fields["html"], fields["text"]
+
+
+# 명령행/설정에서 쓰는 이름 → 어댑터 클래스
+ADAPTERS = {
+    SaraminAdapter.site: SaraminAdapter,
+    JobKoreaAdapter.site: JobKoreaAdapter,
+}
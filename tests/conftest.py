@@ -0,0 +1,6 @@
+import os
+import sys
+
+# 저장소 최상위의 모듈(work_queue, rate_limiter 등)을 테스트에서 바로 import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
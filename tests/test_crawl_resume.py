@@ -0,0 +1,107 @@
+import asyncio
+import subprocess
+import sys
+import pytest
+import bench_e2e
+import scraper_perpocessed
+from conftest import ROOT
+from crawl_frontier import CrawlFrontier
+from mock_server import MockServer
+from output_sinks import JSONLSink
+from search_index import read_records
+
+LINK = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={}"
+LINKS = [LINK.format(60000000 + i) for i in range(30)]
+
+# 프로세스 하나가 대기열의 공고를 순서대로 기록하다가 crash_after개째에서 정리 없이 죽음
+CRASHING_RUN = """
+import os, sys
+from crawl_frontier import CrawlFrontier
+from output_sinks import JSONLSink
+frontier_path, output_path, crash_after, links = sys.argv[1], sys.argv[2], int(sys.argv[3]), sys.argv[4:]
+frontier = CrawlFrontier(frontier_path, checkpoint_every=5, checkpoint_seconds=3600)
+frontier.reset()
+frontier.enqueue("IT", [{"link": link} for link in links])
+sink = JSONLSink(output_path, ["link", "title"], batch_size=3)
+frontier.flush = sink.flush
+for i, link in enumerate(links):
+    sink.write({"link": link, "title": str(i)})
+    frontier.mark_done(link)
+    if i + 1 == crash_after:
+        os._exit(17)
+"""
+
+
+def test_resume_after_crash_writes_every_posting_once(tmp_path):
+    frontier_path, output_path = str(tmp_path / "frontier.sqlite3"), str(tmp_path / "out.jsonl")
+    process = subprocess.run([sys.executable, "-c", CRASHING_RUN, frontier_path, output_path, "13", *LINKS], cwd=ROOT)
+    assert process.returncode == 17
+
+    frontier = CrawlFrontier(frontier_path)
+    written = {CrawlFrontier.key(record["link"]) for record in read_records(output_path)}
+    committed = frontier.keys("done")
+    # 체크포인트는 출력 파일을 먼저 기록한 뒤 커밋하므로, 완료로 기록된 공고는 모두 파일에 있음
+    assert committed and committed < written
+    frontier.recover(read_records(output_path))
+    assert frontier.keys("done") == written
+
+    sink = JSONLSink(output_path, ["link", "title"], append=True)
+    frontier.flush = sink.flush
+    for link in LINKS:
+        if not frontier.is_done(link):
+            sink.write({"link": link, "title": "resumed"})
+            frontier.mark_done(link)
+    sink.close()
+    frontier.checkpoint()
+
+    assert bench_e2e.check_resumed_output(output_path, frontier) == ([], [])
+    assert frontier.summary()["queued"] == 0
+    frontier.close()
+
+
+def test_listing_cursor_resumes_after_last_saved_page(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.sqlite3"))
+    frontier.save_page("IT", 1, [{"link": LINKS[0]}, {"link": LINKS[1]}])
+    frontier.save_page("IT", 2, [{"link": LINKS[2]}])
+    frontier.close()
+
+    frontier = CrawlFrontier(str(tmp_path / "frontier.sqlite3"))
+    assert frontier.cursor("IT") == (3, [{"link": LINKS[0]}, {"link": LINKS[1]}, {"link": LINKS[2]}], False)
+    assert frontier.cursor("자율주행") == (1, [], False)
+    frontier.close()
+
+
+def chromium_available():
+    from playwright.async_api import async_playwright
+
+    async def launch():
+        async with async_playwright() as p:
+            await (await p.chromium.launch(headless=True)).close()
+    try:
+        asyncio.run(launch())
+        return True
+    except Exception:
+        return False
+
+
+def test_crawl_resume_against_mock_server(tmp_path, monkeypatch):
+    """실제 scraper_perpocessed.crawl()을 목 서버 상대로 중간에 죽였다가 이어서 수집합니다 (Chromium 필요)."""
+    if not chromium_available():
+        pytest.skip("Playwright Chromium이 설치되어 있지 않습니다.")
+    monkeypatch.chdir(ROOT)  # 목 서버가 saramin_result.html을 틀로 읽음
+    keywords = ['IT', '자율주행']
+    with MockServer(latency=0.0) as server:
+        written = asyncio.run(bench_e2e.bench_saramin_resume({"saramin": server.base_url}, 20, keywords, str(tmp_path)))
+    assert written > 0
+
+    frontier = CrawlFrontier(str(tmp_path / "saramin_resume_frontier.sqlite3"))
+    assert bench_e2e.check_resumed_output(str(tmp_path / "saramin_resume.jsonl"), frontier) == ([], [])
+    assert frontier.summary()["queued"] == 0
+    frontier.close()
+
+
+def test_resume_rejects_single_parquet_output(monkeypatch):
+    monkeypatch.setattr(scraper_perpocessed, "OUTPUT_PATH", "saramin_final.parquet")
+    monkeypatch.setattr(sys, "argv", ["scraper_perpocessed.py", "--resume"])
+    with pytest.raises(ValueError, match="--resume"):
+        asyncio.run(scraper_perpocessed.main())
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import httpx
+import pytest
+from conftest import ROOT
+from http_fetch import FastFetcher, parse_listing_html, MIN_DETAIL_TEXT_LENGTH
+
+BASE = "https://www.saramin.co.kr"
+LONG_BODY = "담당업무\n" + "- 자율주행 인지 알고리즘 개발\n" * 10
+SHORT_BODY = "로딩 중"
+
+
+@pytest.fixture(scope="module")
+def listing_html():
+    with open(os.path.join(ROOT, "saramin_result.html"), encoding="utf-8") as f:
+        return f.read()
+
+
+def detail_page(body):
+    return f"<html><body><div class='wrap_jv_cont'>{body}</div></body></html>"
+
+
+def iframe_page(rec_idx):
+    return (f"<html><body><iframe id='iframe_content_0' "
+            f"src='/zf_user/jobs/relay/view-detail?rec_idx={rec_idx}'></iframe></body></html>")
+
+
+def frame_page(body):
+    return f"<html><body><div class='user_content'>{body.replace(chr(10), '<br>')}</div></body></html>"
+
+
+def make_fetcher(listing_html):
+    """저장된 검색 결과와 만든 상세 페이지로 응답하는 오프라인 전송 계층을 쓰는 FastFetcher."""
+    pages = {
+        "/zf_user/search": listing_html,
+        "/zf_user/jobs/relay/view?rec_idx=1": iframe_page(1),
+        "/zf_user/jobs/relay/view-detail?rec_idx=1": frame_page(LONG_BODY),
+        "/zf_user/jobs/relay/view?rec_idx=2": detail_page(f"<div class='user_content'>{LONG_BODY}</div>"),
+        "/zf_user/jobs/relay/view?rec_idx=3": iframe_page(3),
+        "/zf_user/jobs/relay/view-detail?rec_idx=3": frame_page(SHORT_BODY),
+    }
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.raw_path.decode())
+        key = request.url.path if request.url.path == "/zf_user/search" else request.url.raw_path.decode()
+        if key not in pages:
+            return httpx.Response(404, text="Not Found")
+        return httpx.Response(200, text=pages[key], headers={"Content-Type": "text/html; charset=utf-8"})
+
+    return FastFetcher(transport=httpx.MockTransport(handler)), requested
+
+
+def test_parse_stored_listing_fixture(listing_html):
+    listings = parse_listing_html(listing_html)
+    assert len(listings) == 20
+    assert all(item["link"].startswith(f"{BASE}/zf_user/jobs/relay/view?") for item in listings)
+    assert listings[0]["company"] == "(주)엘티엔터테인먼트"
+    assert listings[0]["title"].startswith("제주 드림타워 복합리조트")
+
+
+def test_fetcher_follows_detail_iframe_and_falls_back_on_short_text(listing_html):
+    async def run():
+        fetcher, requested = make_fetcher(listing_html)
+        async with fetcher:
+            listings = await fetcher.fetch_listing(f"{BASE}/zf_user/search?searchword=IT&recruitPage=1")
+            framed = await fetcher.fetch_detail(f"{BASE}/zf_user/jobs/relay/view?rec_idx=1")
+            inline = await fetcher.fetch_detail(f"{BASE}/zf_user/jobs/relay/view?rec_idx=2")
+            short = await fetcher.fetch_detail(f"{BASE}/zf_user/jobs/relay/view?rec_idx=3")
+            missing = await fetcher.fetch_detail(f"{BASE}/zf_user/jobs/relay/view?rec_idx=4")
+        return fetcher, requested, listings, framed, inline, short, missing
+
+    fetcher, requested, listings, framed, inline, short, missing = asyncio.run(run())
+    assert len(listings) == 20
+
+    # iframe이 있는 상세 페이지는 iframe 주소를 따라가 본문을 읽음
+    assert "/zf_user/jobs/relay/view-detail?rec_idx=1" in requested
+    assert "자율주행 인지 알고리즘 개발" in framed[1]
+    assert "자율주행 인지 알고리즘 개발" in inline[1]
+
+    # 본문이 MIN_DETAIL_TEXT_LENGTH보다 짧거나 응답이 없으면 None → Playwright 경로로 넘김
+    assert len(SHORT_BODY) < MIN_DETAIL_TEXT_LENGTH <= len(framed[1])
+    assert short is None and missing is None
+    assert fetcher.stats == {"listing_http": 1, "listing_playwright": 0, "detail_http": 2, "detail_playwright": 2}
+    assert fetcher.hit_rates() == {"listing": 1.0, "detail": 0.5}
+
+
+def test_empty_listing_falls_back_to_playwright(listing_html):
+    async def run():
+        fetcher = FastFetcher(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="<html></html>")))
+        async with fetcher:
+            return fetcher, await fetcher.fetch_listing(f"{BASE}/zf_user/search?searchword=IT")
+
+    fetcher, listings = asyncio.run(run())
+    assert listings is None
+    assert fetcher.stats["listing_playwright"] == 1
@@ -0,0 +1,74 @@
+import asyncio
+import io
+import random
+import shutil
+from PIL import Image
+from image_postings import ImageOCRPipeline
+from ocr_stage import OCRStage
+
+
+def stub_ocr(image_bytes):
+    """이미지 크기를 글자로 돌려주는 OCR 엔진 (작업 프로세스로 넘길 수 있도록 모듈 최상위 함수)."""
+    width, height = Image.open(io.BytesIO(image_bytes)).size
+    if width == 13:
+        raise RuntimeError("인식 실패")
+    return f"이미지 {width}x{height}\n"
+
+
+def write_image(path, width, height, seed):
+    rng = random.Random(seed)
+    image = Image.new("L", (width, height))
+    image.putdata([rng.randrange(256) for _ in range(width * height)])
+    image.save(path)
+    return path.as_uri()
+
+
+def test_pipeline_ocrs_local_images_in_order_with_cache_and_failures(tmp_path):
+    first = write_image(tmp_path / "a.png", 40, 20, seed=1)
+    second = write_image(tmp_path / "b.png", 30, 30, seed=2)
+    shutil.copy(tmp_path / "a.png", tmp_path / "a_copy.png")
+    broken = write_image(tmp_path / "broken.png", 13, 13, seed=3)
+    missing = (tmp_path / "missing.png").as_uri()
+
+    async def run():
+        stage = OCRStage(workers=1, ocr_func=stub_ocr)
+        pipeline = ImageOCRPipeline(stage)
+        try:
+            text = await pipeline.process([first, missing, second, broken])
+            # 같은 내용의 이미지는 OCR을 다시 하지 않고 결과를 재사용
+            again = await pipeline.schedule([(tmp_path / "a_copy.png").as_uri()])
+        finally:
+            await pipeline.aclose()
+            stage.shutdown()
+        return text, again, pipeline, stage
+
+    text, again, pipeline, stage = asyncio.run(run())
+    assert text == "이미지 40x20\n이미지 30x30"  # 원래 이미지 순서, 실패한 이미지는 빠짐
+    assert again == "이미지 40x20"
+    assert stage.cache_hits == 1
+    assert stage.processed == 3  # 실패한 OCR도 처리 건수에는 포함 (빈 문자열)
+    assert pipeline.images_downloaded == 4 and pipeline.download_failures == 1
+
+
+class FailingOCR:
+    """submit()이 돌려준 작업이 예외로 끝나는 OCR 스텁."""
+
+    def submit(self, image_bytes):
+        async def fail():
+            raise RuntimeError("OCR 엔진 없음")
+        return asyncio.ensure_future(fail())
+
+
+def test_pipeline_survives_ocr_engine_errors(tmp_path):
+    url = write_image(tmp_path / "a.png", 10, 10, seed=1)
+
+    async def run():
+        pipeline = ImageOCRPipeline(FailingOCR())
+        try:
+            return await pipeline.process([url]), pipeline
+        finally:
+            await pipeline.aclose()
+
+    text, pipeline = asyncio.run(run())
+    assert text == ""
+    assert pipeline.ocr_failures == 1
@@ -0,0 +1,27 @@
+import pytest
+from metrics import Histogram, MetricsRegistry, RESERVOIR_SIZE
+
+
+def test_histogram_memory_is_bounded_and_aggregates_exact():
+    histogram = Histogram(buckets=(0.25, 0.5, 1.0))
+    n = 50_000
+    for i in range(n):
+        histogram.observe(i / n)
+    assert len(histogram.samples) == RESERVOIR_SIZE
+    assert histogram.count == n
+    assert histogram.sum == pytest.approx(sum(i / n for i in range(n)))
+    assert histogram.min == 0.0 and histogram.max == (n - 1) / n
+    assert histogram.bucket_counts == [n // 4 + 1, n // 2 + 1, n]
+    # 균등 표본이므로 백분위는 실제 값에 가까움
+    assert histogram.percentile(0.5) == pytest.approx(0.5, abs=0.05)
+    assert histogram.percentile(0.95) == pytest.approx(0.95, abs=0.03)
+
+
+def test_registry_summary_and_prometheus_use_exact_counts():
+    registry = MetricsRegistry()
+    for _ in range(RESERVOIR_SIZE * 3):
+        registry.observe_stage("detail.goto", 0.2)
+    summary = registry.summary()["stages"]["detail.goto"]
+    assert summary["count"] == RESERVOIR_SIZE * 3
+    assert summary["min"] == summary["max"] == summary["p50"] == 0.2
+    assert f'crawl_stage_seconds_count{{stage="detail.goto"}} {RESERVOIR_SIZE * 3}' in registry.to_prometheus()
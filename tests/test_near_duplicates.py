@@ -0,0 +1,44 @@
+from near_duplicates import NearDuplicateIndex, MIN_SHINGLES, THRESHOLD, shingles
+
+BASE = ("담당업무 자율주행 인지 모듈 개발 및 차량 데이터 수집 파이프라인 구축, 센서 융합 알고리즘 고도화. "
+        "자격요건 관련 분야 경력 3년 이상, Python 또는 C++ 능숙자, Linux 환경 개발 경험. "
+        "우대사항 ROS 사용 경험자, 클라우드 운영 경험, 오픈소스 기여 경험.")
+OTHER = ("담당업무 웹 서비스 백엔드 API 개발 및 운영, 결제 시스템 유지보수와 사내 어드민 기능 개선. "
+         "자격요건 Java/Spring 실무 경험, RDBMS 설계 경험, 코드 리뷰 문화 경험. "
+         "우대사항 대용량 트래픽 처리 경험, 쿠버네티스 운영 경험.")
+
+
+def test_near_duplicates_cluster_at_threshold_and_keep_first_as_root():
+    index = NearDuplicateIndex(":memory:")
+    assert index.add("1", BASE, "link-1") is None
+    assert index.add("2", OTHER, "link-2") is None
+    # 제목만 바꿔 다시 올린 공고 (본문 끝 한 단어만 다름)
+    root, root_link, score = index.add("3", BASE.replace("기여 경험.", "기여 경험자."), "link-3")
+    assert (root, root_link) == ("1", "link-1") and score >= THRESHOLD
+    assert index.clusters() == {"1": ["1", "3"]}
+    # 기준을 1.0으로 올리면 같은 변형도 유사 중복이 아님
+    strict = NearDuplicateIndex(":memory:", threshold=1.0)
+    strict.add("1", BASE)
+    assert strict.add("3", BASE.replace("기여 경험.", "기여 경험자.")) is None
+    index.close()
+    strict.close()
+
+
+def test_re_adding_the_same_key_does_not_create_a_duplicate():
+    index = NearDuplicateIndex(":memory:")
+    index.add("1", BASE, "link-1")
+    assert index.add("1", BASE, "link-1") is None
+    assert index.add("1", BASE + " 복리후생 4대보험.", "link-1") is None  # 본문이 바뀐 같은 공고
+    assert (index.added, index.duplicates) == (1, 0)
+    assert index.clusters(min_size=1) == {"1": ["1"]}
+    index.close()
+
+
+def test_short_text_is_skipped():
+    index = NearDuplicateIndex(":memory:")
+    short = "(주)회사 채용 공고 이미지 참조"
+    assert len(shingles(short)) < MIN_SHINGLES
+    assert index.add("1", short) is None
+    assert index.add("2", short) is None
+    assert (index.added, index.skipped_short) == (0, 2)
+    index.close()
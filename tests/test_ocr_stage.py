@@ -0,0 +1,58 @@
+import asyncio
+import io
+from PIL import Image, ImageDraw
+from ocr_stage import OCRStage
+
+
+def stub_ocr(image_bytes):
+    """이미지 바이트 길이를 글자로 돌려주는 OCR 엔진 (작업 프로세스로 넘길 수 있도록 모듈 최상위 함수)."""
+    return f"{len(image_bytes)}"
+
+
+def posting_screenshot(text):
+    """같은 틀(머리글/여백)에 본문 글자만 다른 공고 스크린샷."""
+    image = Image.new("L", (400, 600), 255)
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, 400, 80), fill=40)
+    draw.text((20, 120), text, fill=0)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_template_lookalikes_get_their_own_ocr():
+    first = posting_screenshot("담당업무: 백엔드 개발")
+    other = posting_screenshot("담당업무: 데이터 분석 및 모델링")
+
+    async def run():
+        stage = OCRStage(workers=1, ocr_func=stub_ocr)
+        try:
+            texts = [await stage.submit(first), await stage.submit(other), await stage.submit(first)]
+        finally:
+            stage.shutdown()
+        return texts, stage
+
+    texts, stage = asyncio.run(run())
+    assert texts == [str(len(first)), str(len(other)), str(len(first))]
+    assert stage.processed == 2 and stage.cache_hits == 1  # 내용이 완전히 같을 때만 재사용
+
+
+def test_reuse_cache_is_bounded_lru():
+    images = [posting_screenshot(f"공고 {i}") for i in range(4)]
+
+    async def run():
+        stage = OCRStage(workers=1, ocr_func=stub_ocr, max_cached=2)
+        try:
+            await stage.submit(images[0])
+            await stage.submit(images[1])
+            await stage.submit(images[0])  # 최근 사용 → 남음
+            await stage.submit(images[2])  # images[1]을 잊음
+            await stage.submit(images[0])
+            await stage.submit(images[1])  # 다시 OCR
+        finally:
+            stage.shutdown()
+        return stage
+
+    stage = asyncio.run(run())
+    assert len(stage._by_content) == 2
+    assert stage.cache_hits == 2 and stage.processed == 4
@@ -0,0 +1,51 @@
+import pandas as pd
+import pyarrow.dataset as ds
+from output_sinks import open_sink
+from preprocessed import FrameWriter
+
+COLUMNS = ["source", "title", "link"]
+
+
+def read_dataset(path):
+    table = ds.dataset(path, format="parquet", partitioning="hive").to_table()
+    return sorted(zip(table.column("source").to_pylist(), table.column("link").to_pylist()))
+
+
+def write(path, source, links, **options):
+    with open_sink(str(path), COLUMNS, **options) as sink:
+        for link in links:
+            sink.write({"source": source, "title": "t", "link": link})
+
+
+def test_same_day_runs_keep_each_others_files(tmp_path):
+    path = tmp_path / "postings"
+    write(path, "사람인", ["a", "b"])
+    write(path, "잡코리아", ["c"])  # 같은 날 다른 수집기
+    write(path, "사람인", ["d"])     # 같은 날 다시 실행해도 아침 결과를 지우지 않음
+    assert read_dataset(path) == [("사람인", "a"), ("사람인", "b"), ("사람인", "d"), ("잡코리아", "c")]
+
+
+def test_overwrite_replaces_only_the_written_source_partition(tmp_path):
+    path = tmp_path / "postings"
+    write(path, "사람인", ["a", "b"])
+    write(path, "잡코리아", ["c"])
+    write(path, "사람인", ["d"], overwrite=True)
+    assert read_dataset(path) == [("사람인", "d"), ("잡코리아", "c")]
+
+
+def test_frame_writer_never_deletes_an_existing_folder(tmp_path):
+    path = tmp_path / "data"
+    path.mkdir()
+    (path / "notes.txt").write_text("keep")
+    frame = pd.DataFrame({"source": ["사람인"], "link": ["a"], "crawl_date": ["2024-05-01"]})
+    for _ in range(2):
+        writer = FrameWriter(str(path))
+        writer.write(frame)
+        writer.close()
+    assert (path / "notes.txt").read_text() == "keep"
+    assert len(list(path.rglob("*.parquet"))) == 2
+
+    writer = FrameWriter(str(path), overwrite=True)
+    writer.write(frame)
+    writer.close()
+    assert len(list(path.rglob("*.parquet"))) == 1 and (path / "notes.txt").exists()
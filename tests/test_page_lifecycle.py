@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import page_lifecycle
+import unified_crawler
+from page_lifecycle import BrowserLifecycle
+
+
+class FakePage:
+    """goto마다 framenavigated, close 시 close 이벤트를 보내는 탭."""
+
+    def __init__(self):
+        self.main_frame = object()
+        self.handlers = {}
+        self.closed = False
+        self.visits = []
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        self.visits.append(url)
+        for handler in self.handlers.get("framenavigated", []):
+            handler(self.main_frame)
+
+    async def close(self):
+        self.closed = True
+        for handler in self.handlers.get("close", []):
+            handler(self)
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+class FakeAdapter:
+    """페이지마다 새 공고 2개를 돌려주는 목록."""
+
+    name = "fake"
+
+    def listing_url(self, keyword, page_number):
+        return f"https://example.com/{keyword}?page={page_number}"
+
+    async def read_listing(self, page, page_url, limiter=None):
+        await page.goto(page_url)
+        return [{"link": f"{page_url}#{i}"} for i in range(2)]
+
+    def canonicalize(self, link):
+        return link
+
+    def key(self, link):
+        return link
+
+
+def test_sample_reads_memory_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def fake_process_memory():
+        threads.append(threading.get_ident())
+        return 10.0, 20.0, 30.0
+
+    monkeypatch.setattr(page_lifecycle, "process_memory", fake_process_memory)
+    lifecycle = BrowserLifecycle(FakeBrowser(), history_path=None)
+
+    async def run():
+        await lifecycle.start()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert threads and all(thread != loop_thread for thread in threads)
+    assert lifecycle.history[-1]["renderer_mb"] == 20.0
+
+
+def test_listing_tab_is_recycled_after_max_navigations(monkeypatch):
+    monkeypatch.setattr(page_lifecycle, "process_memory", lambda: (None, None, None))
+    monkeypatch.setattr(unified_crawler, "TARGET_JOB_COUNT", 20)
+    browser = FakeBrowser()
+    lifecycle = BrowserLifecycle(browser, max_navigations=3, history_path=None)
+
+    async def run():
+        await lifecycle.start()
+        page = await lifecycle.new_page()
+        base_info_list, last_page = await unified_crawler.collect_listing(
+            FakeAdapter(), page, "IT", lifecycle=lifecycle)
+        return page, base_info_list, last_page
+
+    first_page, base_info_list, last_page = asyncio.run(run())
+    pages = browser.contexts[0].pages
+    assert len(base_info_list) == 20  # 10 페이지
+    assert first_page.closed and not last_page.closed
+    assert last_page is pages[-1]
+    assert all(len(page.visits) <= 3 for page in pages)
+    assert lifecycle.pages_recycled == 3
@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+import page_readiness
+from page_readiness import PageReadiness, SARAMIN_DETAIL_LAYOUTS, MIN_SAMPLES, SAFETY_FACTOR
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+        self.first = self
+
+    async def wait_for(self, state, timeout):
+        self.page.timeouts.append(timeout / 1000)
+        if self.page.layout is None:
+            raise PlaywrightTimeoutError("timeout")
+        await asyncio.sleep(self.page.delay)
+
+    async def evaluate(self, script, layouts):
+        return self.page.layout
+
+
+class FakePage:
+    """정해진 시간 뒤에 정해진 형태가 나타나는 (layout=None이면 끝까지 나타나지 않는) 페이지."""
+
+    def __init__(self):
+        self.layout = None
+        self.delay = 0.0
+        self.timeouts = []
+
+    def locator(self, selector):
+        return FakeLocator(self)
+
+
+def test_rare_layout_uses_overall_timeout_instead_of_initial(monkeypatch):
+    monkeypatch.setattr(page_readiness, "MIN_TIMEOUT", 0.01)
+    readiness = PageReadiness(SARAMIN_DETAIL_LAYOUTS, initial_timeout=3.0)
+    page = FakePage()
+
+    async def run():
+        page.layout, page.delay = "iframe", 0.01
+        for _ in range(MIN_SAMPLES):
+            assert await readiness.wait(page) == "iframe"
+        # 이미지 형태는 한 번만 관측 → 그 형태만으로는 학습 전
+        page.layout = "image"
+        assert await readiness.wait(page) == "image"
+        page.layout = None
+        assert await readiness.wait(page) is None
+
+    asyncio.run(run())
+    assert page.timeouts[:MIN_SAMPLES] == [3.0] * MIN_SAMPLES  # 전체 관측이 쌓이기 전에는 초기값
+    expected = readiness.overall.percentile(page_readiness.TIMEOUT_PERCENTILE) * SAFETY_FACTOR
+    assert readiness.learned_timeout("image") == pytest.approx(expected)
+    assert page.timeouts[-1] < 1.0  # 표본이 적은 형태가 있어도 3초까지 기다리지 않음
+    assert readiness.misses == 1
@@ -0,0 +1,29 @@
+import time
+from posting_store import PostingStore
+
+LINK = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=123&searchword=IT"
+
+
+def record(responsibilities="자율주행 인지 개발", title="인지 엔지니어"):
+    return {"link": LINK, "title": title, "company": "(주)모빌리티", "responsibilities": responsibilities}
+
+
+def test_store_reports_changed_bodies_on_refetch(tmp_path):
+    store = PostingStore(str(tmp_path / "postings.sqlite3"))
+    assert store.save(record()) == "new"
+    assert store.lookup_unchanged(record()) == record()  # 목록 정보가 같으면 상세 수집을 건너뜀
+    assert store.lookup_unchanged(record(title="수정된 제목")) is None
+
+    assert store.save(record()) == "unchanged"
+    assert store.save(record("자율주행 인지/판단 개발")) == "changed"
+    assert store.fetched == {"new": 1, "changed": 1, "unchanged": 1}
+    assert store.lookup_unchanged(record())["responsibilities"] == "자율주행 인지/판단 개발"
+    store.close()
+
+
+def test_store_refetches_after_age_limit(tmp_path):
+    store = PostingStore(str(tmp_path / "postings.sqlite3"), refetch_after_days=0)
+    store.save(record())
+    time.sleep(0.01)
+    assert store.lookup_unchanged(record()) is None
+    store.close()
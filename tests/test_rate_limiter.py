@@ -0,0 +1,174 @@
+import asyncio
+import time
+import httpx
+import pytest
+from playwright.async_api import Error as PlaywrightError
+import mock_server
+import rate_limiter
+from conftest import ROOT
+from http_fetch import FastFetcher
+from mock_server import MockServer
+from rate_limiter import RateLimiter, ServerError, INITIAL_RATE, FAILURE_DECREASE, limited_goto
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.chdir(ROOT)  # 목 서버가 saramin_result.html을 틀로 읽음
+    monkeypatch.setattr(mock_server, "HANG_SECONDS", 1.0)
+    with MockServer(latency=0.0) as server:
+        yield server
+
+
+def host_stats(limiter):
+    (stats,) = limiter.summary().values()
+    return stats
+
+
+async def fetch_listing(server, limiter, timeout=5.0, on_injected=None):
+    """목 서버의 검색 결과 페이지를 FastFetcher로 읽습니다. on_injected는 첫 주입 응답 뒤에 한 번 호출됩니다."""
+    async with FastFetcher(timeout=timeout, limiter=limiter) as fetcher:
+        task = asyncio.create_task(fetcher.fetch_listing(f"{server.base_url}/zf_user/search?searchword=IT&recruitPage=1"))
+        if on_injected is not None:
+            while not sum(server.summary()["injected"].values()):
+                await asyncio.sleep(0.01)
+            on_injected()
+        return await task
+
+
+def test_throttled_request_waits_for_retry_after_and_lowers_rate(server):
+    server.httpd.state.failure_rate = 1.0
+    limiter = RateLimiter()
+
+    def recover():
+        server.httpd.state.failure_rate = 0.0
+
+    start = time.monotonic()
+    listings = asyncio.run(fetch_listing(server, limiter, on_injected=recover))
+    assert listings  # 재시도한 요청은 정상 응답을 파싱
+    assert time.monotonic() - start >= 1.0  # 목 서버의 Retry-After: 1
+    stats = host_stats(limiter)
+    assert stats["throttled"] == 1 and stats["retries"] == 1
+    # 실패하면 곱으로 낮추고 (AIMD), 성공하면 조금씩 올림
+    assert stats["rate"] == pytest.approx(INITIAL_RATE * FAILURE_DECREASE + rate_limiter.ADDITIVE_INCREASE)
+
+
+def test_timeouts_are_retried_then_given_up(server, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "BACKOFF_BASE", 0.01)
+    server.httpd.state.timeout_rate = 1.0
+    limiter = RateLimiter(max_retries=2)
+    assert asyncio.run(fetch_listing(server, limiter, timeout=0.2)) is None  # Playwright 경로로 넘김
+    stats = host_stats(limiter)
+    assert stats["failures"] == 3 and stats["retries"] == 2 and stats["throttled"] == 0
+    assert stats["rate"] == pytest.approx(max(rate_limiter.MIN_RATE, INITIAL_RATE * FAILURE_DECREASE ** 3))
+    assert server.summary()["injected"]["timeout"] == 3
+
+
+def test_circuit_opens_after_consecutive_failures(server, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(rate_limiter, "FAILURE_THRESHOLD", 3)
+    monkeypatch.setattr(rate_limiter, "COOLDOWN_SECONDS", 0.5)
+    server.httpd.state.timeout_rate = 1.0
+    limiter = RateLimiter(max_retries=3)
+
+    start = time.monotonic()
+    assert asyncio.run(fetch_listing(server, limiter, timeout=0.1)) is None
+    stats = host_stats(limiter)
+    assert stats["circuit_opens"] == 2  # 세 번째 실패에서 열리고, 다시 열린 뒤 첫 요청이 실패하자 곧바로 다시 열림
+    assert time.monotonic() - start >= 0.5  # 네 번째 시도는 회로가 닫힐 때까지 기다림
+    assert server.summary()["injected"]["timeout"] == 4
+
+
+class FakeResponse:
+    status = 200
+
+
+class FakePage:
+    """goto()가 정해진 오류를 차례로 낸 뒤 성공하는 탭."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def goto(self, url, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return FakeResponse()
+
+
+def test_limited_goto_retries_playwright_network_errors(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "BACKOFF_BASE", 0.01)
+    limiter = RateLimiter()
+    page = FakePage([PlaywrightError("net::ERR_CONNECTION_RESET at http://example.com/"),
+                     PlaywrightError("net::ERR_CONNECTION_REFUSED at http://example.com/")])
+    assert asyncio.run(limited_goto(page, "http://example.com/", limiter)).status == 200
+    assert page.calls == 3
+    assert host_stats(limiter)["retries"] == 2
+
+
+def test_limited_goto_does_not_retry_other_playwright_errors():
+    limiter = RateLimiter()
+    page = FakePage([PlaywrightError("Target page, context or browser has been closed")])
+    with pytest.raises(PlaywrightError):
+        asyncio.run(limited_goto(page, "http://example.com/", limiter))
+    assert page.calls == 1
+
+
+def test_rate_share_splits_the_host_rate():
+    limiter = RateLimiter(share=0.5)
+
+    async def run():
+        for _ in range(3):
+            await limiter.call("http://example.com/", lambda: asyncio.sleep(0))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    # 절반 크기의 버스트(2개) 뒤에는 INITIAL_RATE / 2 속도로 요청 (share가 1이면 세 요청 모두 버스트 안)
+    assert time.monotonic() - start >= 0.8 * 2 / INITIAL_RATE
+    state = limiter.hosts["example.com"]
+    assert state.burst == rate_limiter.BURST / 2
+    assert state.rate <= rate_limiter.MAX_RATE / 2
+
+
+def test_steady_server_errors_lower_the_rate_before_the_breaker(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "BURST", 100)
+    limiter = RateLimiter()
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) % 2:
+            raise ServerError(500)
+        return "ok"
+
+    async def run():
+        rates = []
+        for _ in range(8):
+            try:
+                await limiter.call("http://example.com/", flaky)
+            except ServerError:
+                pass
+            rates.append(host_stats(limiter)["rate"])
+        return rates
+
+    rates = asyncio.run(run())
+    stats = host_stats(limiter)
+    assert stats["retries"] == 0 and stats["failures"] == 4 and stats["circuit_opens"] == 0
+    assert stats["error_rate"] > rate_limiter.ERROR_RATE_THRESHOLD
+    # 오류율이 높은 동안에는 성공한 요청 뒤에도 속도가 오르지 않음
+    assert rates[3] < rates[2] and rates[5] < rates[4]
+    assert rates[-1] == pytest.approx(rate_limiter.MIN_RATE)
+
+
+def test_http_5xx_counts_as_host_error_without_retry():
+    limiter = RateLimiter()
+
+    async def run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(500, text="error"))
+        async with FastFetcher(transport=transport, limiter=limiter) as fetcher:
+            return await fetcher.fetch_listing("http://example.com/zf_user/search?searchword=IT")
+
+    assert asyncio.run(run()) is None
+    stats = host_stats(limiter)
+    assert stats["failures"] == 1 and stats["retries"] == 0
+    assert stats["rate"] == pytest.approx(INITIAL_RATE * FAILURE_DECREASE)
@@ -0,0 +1,23 @@
+import pytest
+from resource_blocker import ResourceBlocker
+
+
+@pytest.mark.parametrize("url, resource_type, blocked", [
+    ("https://www.saramin.co.kr/upload/view_img/a.png", "image", False),  # 허용 호스트의 하위 도메인
+    ("https://saramin.co.kr/upload/view_img/a.png", "image", False),
+    ("https://saramin.co.kr.evil.com/a.png", "image", True),  # 접미사가 아니면 허용 호스트가 아님
+    ("https://cdn.example-ads.com/banner.png", "image", True),  # image_hosts가 아닌 호스트의 이미지
+    ("https://cdn.example-ads.com/banner.png", "imageset", True),
+    ("https://www.saramin.co.kr/css/main.css", "stylesheet", False),  # 스크린샷 모양을 위해 스타일은 받음
+    ("https://www.facebook.com/tr", "xhr", True),
+    ("https://notfacebook.com/api", "xhr", False),  # 차단 도메인을 이름에 포함할 뿐인 호스트
+    ("https://t1.kakaopixel.com/pixel.js", "script", True),  # 키워드 목록으로 차단
+    ("https://www.saramin.co.kr/zf_user/search", "document", False),
+])
+def test_ocr_profile_matches_hosts_by_domain_suffix(url, resource_type, blocked):
+    blocker = ResourceBlocker("ocr")
+    assert blocker.should_block(url, resource_type) is blocked
+
+
+def test_full_profile_blocks_nothing():
+    assert not ResourceBlocker("full").should_block("https://www.facebook.com/tr", "image")
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import pytest
+import response_cache
+import scraper_perpocessed
+from conftest import ROOT
+from http_fetch import FastFetcher
+from inflight import InflightRegistry
+from mock_server import MockServer
+from response_cache import ResponseCache
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(response_cache, "time", fake)
+    return fake
+
+
+def blob_files(cache):
+    return [name for _, _, files in os.walk(cache.blob_dir) for name in files]
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("https://a/1", "listing", {"html": "<p>1</p>"})
+    clock.now += 59
+    assert cache.get("https://a/1") == {"html": "<p>1</p>"}
+    clock.now += 2
+    assert cache.get("https://a/1") is None
+    # 리플레이용(ttl=None)으로 열면 만료된 항목도 읽음
+    assert ResponseCache(str(tmp_path), ttl=None).get("https://a/1") == {"html": "<p>1</p>"}
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+
+def test_same_body_is_stored_once(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path))
+    payload = {"html": "<p>같은 본문</p>", "text": "같은 본문"}
+    cache.put("https://a/1", "detail", payload)
+    cache.put("https://a/1?utm=x", "detail", payload)
+    assert len(blob_files(cache)) == 1
+    assert cache.get("https://a/1?utm=x") == payload
+    cache.close()
+
+
+def test_eviction_removes_least_recently_accessed_and_keeps_shared_blobs(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path))
+    payloads = {url: {"html": url * 40} for url in ("https://a/1", "https://a/2", "https://a/3")}
+    for url, payload in payloads.items():
+        cache.put(url, "detail", payload)
+        clock.now += 1
+    cache.put("https://a/3-copy", "detail", payloads["https://a/3"])
+    clock.now += 1
+    cache.get("https://a/1")  # 가장 먼저 넣었지만 최근에 사용
+    size = cache.total_bytes() // 3
+    cache.max_bytes = size * 2
+    clock.now += 1
+    cache.put("https://a/4", "detail", {"html": "x" * (size - 20)})
+    assert cache.get("https://a/2") is None  # 가장 오래 사용하지 않은 항목부터 제거
+    assert cache.get("https://a/1") is not None
+    assert cache.total_bytes() <= cache.max_bytes
+    assert len(blob_files(cache)) == len({row[0] for row in cache.conn.execute("SELECT blob FROM entries")})
+    cache.close()
+
+
+class ListSink:
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+
+def test_replay_from_filled_cache_matches_live_records_offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(scraper_perpocessed, "TARGET_JOB_COUNT", 25)
+    keywords = ["IT", "모빌리티"]
+    cache = ResponseCache(str(tmp_path / "cache"))
+
+    async def crawl_live():
+        # 브라우저 없이 HTTP 고속 경로만으로 수집하면서 캐시를 채움 (이미지 공고는 목 서버에서 끔)
+        registry = InflightRegistry()
+        live = {}
+        async with FastFetcher(cache=cache) as fetcher:
+            for keyword in keywords:
+                listings, _ = await scraper_perpocessed.collect_listing(None, keyword, fetcher)
+                for i, listing in enumerate(listings):
+                    if registry.claim(listing['link'], keyword):
+                        record = await scraper_perpocessed.process_detail(None, i, dict(listing), keyword, fetcher)
+                        live[record['link']] = record
+        return live
+
+    with MockServer(latency=0.0, image_rate=0.0) as server:
+        monkeypatch.setattr(scraper_perpocessed, "SARAMIN_BASE_URL", server.base_url)
+        live = asyncio.run(crawl_live())
+    cache.close()
+
+    # 서버를 내린 뒤, 만료 없이 캐시만으로 다시 파싱·정제
+    sink = ListSink()
+    replay_cache = ResponseCache(str(tmp_path / "cache"), ttl=None)
+    assert scraper_perpocessed.replay_from_cache(replay_cache, keywords, sink) == len(live) > 25
+    replay_cache.close()
+    assert replay_cache.misses == 0
+    for record in sink.records:
+        expected = live[record['link']]
+        assert expected['keywords'][0] in record['keywords']
+        assert {k: v for k, v in record.items() if k != 'keywords'} == \
+               {k: v for k, v in expected.items() if k != 'keywords'}
@@ -0,0 +1,57 @@
+import asyncio
+import saramin_test
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage(self)
+
+
+class ListSink:
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+
+async def slow_ocr(text):
+    await asyncio.sleep(0.05)
+    return text
+
+
+def test_returned_count_includes_image_postings_written_after_ocr(monkeypatch):
+    listings = [{"link": f"https://a/{i}", "title": f"공고 {i}"} for i in range(6)]
+
+    async def fake_collect_listing(page, keyword, limiter=None):
+        return [dict(listing) for listing in listings]
+
+    async def fake_process_detail(page, i, base_info, keyword, image_pipeline=None, limiter=None):
+        # 짝수 번째는 이미지 공고: OCR이 끝난 뒤에야 기록됨
+        if i % 2 == 0:
+            base_info['_ocr_task'] = asyncio.ensure_future(slow_ocr(f"담당업무 {i}"))
+        else:
+            base_info['responsibilities'] = f"본문 {i}"
+        return base_info
+
+    monkeypatch.setattr(saramin_test, "collect_listing", fake_collect_listing)
+    monkeypatch.setattr(saramin_test, "process_detail", fake_process_detail)
+    sink = ListSink()
+
+    async def run():
+        return await saramin_test.scrape_saramin(FakePage(FakeContext()), "IT", sink=sink)
+
+    assert asyncio.run(run()) == len(sink.records) == 6
+    assert sorted(record['link'] for record in sink.records) == sorted(listing['link'] for listing in listings)
@@ -0,0 +1,22 @@
+from bench_section_extractor import build_posting, build_inline_posting, legacy_parse_responsibilities_robust
+from section_extractor import extract_sections, extract_responsibilities
+
+
+def test_sections_by_heading():
+    sections = extract_sections(build_posting(3, "table"))
+    assert sections["responsibilities"] == "서비스 백엔드 개발\n데이터 파이프라인 운영"
+    assert sections["qualifications"] == "Python 3년 이상"
+    assert sections["preferred"] == "AWS 경험"
+    assert sections["benefits"].startswith("4대보험\n")  # 마지막 섹션은 본문 끝까지
+
+
+def test_responsibilities_keyword_inside_text():
+    # 제목 줄이 없으면 본문 중간의 담당업무 키워드부터 다음 섹션 키워드 전까지 (기존 구현의 두 번째 폴백)
+    html = build_inline_posting()
+    responsibilities = extract_responsibilities(html, "본문 전체")
+    assert responsibilities == "- 인지 알고리즘 개발 - 센서 퓨전 모듈 개발"
+    assert responsibilities.split() == legacy_parse_responsibilities_robust(html, "본문 전체").split()
+
+
+def test_whole_text_fallback_without_keyword():
+    assert extract_responsibilities("<div><p>회사 소개만 있는 공고</p></div>", "본문 전체") == "본문 전체"
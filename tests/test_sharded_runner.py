@@ -0,0 +1,18 @@
+from sharded_runner import split_listings, shard_of
+
+
+def test_split_listings_sends_each_posting_to_one_shard_in_order():
+    links = [f"https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={60000000 + i}" for i in range(10)]
+    listings = {"IT": [{"link": link} for link in links], "모빌리티": [{"link": links[3]}, {"link": links[8]}]}
+    parts = split_listings(listings, 3)
+    assert len(parts) == 3
+    for index, part in enumerate(parts):
+        assert set(part) == {"IT", "모빌리티"}
+        for keyword, items in part.items():
+            assert all(shard_of(item["link"], 3) == index for item in items)
+            # 키워드 안의 원래 순서 유지
+            assert [item["link"] for item in items] == [item["link"] for item in listings[keyword]
+                                                          if shard_of(item["link"], 3) == index]
+    assert sorted(item["link"] for part in parts for item in part["IT"]) == sorted(links)
+    # 여러 키워드에 나온 공고는 같은 샤드로 감 (샤드 안에서 키워드 중복 제거)
+    assert all(sum(links[3] in [item["link"] for item in part[k]] for k in part) in (0, 2) for part in parts)
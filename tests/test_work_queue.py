@@ -0,0 +1,203 @@
+import asyncio
+import json
+import subprocess
+import sys
+import time
+import pytest
+import page_lifecycle
+import work_queue
+from conftest import ROOT
+from page_lifecycle import BrowserLifecycle
+from work_queue import SQLiteBroker, QueueWorker, detail_task_key, export_results, wait_until_drained
+
+LINK = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={}"
+
+
+@pytest.fixture
+def broker(tmp_path):
+    broker = SQLiteBroker(str(tmp_path / "queue.sqlite3"), max_attempts=3)
+    yield broker
+    broker.close()
+
+
+def test_expired_lease_is_redelivered_and_stale_ack_rejected(broker):
+    broker.put("detail", {"n": 1}, "detail:1")
+    first = broker.lease(worker="a", visibility_timeout=0.2)
+    assert first["attempts"] == 1
+    assert broker.lease(worker="b") is None  # 임대 중에는 다른 작업자에게 배달되지 않음
+
+    time.sleep(0.3)
+    second = broker.lease(worker="b", visibility_timeout=60)
+    assert second["id"] == first["id"]
+    assert second["attempts"] == 2
+    assert second["token"] != first["token"]
+
+    assert not broker.ack(first["id"], first["token"], {"by": "a"})  # 만료된 임대의 ack는 거부
+    assert broker.ack(second["id"], second["token"], {"by": "b"})
+    assert broker.results("detail") == [{"by": "b"}]
+    assert broker.stats()["redelivered"] == 1
+
+
+def test_nack_delays_redelivery(broker):
+    broker.put("detail", {}, "detail:1")
+    task = broker.lease()
+    assert broker.nack(task["id"], task["token"], delay=0.2, error="boom")
+    assert broker.lease() is None
+    time.sleep(0.3)
+    assert broker.lease()["attempts"] == 2
+
+
+def test_task_is_dead_after_max_attempts(broker):
+    broker.put("detail", {}, "detail:1")
+    for _ in range(broker.max_attempts):
+        task = broker.lease(visibility_timeout=0.05)
+        assert task is not None
+        time.sleep(0.1)
+    assert broker.lease() is None
+    assert broker.stats()["dead"] == 1
+
+
+def test_reclaim_marks_expired_and_exhausted_tasks(broker):
+    broker.put("listing", {}, "listing:1")
+    broker.put("detail", {}, "detail:1")
+    broker.lease(kinds=["listing"], visibility_timeout=0.05)
+    for attempt in range(1, broker.max_attempts + 1):
+        task = broker.lease(kinds=["detail"])
+        broker.nack(task["id"], task["token"], delay=0 if attempt < broker.max_attempts else 60)
+    time.sleep(0.1)
+    assert broker.reclaim() == {"expired": 1, "dead": 1}
+    stats = broker.stats()
+    assert stats["ready"] == 1 and stats["leased"] == 0 and stats["dead"] == 1
+
+
+def test_wait_until_drained_does_not_hang_on_abandoned_tasks(broker):
+    broker.put("detail", {}, "detail:1")
+    for _ in range(broker.max_attempts):
+        broker.lease(visibility_timeout=0.05)
+        time.sleep(0.1)
+    stats = wait_until_drained(broker, poll=0.05)
+    assert stats["dead"] == 1 and stats["leased"] == 0
+
+
+class RecordingWorker(QueueWorker):
+    """상세 페이지를 읽는 대신 링크로 레코드를 만드는 작업자 (브라우저/네트워크 없이 대기열 동작만 확인)."""
+
+    async def handle_detail(self, payload, slot):
+        base_info = payload["base_info"]
+        return {**base_info, "keywords": [payload["keyword"]], "worker": self.name}
+
+
+def test_surviving_worker_picks_up_killed_workers_lease(broker, monkeypatch):
+    monkeypatch.setattr(work_queue, "POLL_INTERVAL", 0.05)
+    link = LINK.format(1)
+    broker.put("detail", {"keyword": "IT", "base_info": {"link": link, "title": "t"}}, detail_task_key(link))
+
+    # 작업을 임대한 뒤 ack 없이 죽는 작업자 프로세스
+    code = ("import os, work_queue; "
+            f"broker = work_queue.SQLiteBroker({broker.path!r}); "
+            "assert broker.lease(None, 'doomed', 1.0) is not None; os._exit(1)")
+    assert subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode == 1
+    assert broker.stats()["leased"] == 1
+
+    # 대기열이 비어 보이는 시간(idle_exit)이 임대 만료보다 훨씬 짧아도, 만료된 임대를 받아 처리해야 함
+    worker = RecordingWorker(broker, "survivor", concurrency=1, visibility_timeout=60, idle_exit=0.2)
+    asyncio.run(asyncio.wait_for(worker.run(), timeout=20))
+
+    stats = broker.stats()
+    assert stats["done"] == 1 and stats["leased"] == 0 and stats["redelivered"] == 1
+    assert broker.results("detail")[0]["worker"] == "survivor"
+
+
+class FakePage:
+    def __init__(self):
+        self.main_frame = object()
+        self.handlers = {}
+        self.closed = False
+        self.crashed = False
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def is_closed(self):
+        return self.closed
+
+    def crash(self):
+        self.crashed = True
+        for handler in self.handlers.get("crash", []):
+            handler(self)
+
+    async def close(self):
+        self.closed = True
+        for handler in self.handlers.get("close", []):
+            handler(self)
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    async def new_context(self, **options):
+        return FakeContext()
+
+
+class TabWorker(QueueWorker):
+    """상세 작업마다 탭을 쓰고, crash_link 작업을 처음 처리할 때 렌더러가 죽는 작업자."""
+
+    crash_link = None
+
+    async def handle_detail(self, payload, slot):
+        page = await slot.page()
+        if page.crashed or page.is_closed():
+            raise RuntimeError("Target crashed")
+        if payload["base_info"]["link"] == self.crash_link:
+            self.crash_link = None
+            page.crash()
+            raise RuntimeError("Target crashed")
+        return {**payload["base_info"], "keywords": [payload["keyword"]], "page": id(page)}
+
+
+def test_worker_replaces_a_crashed_tab_before_the_next_task(broker, monkeypatch):
+    monkeypatch.setattr(work_queue, "POLL_INTERVAL", 0.05)
+    monkeypatch.setattr(work_queue, "RETRY_DELAY", 0.0)
+    monkeypatch.setattr(page_lifecycle, "process_memory", lambda: (None, None, None))
+    for i in range(1, 5):
+        broker.put("detail", {"keyword": "IT", "base_info": {"link": LINK.format(i), "title": "t"}},
+                   detail_task_key(LINK.format(i)))
+    worker = TabWorker(broker, "tabs", concurrency=1, idle_exit=0.2)
+    worker.fetcher = None
+
+    async def run():
+        worker._lifecycle = BrowserLifecycle(FakeBrowser(), history_path=None)
+        await worker._lifecycle.start()
+        worker.crash_link = LINK.format(2)
+        await asyncio.wait_for(worker.run(), timeout=20)
+
+    asyncio.run(run())
+    stats = broker.stats()
+    # 죽은 탭에서 실패한 작업 하나만 다시 시도되고, 이후 작업은 새 탭에서 성공 (dead 없음)
+    assert stats["done"] == 4 and stats["dead"] == 0
+    assert worker.failed == 1
+    assert worker._lifecycle.crashes == 1 and worker._lifecycle.pages_recycled == 1
+
+
+def test_export_merges_keywords_across_listings(broker, tmp_path):
+    first, second = LINK.format(1), LINK.format(2)
+    for keyword, links in (("IT", [first, second]), ("모빌리티", [second])):
+        broker.put("listing", {"keyword": keyword}, f"listing:{keyword}:1")
+        task = broker.lease(kinds=["listing"])
+        broker.ack(task["id"], task["token"], {"keyword": keyword, "links": links})
+    for link in (first, second):
+        broker.put("detail", {}, detail_task_key(link))
+        task = broker.lease(kinds=["detail"])
+        broker.ack(task["id"], task["token"], {"link": link, "title": link[-1], "keywords": ["IT"]})
+
+    output = tmp_path / "out.jsonl"
+    assert export_results(broker, str(output)) == 2
+    records = {row["link"]: row for row in map(json.loads, output.read_text(encoding="utf-8").splitlines())}
+    assert records[first]["keywords"] == ["IT"]
+    assert records[second]["keywords"] == ["IT", "모빌리티"]
@@ -0,0 +1,111 @@
+import re
+import emoji
+import pandas as pd
+
+# --- 이모지 제거 ---
+# emoji.replace_emoji는 문자열 전체를 토큰 단위로 다시 훑기 때문에 느립니다.
+# 모든 이모지 시퀀스는 아래 '트리거' 문자 중 하나를 반드시 포함하므로,
+# 트리거가 하나도 없는 텍스트(대부분의 공고)는 집합 비교 한 번으로 그대로 통과시킵니다.
+# (키캡 이모지처럼 ASCII로 시작하는 시퀀스는 첫 번째 비ASCII 문자를 트리거로 사용)
+_EMOJI_TRIGGERS = frozenset(
+    next(ch for ch in seq if ord(ch) > 0x7F)
+    for seq in emoji.EMOJI_DATA
+    if any(ord(ch) > 0x7F for ch in seq)
+)
+
+
+def strip_emoji(text):
+    """emoji.replace_emoji(text, replace='')와 결과가 같고, 이모지가 없으면 다시 훑지 않습니다."""
+    if _EMOJI_TRIGGERS.isdisjoint(text):
+        return text
+    return emoji.replace_emoji(text, replace='')
+
+
+# --- 공통 패턴 (미리 컴파일) ---
+_HANGUL_LATIN_BOUNDARY = re.compile(r'(?<=[가-힣])(?=[A-Za-z])|(?<=[A-Za-z])(?=[가-힣])')
+_HANGUL_ALNUM_BOUNDARY = re.compile(r'(?<=[가-힣])(?=[A-Za-z0-9])|(?<=[A-Za-z0-9])(?=[가-힣])')
+_MULTI_NEWLINE = re.compile(r'\n{3,}')
+
+# --- 'basic' 계열 (preprocessed.py / scraper_perpocessed.py) ---
+BASIC_KEYWORDS = ["자격요건", "주요업무", "우대사항", "복리후생", "근무조건", "모집부문", "전형절차"]
+_BASIC_BULLET = re.compile(r'\s*[•\-\·]\s*')
+_BASIC_MULTI_SPACE = re.compile(r'\s{2,}')
+_BASIC_SYMBOLS = str.maketrans({'|': ' ', '※': ' '})
+_BASIC_PUNCT = re.compile(r'\.{2,}|,,|\?{2,}')
+_BASIC_PUNCT_REPLACEMENT = {'.': '…', ',': ',', '?': '?'}
+# 키워드끼리 겹치지 않으므로 키워드별로 한 번씩 돌리던 치환과 결과가 같습니다.
+_BASIC_SECTION = re.compile(r'\s*(' + '|'.join(BASIC_KEYWORDS) + r')')
+
+
+def _normalize_basic(text):
+    # 1. 모든 이모지 제거
+    text = strip_emoji(text)
+    # 2. 글머리 기호 줄바꿈
+    text = _BASIC_BULLET.sub('\n- ', text)
+    # 3. 연속 공백 제거
+    text = _BASIC_MULTI_SPACE.sub(' ', text)
+    # 4. 특수문자 정리
+    text = text.translate(_BASIC_SYMBOLS)
+    # 5. 문장부호 정리 (... -> …, ,, -> ,, ?? -> ?)
+    text = _BASIC_PUNCT.sub(lambda m: _BASIC_PUNCT_REPLACEMENT[m.group()[0]], text)
+    # 6. 주요 키워드 구분선
+    text = _BASIC_SECTION.sub(r'\n\n=== \1 ===', text)
+    # 7. 한글-영어 띄어쓰기
+    text = _HANGUL_LATIN_BOUNDARY.sub(' ', text)
+    # 8. 중복 줄바꿈 제거
+    text = _MULTI_NEWLINE.sub('\n\n', text)
+    return text.strip()
+
+
+# --- 'readable' (saramin_test.py) ---
+READABLE_KEYWORDS = ["자격요건", "주요업무", "우대사항", "복리후생", "기술스택", "개발환경", "근무조건", "모집부문", "전형절차"]
+_READABLE_SYMBOLS = str.maketrans({ch: ' ' for ch in '•◎-·⁃=|※ㆍ●>[]'})
+_READABLE_NEWLINE_SPACES = re.compile(r'\s*\n\s*')
+_READABLE_MULTI_SPACE = re.compile(r'[ \t]{2,}')
+_READABLE_ANY_KEYWORD = re.compile('|'.join(READABLE_KEYWORDS))
+# 이 프로필은 키워드 뒤 공백까지 치환하므로 적용 순서에 따라 결과가 달라집니다.
+# 한 번의 검색으로 등장한 키워드만 고른 뒤, 원래 순서대로 해당 패턴만 적용합니다.
+_READABLE_SECTIONS = [(kw, re.compile(rf'(\s*{kw}\s*)'), f'\n\n{kw} ') for kw in READABLE_KEYWORDS]
+
+
+def _normalize_readable(text):
+    # 1. 이모지 제거
+    text = strip_emoji(text)
+    # 2. 지정된 모든 특수기호(ㆍ, >, [, ] 등)를 공백으로 변환
+    text = text.translate(_READABLE_SYMBOLS)
+    # 3. 한글과 영어/숫자 사이에 일관된 공백 추가
+    text = _HANGUL_ALNUM_BOUNDARY.sub(' ', text)
+    # 4. 줄바꿈 주변의 불필요한 공백 제거
+    text = _READABLE_NEWLINE_SPACES.sub('\n', text)
+    # 5. 두 개 이상의 연속된 공백을 하나로 통일
+    text = _READABLE_MULTI_SPACE.sub(' ', text)
+    # 6. 주요 키워드를 기준으로 문단 구분
+    present = set(_READABLE_ANY_KEYWORD.findall(text))
+    for kw, pattern, replacement in _READABLE_SECTIONS:
+        if kw in present:
+            text = pattern.sub(replacement, text)
+    # 7. 세 개 이상의 연속된 줄바꿈을 두 개로 통일
+    text = _MULTI_NEWLINE.sub('\n\n', text)
+    # 8. 앞뒤 공백 제거
+    return text.strip()
+
+
+# --- 프로필 ---
+# preprocessed: preprocessed.clean_text (결측값은 그대로 반환)
+# scraper: scraper_perpocessed.clean_text (결측값/빈 문자열은 "")
+# readable: saramin_test.clean_text (결측값/빈 문자열은 "")
+PROFILES = {
+    "preprocessed": (_normalize_basic, "passthrough"),
+    "scraper": (_normalize_basic, "empty"),
+    "readable": (_normalize_readable, "empty"),
+}
+
+
+def normalize_text(text, profile="scraper"):
+    """선택한 프로필의 규칙으로 텍스트를 정제합니다. 기존 clean_text들과 결과가 바이트 단위로 같습니다."""
+    normalize, missing = PROFILES[profile]
+    if pd.isna(text):
+        return text if missing == "passthrough" else ""
+    if not text and missing == "empty":
+        return ""
+    return normalize(text)
@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+from playwright.async_api import async_playwright
+from site_adapters import ADAPTERS, NORMALIZED_COLUMNS
+from detail_pool import run_detail_pool, create_detail_semaphore
+from resource_blocker import ResourceBlocker
+from page_lifecycle import BrowserLifecycle
+from output_sinks import open_sink, TeeSink
+from search_index import SearchIndexSink
+from inflight import InflightRegistry
+from rate_limiter import RateLimiter, limited_goto
+from metrics import metrics
+
+# --- 설정 ---
+SITES = ['saramin', 'jobkorea']
+KEYWORDS = ['IT', '자율주행', '모빌리티']
+TARGET_JOB_COUNT = 100        # 사이트·키워드별 수집할 목표 공고 개수
+DETAIL_PAGES_PER_CONTEXT = 4  # 사이트·키워드별 상세 페이지 동시 탭 수
+MAX_CONCURRENT_DETAILS = 12   # 모든 사이트·키워드 합산 동시 상세 처리 한도
+OUTPUT_PATH = "all_postings.csv"  # 확장자로 형식 결정 (.csv / .jsonl / .parquet, 확장자 없는 폴더면 수집일/출처별 Parquet 데이터셋)
+# .parquet 파일 하나는 종료할 때 footer를 써야 완성되므로 도중에 죽으면 모두 읽을 수 없음 → 긴 수집은 .jsonl / .csv 또는 데이터셋 폴더
+METRICS_PATH = "unified_metrics"  # 실행 종료 시 단계별 측정값을 .json / .prom으로 저장
+TRACE_PATH = None  # 공고별 단계 시간 추적 파일 (예: "unified_trace.jsonl")
+SEARCH_INDEX_PATH = "postings_index.sqlite3"  # 기록하는 공고를 전문 검색 색인에도 추가 (None이면 색인 안 함)
+
+
+# --- 사이트 하나 · 키워드 하나 ---
+async def collect_listing(adapter, page, keyword, limiter=None, lifecycle=None):
+    """
+    검색 결과 페이지를 넘기며 목표 개수만큼 공고 기본 정보를 모읍니다. 새 공고가 없는 페이지에서 멈춥니다.
+    (공고 목록, 탭)을 반환하며, lifecycle이 주어지면 페이지마다 탭을 교체할 수 있으므로 반환한 탭을 이어서 씁니다.
+    """
+    base_info_list = []
+    seen = set()
+    page_number = 1
+    while len(base_info_list) < TARGET_JOB_COUNT:
+        print(f"[{adapter.name}/{keyword}] {page_number} 페이지 수집 중... (현재 {len(base_info_list)}개)")
+        listings = await adapter.read_listing(page, adapter.listing_url(keyword, page_number), limiter)
+        if lifecycle is not None:
+            page = await lifecycle.after_item(page)
+        new = 0
+        for listing in listings or []:
+            listing['link'] = adapter.canonicalize(listing['link'])
+            key = adapter.key(listing['link'])
+            if key in seen:
+                continue
+            seen.add(key)
+            base_info_list.append(listing)
+            new += 1
+            if len(base_info_list) >= TARGET_JOB_COUNT:
+                break
+        if not new:
+            print(f"[{adapter.name}/{keyword}] 더 이상 새 공고가 없어 중단")
+            break
+        page_number += 1
+    return base_info_list, page
+
+
+async def crawl_keyword(adapter, lifecycle, keyword, semaphore, registry, limiter, sink):
+    """사이트 하나에서 키워드 하나를 수집해 sink에 기록합니다. 기록한 개수를 반환합니다."""
+    page = await lifecycle.new_page()
+    base_info_list = []
+    try:
+        base_info_list, page = await collect_listing(adapter, page, keyword, limiter, lifecycle)
+    finally:
+        # 같은 공고는 먼저 발견한 키워드 하나만 상세 수집하고, 모든 사이트·키워드의 목록 수집이 끝난 뒤 시작
+        base_info_list = [base_info for base_info in base_info_list
+                          if registry.claim(adapter.key(base_info['link']), keyword)]
+        await registry.listing_done()
+        await page.close()
+
+    print(f"[{adapter.name}/{keyword}] 총 {len(base_info_list)}개 공고 상세 수집 시작 (탭 {DETAIL_PAGES_PER_CONTEXT}개)")
+
+    async def handler(detail_page, i, base_info):
+        with metrics.trace(link=base_info['link'], keyword=keyword, source=adapter.site):
+            try:
+                with metrics.timer(f"{adapter.site}.detail.total"):
+                    await limited_goto(detail_page, base_info['link'], limiter,
+                                       wait_until="domcontentloaded", timeout=30000)
+                    html_content, inner_text = await adapter.read_detail(detail_page)
+            except Exception as e:
+                metrics.fail(f"{adapter.site}.detail.failed")
+                print(f"[{adapter.name}/{keyword}] {i + 1}번째 공고 처리 실패: {base_info['link']} - {e}")
+                return None
+            record = adapter.build_record(base_info, registry.keywords(adapter.key(base_info['link'])),
+                                          html_content, inner_text)
+            print(f"[{adapter.name}/{keyword}] {i + 1}번째 공고 처리 완료: {record['title']}")
+            return record
+
+    return await run_detail_pool(lifecycle.context, base_info_list, handler, num_pages=DETAIL_PAGES_PER_CONTEXT,
+                                 semaphore=semaphore, on_result=sink.write, lifecycle=lifecycle)
+
+
+# --- 통합 스케줄러 ---
+async def crawl(adapters, keywords, sink):
+    """
+    브라우저 하나에서 사이트마다 컨텍스트 하나를 두고, 모든 사이트·키워드 작업을 한 이벤트 루프에서 동시에 실행합니다.
+    - 상세 탭 수는 전역 세마포어로, 요청 속도는 호스트별 속도 제한으로 사이트·키워드가 함께 나누어 씁니다.
+    - 모든 레코드는 통합 스키마(NORMALIZED_COLUMNS)로 같은 sink에 기록됩니다.
+    - 사이트별 컨텍스트는 BrowserLifecycle이 관리해, 탭은 일정 횟수 이동 후, 컨텍스트는 메모리 한도 초과 시 새로 만듭니다.
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        semaphore = create_detail_semaphore(MAX_CONCURRENT_DETAILS)
+        limiter = RateLimiter()
+        registry = InflightRegistry(parties=len(adapters) * len(keywords))
+        blockers = []
+        lifecycles = []
+        tasks = []
+        for adapter in adapters:
+            blocker = ResourceBlocker(adapter.crawl_mode)
+            lifecycle = BrowserLifecycle(browser, setup=blocker.attach,
+                                         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
+            await lifecycle.start()
+            blockers.append(blocker)
+            lifecycles.append(lifecycle)
+            for keyword in keywords:
+                tasks.append(crawl_keyword(adapter, lifecycle, keyword, semaphore, registry, limiter, sink))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            sink.close()
+
+        for lifecycle in lifecycles:
+            await lifecycle.close()
+        await browser.close()
+        for blocker in blockers:
+            blocker.print_summary()
+        for lifecycle in lifecycles:
+            lifecycle.print_summary()
+        for adapter in adapters:
+            adapter.print_summary()
+        registry.print_summary()
+        limiter.print_summary()
+        metrics.print_summary()
+
+
+async def main(args):
+    adapters = [ADAPTERS[site]() for site in args.sites]
+    sink = open_sink(args.output, NORMALIZED_COLUMNS, overwrite=args.overwrite)
+    if SEARCH_INDEX_PATH:
+        sink = TeeSink(sink, SearchIndexSink(SEARCH_INDEX_PATH))
+    metrics.enable_trace(TRACE_PATH)
+    await crawl(adapters, args.keywords, sink)
+    metrics.count("postings.written", sink.count)
+    metrics.export(METRICS_PATH)
+
+    if sink.count:
+        print(f"\n통합 수집 완료! '{args.output}' 파일에 총 {sink.count}개 공고 저장됨.")
+    else:
+        print("\n수집된 채용 공고 없음.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사람인/잡코리아를 하나의 스케줄러와 브라우저로 동시에 수집")
+    parser.add_argument("--sites", nargs="+", choices=sorted(ADAPTERS), default=SITES)
+    parser.add_argument("--keywords", nargs="+", default=KEYWORDS)
+    parser.add_argument("--output", default=OUTPUT_PATH,
+                        help="결과 파일 (.csv / .jsonl / .parquet) 또는 Parquet 데이터셋 폴더 "
+                             "(.parquet 파일 하나는 도중에 죽으면 읽을 수 없으므로 긴 수집에는 쓰지 않음)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Parquet 데이터셋 폴더의 오늘·수집 사이트 파티션을 지우고 다시 씀 (기본: 기존 파일 옆에 추가)")
+    asyncio.run(main(parser.parse_args()))
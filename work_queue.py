@@ -0,0 +1,631 @@
+import argparse
+import asyncio
+import json
+import socket
+import socketserver
+import sqlite3
+import threading
+import time
+import uuid
+from playwright.async_api import async_playwright
+import scraper_perpocessed as scraper
+from http_fetch import FastFetcher
+from posting_store import canonicalize_link, extract_rec_idx, SQLITE_TIMEOUT
+from output_sinks import open_sink
+from inflight import InflightRegistry
+from resource_blocker import ResourceBlocker
+from rate_limiter import RateLimiter
+from page_lifecycle import BrowserLifecycle
+from metrics import metrics
+
+# --- 설정 ---
+BROKER_URL = "sqlite:work_queue.sqlite3"  # "sqlite:경로" 또는 "tcp://호스트:포트" (코디네이터의 --serve 주소)
+DEFAULT_PORT = 8765
+VISIBILITY_TIMEOUT = 120.0  # 임대(lease)한 작업을 이 시간 안에 ack하지 않으면 다른 작업자에게 다시 배달
+MAX_ATTEMPTS = 5            # 이만큼 배달해도 끝나지 않은 작업은 dead로 표시하고 더 배달하지 않음
+RETRY_DELAY = 5.0           # nack한 작업의 재배달 대기 (시도마다 2배)
+POLL_INTERVAL = 1.0         # 받을 작업이 없을 때 다시 확인하는 간격
+IDLE_EXIT_SECONDS = 30.0    # 작업자는 대기 중·처리 중인 작업이 하나도 없는 상태가 이 시간 동안 이어지면 종료
+WORKER_CONCURRENCY = 4      # 작업자 프로세스 하나가 동시에 처리하는 작업 수 (작업마다 탭 하나)
+OUTPUT_PATH = "saramin_queue.csv"  # 코디네이터가 완료된 상세 결과를 모아 기록 (확장자로 형식 결정)
+
+
+# --- 브로커 ---
+class Broker:
+    """
+    코디네이터와 작업자가 공유하는 작업 대기열의 인터페이스입니다.
+    - put(kind, payload, key): 작업 추가. 같은 key의 작업이 이미 있으면 추가하지 않고 False.
+    - lease(kinds, worker, visibility_timeout): 배달 가능한 작업 하나를 임대합니다. 없으면 None.
+      visibility_timeout 안에 ack/nack하지 않으면 임대가 풀려 다른 작업자에게 다시 배달됩니다.
+    - ack(task_id, token, result) / nack(task_id, token, delay, error): 임대 토큰이 맞을 때만 반영 (만료된 임대는 False).
+    - reclaim(): 임대가 만료된 작업을 다시 ready로 돌리고, 시도 횟수를 다 쓴 작업은 dead로 표시합니다.
+    - stats(): 상태별 작업 수, results(kind): 완료된 작업의 결과 목록.
+    작업은 {"id", "kind", "payload", "token", "attempts"} 사전입니다.
+    """
+
+    def put(self, kind, payload, key=None):
+        raise NotImplementedError
+
+    def lease(self, kinds=None, worker=None, visibility_timeout=VISIBILITY_TIMEOUT):
+        raise NotImplementedError
+
+    def ack(self, task_id, token, result=None):
+        raise NotImplementedError
+
+    def nack(self, task_id, token, delay=RETRY_DELAY, error=None):
+        raise NotImplementedError
+
+    def reclaim(self):
+        raise NotImplementedError
+
+    def stats(self):
+        raise NotImplementedError
+
+    def results(self, kind=None):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SQLiteBroker(Broker):
+    """
+    SQLite 파일 하나로 구현한 브로커입니다. 같은 컴퓨터의 여러 프로세스가 파일을 함께 쓰거나,
+    BrokerServer로 열어 다른 컴퓨터의 작업자가 SocketBroker로 접속합니다.
+    - 임대는 BEGIN IMMEDIATE 트랜잭션 안에서 고르고 표시하므로 두 작업자가 같은 작업을 받지 않습니다.
+    - 임대가 만료된 작업(leased인데 visible_at이 지난 작업)은 ready와 똑같이 다시 배달됩니다.
+    """
+
+    def __init__(self, path="work_queue.sqlite3", max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=SQLITE_TIMEOUT, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                key TEXT UNIQUE,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'ready',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                visible_at REAL NOT NULL,
+                token TEXT,
+                worker TEXT,
+                error TEXT,
+                result TEXT,
+                updated REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS tasks_ready ON tasks (status, visible_at)")
+
+    def _transaction(self, func):
+        # 쓰기 잠금을 먼저 잡아, 읽고 나서 고치는 사이에 다른 프로세스가 끼어들지 못하게 함
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = func()
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            return result
+
+    def clear(self):
+        """모든 작업을 지웁니다 (코디네이터가 새로 시작할 때)."""
+        self._transaction(lambda: self.conn.execute("DELETE FROM tasks"))
+
+    def put(self, kind, payload, key=None):
+        now = time.time()
+
+        def insert():
+            return self.conn.execute(
+                "INSERT OR IGNORE INTO tasks (kind, key, payload, visible_at, updated) VALUES (?, ?, ?, ?, ?)",
+                (kind, key, json.dumps(payload, ensure_ascii=False), now, now)).rowcount > 0
+        return self._transaction(insert)
+
+    def lease(self, kinds=None, worker=None, visibility_timeout=VISIBILITY_TIMEOUT):
+        def pick():
+            now = time.time()
+            while True:
+                query = "SELECT id, kind, payload, attempts FROM tasks WHERE status IN ('ready', 'leased') AND visible_at <= ?"
+                params = [now]
+                if kinds:
+                    query += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+                    params += list(kinds)
+                row = self.conn.execute(query + " ORDER BY id LIMIT 1", params).fetchone()
+                if row is None:
+                    return None
+                task_id, kind, payload, attempts = row
+                if attempts >= self.max_attempts:
+                    self.conn.execute("UPDATE tasks SET status = 'dead', token = NULL, updated = ? WHERE id = ?",
+                                      (now, task_id))
+                    continue
+                token = uuid.uuid4().hex
+                self.conn.execute("""
+                    UPDATE tasks SET status = 'leased', attempts = attempts + 1, visible_at = ?, token = ?, worker = ?,
+                                     updated = ?
+                    WHERE id = ?
+                """, (now + visibility_timeout, token, worker, now, task_id))
+                return {"id": task_id, "kind": kind, "payload": json.loads(payload), "token": token,
+                        "attempts": attempts + 1}
+        return self._transaction(pick)
+
+    def ack(self, task_id, token, result=None):
+        def finish():
+            return self.conn.execute(
+                "UPDATE tasks SET status = 'done', token = NULL, result = ?, updated = ? WHERE id = ? AND token = ?",
+                (None if result is None else json.dumps(result, ensure_ascii=False), time.time(), task_id, token)
+            ).rowcount > 0
+        return self._transaction(finish)
+
+    def nack(self, task_id, token, delay=RETRY_DELAY, error=None):
+        def release():
+            now = time.time()
+            return self.conn.execute(
+                "UPDATE tasks SET status = 'ready', token = NULL, visible_at = ?, error = ?, updated = ? "
+                "WHERE id = ? AND token = ?", (now + delay, error, now, task_id, token)).rowcount > 0
+        return self._transaction(release)
+
+    def reclaim(self):
+        def sweep():
+            now = time.time()
+            dead = self.conn.execute(
+                "UPDATE tasks SET status = 'dead', token = NULL, updated = ? "
+                "WHERE attempts >= ? AND (status = 'ready' OR (status = 'leased' AND visible_at <= ?))",
+                (now, self.max_attempts, now)).rowcount
+            expired = self.conn.execute(
+                "UPDATE tasks SET status = 'ready', token = NULL, updated = ? WHERE status = 'leased' AND visible_at <= ?",
+                (now, now)).rowcount
+            return {"expired": expired, "dead": dead}
+        return self._transaction(sweep)
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self.conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+            expired, redelivered = self.conn.execute(
+                "SELECT COALESCE(SUM(status = 'leased' AND visible_at <= ?), 0), "
+                "COALESCE(SUM(MAX(attempts - 1, 0)), 0) FROM tasks", (time.time(),)).fetchone()
+        stats = {status: counts.get(status, 0) for status in ("ready", "leased", "done", "dead")}
+        stats["expired"] = expired
+        stats["redelivered"] = redelivered
+        return stats
+
+    def results(self, kind=None):
+        with self._lock:
+            query = "SELECT result FROM tasks WHERE status = 'done' AND result IS NOT NULL"
+            params = []
+            if kind:
+                query += " AND kind = ?"
+                params.append(kind)
+            rows = self.conn.execute(query + " ORDER BY id", params).fetchall()
+        return [json.loads(result) for (result,) in rows]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+# --- 로컬 소켓 브로커 (다른 프로세스/컴퓨터의 작업자용) ---
+BROKER_OPS = {"put", "lease", "ack", "nack", "reclaim", "stats", "results"}
+
+
+class _BrokerRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # 한 줄에 요청 하나: {"op": "lease", "args": [...]} → {"ok": true, "result": ...}
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request.get("op") not in BROKER_OPS:
+                    raise ValueError(f"지원하지 않는 요청입니다: {request.get('op')}")
+                response = {"ok": True, "result": getattr(self.server.broker, request["op"])(*request.get("args", []))}
+            except Exception as e:
+                response = {"ok": False, "error": repr(e)}
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class BrokerServer(socketserver.ThreadingTCPServer):
+    """브로커 하나를 TCP 소켓(JSON Lines)으로 열어 다른 프로세스/컴퓨터의 작업자가 SocketBroker로 쓰게 합니다."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, broker, host="127.0.0.1", port=DEFAULT_PORT):
+        super().__init__((host, port), _BrokerRequestHandler)
+        self.broker = broker
+        self._thread = None
+
+    @property
+    def address(self):
+        host, port = self.server_address[:2]
+        return f"tcp://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"[INFO] 브로커 서버 시작: {self.address}")
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class SocketBroker(Broker):
+    """BrokerServer에 접속하는 브로커 클라이언트. 호출마다 요청 한 줄을 보내고 응답 한 줄을 받습니다."""
+
+    def __init__(self, host, port=DEFAULT_PORT, timeout=30.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock = None
+        self._file = None
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._file = self._sock.makefile("rwb")
+
+    def _call(self, op, *args):
+        with self._lock:
+            if self._sock is None:
+                self._connect()
+            try:
+                self._file.write((json.dumps({"op": op, "args": args}, ensure_ascii=False) + "\n").encode("utf-8"))
+                self._file.flush()
+                line = self._file.readline()
+                if not line:
+                    raise ConnectionError("브로커 서버와 연결이 끊어졌습니다.")
+            except OSError:
+                self._close_locked()
+                raise
+        response = json.loads(line)
+        if not response["ok"]:
+            raise RuntimeError(f"브로커 오류: {response['error']}")
+        return response["result"]
+
+    def put(self, kind, payload, key=None):
+        return self._call("put", kind, payload, key)
+
+    def lease(self, kinds=None, worker=None, visibility_timeout=VISIBILITY_TIMEOUT):
+        return self._call("lease", kinds, worker, visibility_timeout)
+
+    def ack(self, task_id, token, result=None):
+        return self._call("ack", task_id, token, result)
+
+    def nack(self, task_id, token, delay=RETRY_DELAY, error=None):
+        return self._call("nack", task_id, token, delay, error)
+
+    def reclaim(self):
+        return self._call("reclaim")
+
+    def stats(self):
+        return self._call("stats")
+
+    def results(self, kind=None):
+        return self._call("results", kind)
+
+    def _close_locked(self):
+        if self._sock is not None:
+            self._file.close()
+            self._sock.close()
+        self._sock = self._file = None
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
+
+
+def open_broker(url=BROKER_URL):
+    """"sqlite:경로" → SQLiteBroker, "tcp://호스트:포트" → SocketBroker."""
+    if url.startswith("sqlite:"):
+        return SQLiteBroker(url[len("sqlite:"):])
+    if url.startswith("tcp://"):
+        host, _, port = url[len("tcp://"):].rpartition(":")
+        return SocketBroker(host, int(port))
+    raise ValueError(f"지원하지 않는 브로커 주소입니다: {url}")
+
+
+# --- 작업 정의 ---
+def listing_task_key(keyword, page_number):
+    return f"listing:{keyword}:{page_number}"
+
+
+def detail_task_key(link):
+    return f"detail:{extract_rec_idx(link) or link}"
+
+
+def enqueue_keywords(broker, keywords, target=None):
+    """키워드마다 첫 번째 검색 결과 페이지를 대기열에 넣습니다. 다음 페이지는 작업자가 이어서 넣습니다."""
+    target = target or scraper.TARGET_JOB_COUNT
+    for keyword in keywords:
+        broker.put("listing", {"keyword": keyword, "page": 1, "collected": 0, "target": target},
+                   listing_task_key(keyword, 1))
+
+
+class QueueWorker:
+    """
+    브로커에서 작업을 임대해 처리하는 작업자입니다.
+    - listing: 검색 결과 페이지 하나를 읽어 공고마다 detail 작업을 넣고, 목표 개수에 못 미치면 다음 페이지 작업을 넣습니다.
+      작업 key가 같으면 다시 넣지 않으므로 재배달되거나 여러 키워드에서 발견되어도 상세 수집은 한 번입니다.
+      발견한 링크는 결과로 ack해, export_results가 공고마다 발견된 키워드를 모두 합칩니다.
+    - detail: HTTP 고속 경로로 먼저 읽고, 실패하면 Playwright로 읽어 레코드를 만든 뒤 결과와 함께 ack합니다.
+    - 브라우저는 HTTP로 읽을 수 없는 페이지가 처음 나올 때 띄웁니다 (HTTP만으로 끝나는 작업자는 브라우저 없이 동작).
+      탭은 BrowserLifecycle로 만들어, 작업을 마칠 때마다 죽었거나 닫힌 탭, 오래 쓴 탭을 다음 작업 전에 새로 만듭니다.
+    - 처리 중 예외가 나면 nack해 잠시 뒤 다시 배달되게 하고, 작업자가 죽으면 임대 만료 후 다른 작업자가 받습니다.
+    - 받을 작업이 없어도 다른 작업자가 임대 중인 작업이 남아 있으면 (그 작업자가 죽었을 때 다시 받도록) 종료하지 않습니다.
+    """
+
+    def __init__(self, broker, name=None, concurrency=WORKER_CONCURRENCY, visibility_timeout=VISIBILITY_TIMEOUT,
+                 idle_exit=IDLE_EXIT_SECONDS):
+        self.broker = broker
+        self.name = name or f"{socket.gethostname()}-{uuid.uuid4().hex[:6]}"
+        self.concurrency = concurrency
+        self.visibility_timeout = visibility_timeout
+        self.idle_exit = idle_exit
+        self.limiter = RateLimiter()
+        self.fetcher = FastFetcher(limiter=self.limiter) if scraper.USE_HTTP_FAST_PATH else None
+        self._playwright = None
+        self._browser = None
+        self._lifecycle = None
+        self._browser_lock = asyncio.Lock()
+        self._blocker = None
+        self.handled = {}
+        self.failed = 0
+        self.stale_acks = 0
+
+    async def _new_page(self):
+        async with self._browser_lock:
+            if self._lifecycle is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                self._blocker = ResourceBlocker(scraper.CRAWL_MODE)
+                lifecycle = BrowserLifecycle(self._browser, setup=self._blocker.attach,
+                                             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
+                await lifecycle.start()
+                self._lifecycle = lifecycle
+        return await self._lifecycle.new_page()
+
+    async def handle_listing(self, payload, slot):
+        keyword, page_number = payload["keyword"], payload["page"]
+        page_url = scraper.listing_url(keyword, page_number)
+        listings = None
+        if self.fetcher:
+            with metrics.timer("listing.http"):
+                listings = await self.fetcher.fetch_listing(page_url)
+        if listings is None:
+            listings = await scraper.read_listing_page(await slot.page(), page_url, None, self.limiter)
+        listings = (listings or [])[:payload["target"] - payload["collected"]]
+        added = 0
+        for listing in listings:
+            listing['link'] = canonicalize_link(listing['link'])
+            added += await asyncio.to_thread(self.broker.put, "detail", {"keyword": keyword, "base_info": listing},
+                                             detail_task_key(listing['link']))
+        collected = payload["collected"] + len(listings)
+        if listings and collected < payload["target"]:
+            await asyncio.to_thread(self.broker.put, "listing", {**payload, "page": page_number + 1, "collected": collected},
+                                    listing_task_key(keyword, page_number + 1))
+        print(f"[{keyword}] {page_number} 페이지: 공고 {len(listings)}개 (새 상세 작업 {added}개, 누적 {collected}개)")
+        # 다른 키워드가 먼저 넣은 공고도 있으므로, 이 페이지에서 발견한 링크를 결과로 남겨 기록할 때 키워드를 합침
+        return {"keyword": keyword, "links": [listing['link'] for listing in listings]}
+
+    async def handle_detail(self, payload, slot):
+        base_info, keyword = payload["base_info"], payload["keyword"]
+        detail = None
+        if self.fetcher:
+            with metrics.timer("detail.http"):
+                detail = await self.fetcher.fetch_detail(base_info['link'])
+        if detail is None:
+            detail = await scraper.read_detail_page(await slot.page(), base_info['link'], self.limiter)
+        record = scraper.build_record(base_info, keyword, *detail)
+        print(f"[{keyword}] 공고 처리 완료: {record['title']}")
+        return record
+
+    async def _process(self, task, slot):
+        handler = {"listing": self.handle_listing, "detail": self.handle_detail}[task["kind"]]
+        try:
+            with metrics.timer(f"queue.{task['kind']}"):
+                result = await handler(task["payload"], slot)
+        except Exception as e:
+            self.failed += 1
+            metrics.fail(f"queue.{task['kind']}.failed")
+            print(f"[WARN] 작업 {task['id']}({task['kind']}) 실패, {task['attempts']}번째 시도: {e!r}")
+            await asyncio.to_thread(self.broker.nack, task["id"], task["token"],
+                                    RETRY_DELAY * 2 ** (task["attempts"] - 1), repr(e))
+            return
+        if not await asyncio.to_thread(self.broker.ack, task["id"], task["token"], result):
+            # 임대가 만료되어 다른 작업자에게 넘어간 작업 (결과는 그 작업자가 기록)
+            self.stale_acks += 1
+            print(f"[WARN] 작업 {task['id']}의 임대가 만료되어 결과를 버립니다.")
+            return
+        self.handled[task["kind"]] = self.handled.get(task["kind"], 0) + 1
+
+    async def _loop(self, index):
+        slot = _PageSlot(self)
+        idle_since = None
+        try:
+            while True:
+                task = await asyncio.to_thread(self.broker.lease, None, f"{self.name}/{index}", self.visibility_timeout)
+                if task is None:
+                    stats = await asyncio.to_thread(self.broker.stats)
+                    if stats["ready"] or stats["leased"]:
+                        # 아직 배달 대기 중이거나 다른 작업자가 임대 중 → 임대가 만료되면 받을 수 있으므로 계속 확인
+                        idle_since = None
+                    else:
+                        idle_since = idle_since or time.monotonic()
+                        if time.monotonic() - idle_since >= self.idle_exit:
+                            return
+                    await asyncio.sleep(POLL_INTERVAL)
+                    continue
+                idle_since = None
+                metrics.count(f"queue.leased.{task['kind']}")
+                await self._process(task, slot)
+                await slot.after_task()
+        finally:
+            await slot.close()
+
+    async def run(self):
+        print(f"[INFO] 작업자 '{self.name}' 시작 (동시 작업 {self.concurrency}개)")
+        try:
+            await asyncio.gather(*(self._loop(i) for i in range(self.concurrency)))
+        finally:
+            if self.fetcher:
+                await self.fetcher.aclose()
+            if self._lifecycle is not None:
+                await self._lifecycle.close()
+            if self._playwright is not None:
+                await self._browser.close()
+                await self._playwright.stop()
+        self.print_summary()
+
+    def print_summary(self):
+        handled = ", ".join(f"{kind} {count}건" for kind, count in sorted(self.handled.items())) or "없음"
+        print(f"[INFO] 작업자 '{self.name}': 처리 {handled}, 실패(nack) {self.failed}건, 만료된 임대 {self.stale_acks}건")
+        self.limiter.print_summary()
+        if self.fetcher:
+            self.fetcher.print_summary()
+        if self._blocker is not None:
+            self._blocker.print_summary()
+        if self._lifecycle is not None:
+            self._lifecycle.print_summary()
+
+
+class _PageSlot:
+    """작업 루프 하나가 쓰는 탭. 처음 필요할 때 만들고, 작업마다 after_task()로 교체 여부를 확인합니다."""
+
+    def __init__(self, worker):
+        self.worker = worker
+        self._page = None
+
+    async def page(self):
+        if self._page is None:
+            self._page = await self.worker._new_page()
+        return self._page
+
+    async def after_task(self):
+        """
+        작업을 마칠 때마다(실패 포함) 호출합니다. 렌더러가 죽었거나 닫힌 탭은 다음 작업을 임대하기 전에 바꾸므로,
+        죽은 탭 하나 때문에 이후 작업이 모두 실패해 시도 횟수를 다 쓰지 않습니다.
+        """
+        if self._page is None:
+            return
+        try:
+            self._page = await self.worker._lifecycle.after_item(self._page)
+        except Exception as e:
+            # 새 탭을 열지 못하면 다음에 탭이 필요할 때 다시 만듦
+            print(f"[WARN] 작업자 탭 교체 실패: {e!r}")
+            self._page = None
+
+    async def close(self):
+        if self._page is not None and not self._page.is_closed():
+            await self._page.close()
+
+
+# --- 코디네이터 ---
+def print_stats(stats):
+    print(f"[INFO] 대기열: 대기 {stats['ready']}건, 처리 중 {stats['leased']}건 (만료 {stats['expired']}건), "
+          f"완료 {stats['done']}건, 포기(dead) {stats['dead']}건, 재배달 {stats['redelivered']}건")
+
+
+def wait_until_drained(broker, poll=POLL_INTERVAL * 5):
+    """
+    대기 중이거나 처리 중인 작업이 없어질 때까지 진행 상황을 출력하며 기다립니다.
+    확인할 때마다 reclaim()으로 만료된 임대를 되돌리고 시도 횟수를 다 쓴 작업을 dead로 표시하므로,
+    작업자가 죽어 임대가 만료된 작업도 처리 중으로 남지 않습니다.
+    """
+    last = None
+    while True:
+        reclaimed = broker.reclaim()
+        if reclaimed["expired"] or reclaimed["dead"]:
+            print(f"[WARN] 임대가 만료된 작업 {reclaimed['expired']}건을 다시 배달하고, "
+                  f"시도 횟수를 다 쓴 작업 {reclaimed['dead']}건을 포기(dead)로 표시했습니다.")
+        stats = broker.stats()
+        if stats != last:
+            print_stats(stats)
+            last = stats
+        if not stats["ready"] and not stats["leased"]:
+            return stats
+        time.sleep(poll)
+
+
+def export_results(broker, output_path, columns=scraper.OUTPUT_COLUMNS):
+    """
+    완료된 상세 작업의 결과 레코드를 출력 파일 하나에 기록합니다.
+    레코드의 keywords는 그 공고를 발견한 모든 목록 페이지의 키워드를 발견 순서대로 합친 것입니다 (프로세스 내 수집과 같음).
+    """
+    registry = InflightRegistry()
+    for listing in broker.results("listing"):
+        for link in listing["links"]:
+            registry.claim(link, listing["keyword"])
+    with open_sink(output_path, columns) as sink:
+        for record in broker.results("detail"):
+            record['keywords'] = registry.keywords(record['link']) or record['keywords']
+            sink.write(record)
+    print(f"[INFO] '{output_path}'에 {sink.count}개 공고 기록")
+    return sink.count
+
+
+def run_coordinator(args):
+    broker = SQLiteBroker(args.broker[len("sqlite:"):]) if args.broker.startswith("sqlite:") else None
+    if broker is None:
+        raise ValueError("코디네이터는 sqlite: 브로커를 직접 엽니다 (원격 작업자에게는 --serve로 공개).")
+    if not args.resume:
+        broker.clear()
+    enqueue_keywords(broker, args.keywords, args.target)
+    server = None
+    if args.serve:
+        host, _, port = args.serve.rpartition(":")
+        server = BrokerServer(broker, host or "0.0.0.0", int(port)).start()
+    try:
+        stats = wait_until_drained(broker)
+    finally:
+        if server is not None:
+            server.stop()
+    export_results(broker, args.output)
+    if stats["dead"]:
+        print(f"[WARN] {MAX_ATTEMPTS}번 시도해도 실패한 작업 {stats['dead']}건은 결과에서 빠졌습니다.")
+    broker.close()
+
+
+def run_worker(args):
+    broker = open_broker(args.broker)
+    worker = QueueWorker(broker, args.name, args.concurrency, idle_exit=args.idle_exit)
+    try:
+        asyncio.run(worker.run())
+    finally:
+        broker.close()
+    metrics.print_summary()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="작업 대기열 방식 분산 수집 (코디네이터 하나 + 여러 작업자 프로세스/컴퓨터)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = commands.add_parser("coordinator", help="키워드를 대기열에 넣고 모든 작업이 끝나면 결과를 기록")
+    coordinator.add_argument("--broker", default=BROKER_URL, help="sqlite:경로")
+    coordinator.add_argument("--keywords", nargs="+", default=scraper.KEYWORDS)
+    coordinator.add_argument("--target", type=int, default=scraper.TARGET_JOB_COUNT, help="키워드별 목표 공고 수")
+    coordinator.add_argument("--output", default=OUTPUT_PATH)
+    coordinator.add_argument("--serve", default=None, metavar="HOST:PORT",
+                             help=f"다른 컴퓨터의 작업자가 접속할 브로커 서버 주소 (예: 0.0.0.0:{DEFAULT_PORT})")
+    coordinator.add_argument("--resume", action="store_true", help="이전 대기열을 지우지 않고 이어서 진행")
+
+    worker = commands.add_parser("worker", help="대기열에서 작업을 받아 처리")
+    worker.add_argument("--broker", default=BROKER_URL, help="sqlite:경로 또는 tcp://호스트:포트")
+    worker.add_argument("--name", default=None, help="작업자 이름 (기본: 호스트 이름 + 임의 문자열)")
+    worker.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY)
+    worker.add_argument("--idle-exit", type=float, default=IDLE_EXIT_SECONDS, help="대기열이 비어 있으면 종료할 때까지의 시간(초)")
+
+    stats = commands.add_parser("stats", help="대기열 상태 출력")
+    stats.add_argument("--broker", default=BROKER_URL)
+
+    args = parser.parse_args()
+    if args.command == "coordinator":
+        run_coordinator(args)
+    elif args.command == "worker":
+        run_worker(args)
+    else:
+        broker = open_broker(args.broker)
+        print_stats(broker.stats())
+        broker.close()